@@ -1,6 +1,6 @@
 import math
-import matplotlib.pyplot as plt
-from .Generaldistribution import Distribution
+import numpy as np
+from .Generaldistribution import Distribution, _Parameter, _is_array
 from .Binomialdistribution import Binomial
 
 
@@ -15,6 +15,10 @@ class Bernoulli(Distribution):
         p (float) representing the probability of an event occurring (1).
     """
 
+    __slots__ = ('_p',)
+
+    p = _Parameter('p')
+
     def __init__(self, prob=0.5):
 
         self.p = prob
@@ -60,7 +64,22 @@ class Bernoulli(Distribution):
             float: the p value
         """
 
-        self.p = 1.0 * sum(self.data) / len(self.data)
+        return self.replace_stats_with_summary(self.summarize())
+
+    def replace_stats_with_summary(self, summary):
+        """ Method to calculate p from the sufficient statistics of a data
+        set, as returned by summarize.
+
+        Args:
+            summary (RunningStats): statistics of the data set
+
+        Returns:
+            float: the p value
+        """
+
+        if not summary.count:
+            raise ValueError('No data found in summary')
+        self.p = summary.mean
         self.calculate_mean()
         self.calculate_stdev()
 
@@ -76,6 +95,7 @@ class Bernoulli(Distribution):
         Returns:
             None
         """
+        import matplotlib.pyplot as plt
 
         plt.bar(x=['0', '1'], height=[(1 - self.p), self.p])
         plt.title('Bar Chart of Data')
@@ -86,40 +106,117 @@ class Bernoulli(Distribution):
         """ Method to calculate pdf for the bernoulli distribution.
 
         Args:
-            k (float): point for calculating the probability density function. Range of k: {0,1}
+            k (float or array-like): point(s) for calculating the probability density function. Range of k: {0,1}
             round_to (int): Round the mean value. [Default value: 2 floating point]
 
         Returns:
-            float: probability density function output
+            float or numpy.ndarray: probability density function output
         """
+        if _is_array(k):
+            self.pdf = self._pdf(np.asarray(k, dtype=np.float64))
+            return np.round(self.pdf, round_to)
         try:
             if k != 0 and k != 1:
                 raise ValueError
         except ValueError:
             print("Expected k for Bernoulli Distribution: 0, 1")
+            self.pdf = 0.0
+            return self.pdf
 
         self.pdf = (self.p ** k) * (1 - self.p) ** (1 - k)
         return round(self.pdf, round_to)
 
+    def _pdf(self, k):
+        """ Vectorized probability density function, without rounding.
+
+        Args:
+            k (numpy.ndarray): points for calculating the probability density function
+
+        Returns:
+            numpy.ndarray: probability density function output, 0 where k
+            is neither 0 nor 1
+        """
+
+        return np.where((k == 0) | (k == 1), np.power(self.p, k) * np.power(1 - self.p, 1 - k), 0.0)
+
     def calculate_cdf(self, k, round_to=2):
         """ Method to calculate cdf for the bernoulli distribution.
 
         Args:
-            k (float): point for calculating the cumulative distribution function
+            k (float or array-like): point(s) for calculating the cumulative distribution function
             round_to (int): Round the mean value. [Default value: 2 floating point]
 
         Returns:
-            float: cumulative distribution function output
+            float or numpy.ndarray: cumulative distribution function output
         """
+        if _is_array(k):
+            self.cdf = self._cdf(np.asarray(k, dtype=np.float64))
+            return np.round(self.cdf, round_to)
 
         val = 0                 # default value of cdf for k < 0
         if 0 <= k < 1:
             val = 1 - self.p
-        elif k > 1:
+        elif k >= 1:
             val = 1
         self.cdf = val
         return round(self.cdf, round_to)
 
+    def _cdf(self, k):
+        """ Vectorized cumulative distribution function, without rounding.
+
+        Args:
+            k (numpy.ndarray): points for calculating the cumulative distribution function
+
+        Returns:
+            numpy.ndarray: cumulative distribution function output
+        """
+
+        return np.where(k < 0, 0.0, np.where(k < 1, 1 - self.p, 1.0))
+
+    def calculate_ppf(self, q, round_to=2):
+        """ Method to calculate the percent point function (inverse of the cdf)
+        for the bernoulli distribution.
+
+        Args:
+            q (float or array-like): probability or probabilities for calculating the percent point function
+            round_to (int): Round the ppf value. [Default value: 2 floating point]
+
+        Returns:
+            float or numpy.ndarray: smallest outcome(s) k such that cdf(k) >= q,
+            nan where q is outside [0, 1]
+        """
+        ppf = self._ppf(np.asarray(q, dtype=np.float64))
+        if _is_array(q):
+            return np.round(ppf, round_to)
+        return round(float(ppf), round_to)
+
+    def _ppf(self, q):
+        """ Vectorized percent point function, without rounding.
+
+        Args:
+            q (numpy.ndarray): probabilities for calculating the percent point function
+
+        Returns:
+            numpy.ndarray: percent point function output
+        """
+
+        with np.errstate(invalid='ignore'):
+            return np.where((q >= 0) & (q <= 1), np.where(q <= 1 - self.p, 0.0, 1.0), np.nan)
+
+    def _logpdf(self, k):
+        """ Vectorized log of the probability density function, without rounding."""
+        with np.errstate(divide='ignore'):
+            return np.where(k == 1, np.log(self.p), np.where(k == 0, np.log1p(-self.p), -np.inf))
+
+    def _sf(self, k):
+        """ Vectorized survival function, without rounding."""
+        return np.where(k < 0, 1.0, np.where(k < 1, self.p, 0.0))
+
+    def _sample(self, rng, size):
+        """ Vectorized random values of the distribution, from a numpy Generator."""
+
+        return rng.random(size) < self.p
+
     def plot_bar_pdf(self):
         """ Method to plot the pdf of the bernoulli distribution
 
@@ -130,6 +227,8 @@ class Bernoulli(Distribution):
             list: x values for the pdf plot
             list: y values for the pdf plot
         """
+        import matplotlib.pyplot as plt
+
         x = [0, 1]
         y = []
         for i in x:
@@ -1,6 +1,14 @@
 import math
-import matplotlib.pyplot as plt
-from .Generaldistribution import Distribution
+import numpy as np
+from .Generaldistribution import Distribution, _DataCache, _Parameter, _is_array
+from .Specialfunctions import (_betainc, _betainc_scalar, _log_binomial_pmf_scalar,
+                               _stirling_error_scalar, log_binomial_pmf)
+
+# Upper bound on the memory used by the cache of the tables of pdf and cdf
+# values built by Binomial distributions in table mode
+TABLE_CACHE_BYTES = 1 << 26
+
+_table_cache = _DataCache(TABLE_CACHE_BYTES)
 
 
 class Binomial(Distribution):
@@ -13,12 +21,21 @@ class Binomial(Distribution):
         data_list (list of floats) to be extracted from the data file
         p (float) representing the probability of an event occurring
         n (int) number of trials
+        table (bool) whether the pdf and cdf are read from tables of every
+            outcome, built once for each n and p. It has no effect when
+            the tables, 24 * (n + 1) bytes, do not fit in the table cache
     """
 
-    def __init__(self, prob=.5, size=20):
+    __slots__ = ('_n', '_p', 'table')
+
+    n = _Parameter('n')
+    p = _Parameter('p')
+
+    def __init__(self, prob=.5, size=20, table=False):
 
         self.n = size
         self.p = prob
+        self.table = table
 
         Distribution.__init__(self, self.calculate_mean(),
                               self.calculate_stdev())
@@ -62,8 +79,24 @@ class Binomial(Distribution):
             float: the n value
         """
 
-        self.n = len(self.data)
-        self.p = 1.0 * sum(self.data) / len(self.data)
+        return self.replace_stats_with_summary(self.summarize())
+
+    def replace_stats_with_summary(self, summary):
+        """Function to calculate p and n from the sufficient statistics
+        of a data set, as returned by summarize.
+
+        Args:
+            summary (RunningStats): statistics of the data set
+
+        Returns:
+            float: the p value
+            float: the n value
+        """
+
+        if not summary.count:
+            raise ValueError('No data found in summary')
+        self.n = summary.count
+        self.p = summary.mean
         self.calculate_mean()
         self.calculate_stdev()
 
@@ -79,6 +112,7 @@ class Binomial(Distribution):
         Returns:
             None
         """
+        import matplotlib.pyplot as plt
 
         plt.bar(x=['0', '1'], height=[(1 - self.p) * self.n, self.p * self.n])
         plt.title('Bar Chart of Data')
@@ -89,38 +123,350 @@ class Binomial(Distribution):
         """Probability density function calculator for the binomial distribution.
 
         Args:
-            k (float): point for calculating the probability density function
+            k (float or array-like): point(s) for calculating the probability density function
             round_to (int): Round the mean value. [Default value: 2 floating point]
 
         Returns:
-            float: probability density function output
+            float or numpy.ndarray: probability density function output
         """
-
-        a = math.factorial(self.n)
-        b = math.factorial(k) * math.factorial(self.n - k)
-        c = (self.p ** k) * (1 - self.p) ** (self.n - k)
-        self.pdf = (a / b) * c
+        if _is_array(k):
+            self.pdf = self._pdf(np.asarray(k, dtype=np.float64))
+            return np.round(self.pdf, round_to)
+
+        n, p = self.n, self.p
+        if self._table_mode() and k >= 0:
+            pdf = self._outcome_tables()[0]
+            self.pdf = float(pdf[int(k)]) if k <= n and k == math.floor(k) else 0.0
+        elif 0 <= k <= n and k == math.floor(k) and 0 < p < 1:
+            stirling, = self._constants()
+            self.pdf = math.exp(_log_binomial_pmf_scalar(k, n, p, 1 - p, stirling))
+        else:
+            self.pdf = float(np.exp(self._logpdf(np.float64(k))))
 
         return round(self.pdf, round_to)
 
+    def _pdf(self, k):
+        """Vectorized probability density function, without rounding.
+
+        Args:
+            k (numpy.ndarray): points for calculating the probability density function
+
+        Returns:
+            numpy.ndarray: probability density function output, 0 where k is
+            not an integer between 0 and n
+        """
+
+        # when there are more points than outcomes, reading them from the
+        # whole pdf is cheaper than evaluating the log pdf at each of them
+        if self._table_mode() or k.size > self.n:
+            valid = (k >= 0) & (k <= self.n) & (k == np.floor(k))
+            index = np.where(valid, k, 0).astype(np.int64)
+            return np.where(valid, self._outcome_tables()[0][index], 0.0)
+
+        return np.exp(self._logpdf(k))
+
+    def _logpdf(self, k):
+        """Vectorized logarithm of the probability density function.
+
+        Args:
+            k (numpy.ndarray): points for calculating the log of the probability density function
+
+        Returns:
+            numpy.ndarray: log of the probability density function output,
+            -inf where k is not an integer between 0 and n
+        """
+
+        valid = (k >= 0) & (k <= self.n) & (k == np.floor(k))
+        log_pdf = log_binomial_pmf(np.where(valid, k, 0), self.n, self.p)
+
+        return np.where(valid, log_pdf, -np.inf)
+
+    def _pdf_outcomes(self):
+        """Probability density function of every outcome from 0 to n,
+        without rounding.
+
+        The pdf is evaluated in log space at the mode only and extended to
+        both sides by the ratio of consecutive terms,
+        pdf(k + 1) / pdf(k) = (n - k) / (k + 1) * p / (1 - p), which
+        shrinks moving away from the mode, so the products only lose
+        accuracy where the probabilities have become negligible.
+
+        Args:
+            None
+
+        Returns:
+            numpy.ndarray: pdf of the outcomes 0, 1, ..., n
+        """
+
+        n, p = self.n, self.p
+        if p == 0 or p == 1:
+            return (np.arange(n + 1) == n * p).astype(np.float64)
+
+        mode = min(int((n + 1) * p), n)
+        pdf = np.empty(n + 1)
+        pdf[mode] = math.exp(self._logpdf(np.float64(mode)))
+
+        odds = p / (1 - p)
+        above = np.arange(mode, n)
+        pdf[mode + 1:] = pdf[mode] * np.cumprod((n - above) / (above + 1) * odds)
+        below = np.arange(mode, 0, -1)
+        pdf[:mode][::-1] = pdf[mode] * np.cumprod(below / (n - below + 1) / odds)
+
+        return pdf
+
+    def _outcome_tables(self):
+        """Tables of the pdf, the cdf and the probability P(X >= k) of
+        every outcome k from 0 to n, without rounding. The tail
+        probabilities are summed from n down, to keep the small values.
+
+        In table mode the tables are kept, read-only, in a least recently
+        used cache shared by the binomial distributions with the same n
+        and p; otherwise they are built on every call.
+
+        Args:
+            None
+
+        Returns:
+            numpy.ndarray: array of shape (3, n + 1), the pdf, cdf and
+            tail probabilities of the outcomes 0, 1, ..., n
+        """
+
+        key = (self.n, self.p)
+        if self.table:
+            entry = _table_cache.get(key)
+            if entry is not None:
+                return entry[0]
+
+        pdf = self._pdf_outcomes()
+        tables = np.stack([pdf,
+                           np.minimum(np.cumsum(pdf), 1.0),
+                           np.minimum(np.cumsum(pdf[::-1])[::-1], 1.0)])
+        if self.table:
+            _table_cache.put(key, tables, None)
+        return tables
+
+    def _table_mode(self):
+        """Whether to read the pdf and cdf from the tables of every outcome:
+        in table mode, as long as the tables fit in the cache. Larger
+        tables would be rebuilt, in O(n), on every call, so the values are
+        then computed directly, as outside table mode."""
+
+        return self.table and 3 * 8 * (self.n + 1) <= _table_cache.max_bytes
+
+    @staticmethod
+    def table_cache_info():
+        """Function to report the statistics of the cache of tables used
+        by the binomial distributions in table mode.
+
+        Args:
+            None
+
+        Returns:
+            dict: hits, misses, hit_rate, entries, bytes and max_bytes
+        """
+
+        return _table_cache.info()
+
+    @staticmethod
+    def clear_table_cache():
+        """Function to empty the cache of tables and reset its statistics.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        _table_cache.clear()
+
+    @staticmethod
+    def resize_table_cache(max_bytes):
+        """Function to change the memory available to the cache of tables.
+        The cache is emptied, and disabled when max_bytes is 0. Binomial
+        distributions whose tables do not fit compute their values directly.
+
+        Args:
+            max_bytes (int): upper bound on the memory used by the tables
+
+        Returns:
+            None
+        """
+
+        _table_cache.clear()
+        _table_cache.max_bytes = max_bytes
+
     def calculate_cdf(self, k, round_to=2):
         """Cumulative distribution function calculator for the binomial distribution.
 
         Args:
-            k (float): point for calculating the cumulative distribution function
+            k (float or array-like): point(s) for calculating the cumulative distribution function
             round_to (int): Round the mean value. [Default value: 2 floating point]
 
         Returns:
-            float: cumulative distribution function output
+            float or numpy.ndarray: cumulative distribution function output
         """
-
-        total_p = 0
-        for i in range(k+1):
-            self.calculate_pdf(i)
-            total_p += self.pdf
-        self.cdf = total_p
+        if _is_array(k):
+            self.cdf = self._cdf(np.asarray(k, dtype=np.float64))
+            return np.round(self.cdf, round_to)
+
+        n, p = self.n, self.p
+        if self._table_mode() and k >= 0:
+            cdf = self._outcome_tables()[1]
+            self.cdf = float(cdf[math.floor(min(k, n))])
+        elif 0 <= k < n and 0 < p < 1:
+            # P(X <= k) = 1 - I_p(k + 1, n - k), as in _incomplete_beta
+            stirling, = self._constants()
+            k = math.floor(k)
+            self.cdf = _betainc_scalar(k + 1, n - k, p, True, stirling)
+        else:
+            self.cdf = float(self._cdf(np.float64(k)))
         return round(self.cdf, round_to)
 
+    def _cdf(self, k):
+        """Vectorized cumulative distribution function, without rounding.
+
+        Args:
+            k (numpy.ndarray): points for calculating the cumulative distribution function
+
+        Returns:
+            numpy.ndarray: cumulative distribution function output
+        """
+
+        # as for the pdf, many points are cheaper to read from the whole cdf
+        if self._table_mode() or k.size > self.n:
+            cumulative = self._outcome_tables()[1]
+            index = np.clip(np.floor(np.nan_to_num(k)), 0, self.n).astype(np.int64)
+            return np.where(np.isnan(k), np.nan, np.where(k < 0, 0.0, cumulative[index]))
+
+        return self._incomplete_beta(k, lower=True)
+
+    def _incomplete_beta(self, k, lower, log=False):
+        """Vectorized cdf, or survival function, or their logarithms,
+        computed without summing the pdf, from P(X > k) = I_p(k + 1, n - k).
+        The continued fraction of I needs about sqrt(n p (1 - p)) terms
+        close to the mean, about 1 ms per point at n = 10^7; table mode
+        reads repeated points in constant time instead.
+
+        Args:
+            k (numpy.ndarray): points for calculating the function
+            lower (bool): whether to compute the cdf or the survival function
+            log (bool): whether to return the logarithm of the result. [Default value: False]
+
+        Returns:
+            numpy.ndarray: function output
+        """
+
+        k = np.floor(k)
+        inside = (0 <= k) & (k < self.n)
+        with np.errstate(invalid='ignore'):
+            value = _betainc(np.where(inside, k + 1, np.nan), self.n - k, self.p, lower, log)
+
+        below, above = (0.0, 1.0) if lower else (1.0, 0.0)
+        if log:
+            with np.errstate(divide='ignore'):
+                below, above = np.log(below), np.log(above)
+        return np.where(k < 0, below, np.where(k >= self.n, above, value))
+
+    def calculate_ppf(self, q, round_to=2):
+        """Percent point function (inverse of the cdf) calculator for the binomial distribution.
+
+        Args:
+            q (float or array-like): probability or probabilities for calculating the percent point function
+            round_to (int): Round the ppf value. [Default value: 2 floating point]
+
+        Returns:
+            float or numpy.ndarray: smallest outcome(s) k such that cdf(k) >= q,
+            nan where q is outside [0, 1]
+        """
+        ppf = self._ppf(np.asarray(q, dtype=np.float64))
+        if _is_array(q):
+            return np.round(ppf, round_to)
+        return round(float(ppf), round_to)
+
+    def _ppf(self, q):
+        """Vectorized percent point function, without rounding.
+
+        Args:
+            q (numpy.ndarray): probabilities for calculating the percent point function
+
+        Returns:
+            numpy.ndarray: percent point function output
+        """
+
+        inside = (q >= 0) & (q <= 1)
+        target = np.where(inside, q, 0.5)
+
+        # as for the cdf, many points are cheaper to look up in the whole cdf
+        if self._table_mode() or q.size > self.n:
+            cumulative = self._outcome_tables()[1]
+            k = np.minimum(np.searchsorted(cumulative, target), self.n).astype(np.float64)
+        else:
+            # bisection over the outcomes, keeping cdf(low) < q <= cdf(high)
+            low = np.full(q.shape, -1.0)
+            high = np.full(q.shape, float(self.n))
+            while (high - low > 1).any():
+                middle = np.floor((low + high) / 2)
+                below = self._cdf(middle) < target
+                low = np.where(below, middle, low)
+                high = np.where(below, high, middle)
+            k = high
+
+        # the cdf rounds to 1 before n, but only n has cdf(k) >= 1 exactly
+        last = float(self.n) if self.p > 0 else 0.0
+        return np.where(inside, np.where(q == 0, 0.0, np.where(q == 1, last, k)), np.nan)
+
+    def _sf(self, k):
+        """Vectorized survival function, without rounding.
+
+        Args:
+            k (numpy.ndarray): points for calculating the survival function
+
+        Returns:
+            numpy.ndarray: probability of more than k successes
+        """
+
+        # as for the cdf, many points are cheaper to read from the whole
+        # survival function
+        if self._table_mode() or k.size > self.n:
+            tail = self._outcome_tables()[2]
+            index = np.clip(np.floor(np.nan_to_num(k)) + 1, 0, self.n).astype(np.int64)
+            return np.where(np.isnan(k), np.nan,
+                            np.where(k < 0, 1.0, np.where(k >= self.n, 0.0, tail[index])))
+
+        return self._incomplete_beta(k, lower=False)
+
+    def _logcdf(self, k):
+        """Vectorized log of the cumulative distribution function, without rounding."""
+
+        if self._table_mode() or k.size > self.n:
+            # close to 1, log1p of the small complement keeps the precision
+            cdf, sf = self._cdf(k), self._sf(k)
+            with np.errstate(divide='ignore'):
+                return np.where(cdf > 0.5, np.log1p(-sf), np.log(cdf))
+        return self._incomplete_beta(k, lower=True, log=True)
+
+    def _logsf(self, k):
+        """Vectorized log of the survival function, without rounding."""
+
+        if self._table_mode() or k.size > self.n:
+            # as in _logcdf
+            cdf, sf = self._cdf(k), self._sf(k)
+            with np.errstate(divide='ignore'):
+                return np.where(sf > 0.5, np.log1p(-cdf), np.log(sf))
+        return self._incomplete_beta(k, lower=False, log=True)
+
+    def _calculate_constants(self):
+        """Error of Stirling's approximation at n, shared by the scalar pdf
+        and cdf at every k."""
+
+        return (_stirling_error_scalar(self.n) if self.n > 0 else None),
+
+    def _sample(self, rng, size):
+        """Vectorized random values of the distribution, from a numpy Generator."""
+
+        return rng.binomial(self.n, self.p, size)
+
     def plot_bar_pdf(self):
         """Function to plot the pdf of the binomial distribution
 
@@ -131,25 +477,23 @@ class Binomial(Distribution):
             list: x values for the pdf plot
             list: y values for the pdf plot
         """
+        import matplotlib.pyplot as plt
 
-        x = []
-        y = []
-
-        # calculate the x values to visualize
-        for i in range(self.n + 1):
-            x.append(i)
-            self.calculate_pdf(i)
-            y.append(self.pdf)
+        x = np.arange(self.n + 1)
+        y = self._pdf_outcomes()
+        self.pdf = float(y[-1])
 
-        # make the plots
-        plt.bar(x, y)
+        # make the plots, leaving out the outcomes too unlikely to show
+        # as a bar, which are most of them when n is large
+        visible = y >= y.max() * 1e-6
+        plt.bar(x[visible], y[visible])
         plt.title('Distribution of Outcomes')
         plt.ylabel('Probability')
         plt.xlabel('Outcome')
 
         plt.show()
 
-        return x, y
+        return x.tolist(), y.tolist()
 
     def __add__(self, other):
         """Function to add together two Binomial distributions with equal p
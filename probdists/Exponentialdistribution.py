@@ -1,6 +1,6 @@
 import math
-import matplotlib.pyplot as plt
-from .Generaldistribution import Distribution
+import numpy as np
+from .Generaldistribution import Distribution, _Parameter, _is_array
 
 
 class Exponential(Distribution):
@@ -18,6 +18,10 @@ class Exponential(Distribution):
 
     """
 
+    __slots__ = ('_lmbda',)
+
+    lmbda = _Parameter('lmbda')
+
     def __init__(self, lmbda=.5):
 
         self.lmbda = lmbda
@@ -53,38 +57,139 @@ class Exponential(Distribution):
 
         return round(self.stdev, round_to)
 
+    def replace_stats_with_summary(self, summary):
+        """ Method to calculate lmbda, by maximum likelihood, from the
+        sufficient statistics of a data set, as returned by summarize
+
+        Args:
+            summary (RunningStats): statistics of the data set
+
+        Returns:
+            float: the lmbda value
+        """
+
+        if not summary.count:
+            raise ValueError('No data found in summary')
+        self.lmbda = 1.0 / summary.mean
+        self.calculate_mean()
+        self.calculate_stdev()
+
+        return self.lmbda
+
     def calculate_pdf(self, x, round_to=2):
         """ Probability density function calculator for the exponential distribution.
 
         Args:
-            x (float): point for caluclating the probability density function
+            x (float or array-like): point(s) for caluclating the probability density function
             round_to (int): Round the mean value. [Default value: 2 floating point]
 
         Returns:
-            float: probability density function
+            float or numpy.ndarray: probability density function
         """
+        if _is_array(x):
+            self.pdf = self._pdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.pdf, round_to)
         value = 0  # default value of exponential distribution for x < 0
         if x >= 0:
             value = self.lmbda * math.exp(-self.lmbda * x)
         self.pdf = value
         return round(self.pdf, round_to)
 
+    def _pdf(self, x):
+        """ Vectorized probability density function, without rounding.
+
+        Args:
+            x (numpy.ndarray): points for calculating the probability density function
+
+        Returns:
+            numpy.ndarray: probability density function
+        """
+        positive = x >= 0
+        return np.where(positive, self.lmbda * np.exp(-self.lmbda * np.where(positive, x, 0)), 0.0)
+
     def calculate_cdf(self, x, round_to=2):
         """
         Probability density function calculator for the Exponential distribution.
             Args:
-                x (float): point for calculating the probability density function
+                x (float or array-like): point(s) for calculating the probability density function
                 round_to (int): Round the mean value. [Default value: 2 floating point]
 
             Returns:
-                float: probability density function output
+                float or numpy.ndarray: probability density function output
         """
+        if _is_array(x):
+            self.cdf = self._cdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.cdf, round_to)
         val = 0
         if x >= 0:
             val = 1 - math.exp(-self.lmbda * x)
         self.cdf = val
         return round(self.cdf, round_to)
 
+    def _cdf(self, x):
+        """ Vectorized cumulative distribution function, without rounding.
+
+        Args:
+            x (numpy.ndarray): points for calculating the cumulative distribution function
+
+        Returns:
+            numpy.ndarray: cumulative distribution function output
+        """
+        positive = x >= 0
+        return np.where(positive, -np.expm1(-self.lmbda * np.where(positive, x, 0)), 0.0)
+
+    def calculate_ppf(self, q, round_to=2):
+        """ Method to calculate the percent point function (inverse of the cdf)
+        for the exponential distribution.
+
+        Args:
+            q (float or array-like): probability or probabilities for calculating the percent point function
+            round_to (int): Round the ppf value. [Default value: 2 floating point]
+
+        Returns:
+            float or numpy.ndarray: point(s) x such that cdf(x) = q, nan where q is outside [0, 1]
+        """
+        ppf = self._ppf(np.asarray(q, dtype=np.float64))
+        if _is_array(q):
+            return np.round(ppf, round_to)
+        return round(float(ppf), round_to)
+
+    def _ppf(self, q):
+        """ Vectorized percent point function, without rounding.
+
+        Args:
+            q (numpy.ndarray): probabilities for calculating the percent point function
+
+        Returns:
+            numpy.ndarray: percent point function output
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where((q >= 0) & (q <= 1), -np.log1p(-q) / self.lmbda, np.nan)
+
+    def _logpdf(self, x):
+        """ Vectorized log of the probability density function, without rounding."""
+        return np.where(x >= 0, math.log(self.lmbda) - self.lmbda * x, -np.inf)
+
+    def _logcdf(self, x):
+        """ Vectorized log of the cumulative distribution function, without rounding."""
+        rate = self.lmbda * np.where(x >= 0, x, 0)
+        with np.errstate(divide='ignore'):
+            # log(1 - exp(-rate)), split where each form keeps its precision
+            value = np.where(rate > math.log(2), np.log1p(-np.exp(-rate)), np.log(-np.expm1(-rate)))
+        return np.where(x >= 0, value, -np.inf)
+
+    def _sf(self, x):
+        """ Vectorized survival function, without rounding."""
+        return np.exp(-self.lmbda * np.where(x >= 0, x, 0))
+
+    def _logsf(self, x):
+        """ Vectorized log of the survival function, without rounding."""
+        return -self.lmbda * np.where(x >= 0, x, 0)
+
+    def _sample(self, rng, size):
+        """ Vectorized random values of the distribution, from a numpy Generator."""
+        return rng.exponential(1 / self.lmbda, size)
+
     def plot_bar_pdf(self, points=100):
         """ Method to plot the pdf of the exponential distribution.
 
@@ -96,6 +201,7 @@ class Exponential(Distribution):
             list: y values for the pdf plot
 
         """
+        import matplotlib.pyplot as plt
 
         x = []
         y = []
@@ -1,6 +1,80 @@
 import math
-import matplotlib.pyplot as plt
-from .Generaldistribution import Distribution
+import numpy as np
+from .Generaldistribution import Distribution, RunningStats, _Parameter, _is_array
+from .Specialfunctions import (_gammainc, _gammainc_scalar, _log_minus_digamma_scalar,
+                               _log_poisson_pmf_scalar, _stirling_error_scalar,
+                               _trigamma_scalar, gammainc, gammaincc, gammaincinv,
+                               log_poisson_pmf)
+
+# Bound on the Newton iterations of the maximum likelihood fit of k, which
+# converge quadratically from the initial approximation, in 3 or 4 steps
+FIT_ITERATIONS = 20
+
+
+class GammaStats(RunningStats):
+    """ RunningStats that also keep the mean of the logarithm of the values,
+    which with their mean are the sufficient statistics of the gamma
+    distribution.
+
+    Attributes:
+        log_mean (float) mean of the logarithm of the values, nan if one of
+            them is not positive
+    """
+
+    __slots__ = ('log_mean',)
+
+    def __init__(self, values=()):
+
+        self.log_mean = 0.0
+        RunningStats.__init__(self, values)
+
+    def update(self, values):
+        """Function to add a value, or an array of values, to the statistics.
+
+        Args:
+            values (float or array-like): new values
+
+        Returns:
+            GammaStats: the updated statistics
+        """
+
+        if not _is_array(values):
+            value = float(values)
+            RunningStats.update(self, value)
+            log = math.log(value) if value > 0 else math.nan
+            self.log_mean += (log - self.log_mean) / self.count
+            return self
+        return RunningStats.update(self, values)
+
+    def _update_chunk(self, values):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_mean = float(np.log(values).mean())
+        self._combine_log_mean(len(values), log_mean if values.min() > 0 else math.nan)
+        RunningStats._update_chunk(self, values)
+
+    def merge(self, other):
+        """Function to add the values seen by other GammaStats.
+
+        Args:
+            other (GammaStats): statistics to add
+
+        Returns:
+            GammaStats: the updated statistics
+        """
+
+        if other.count:
+            self._combine_log_mean(other.count, other.log_mean)
+        return RunningStats.merge(self, other)
+
+    def _combine_log_mean(self, count, log_mean):
+        self.log_mean += (log_mean - self.log_mean) * count / (self.count + count)
+
+    def to_dict(self):
+        values = RunningStats.to_dict(self)
+        values['log_mean'] = self.log_mean
+        return values
+
+    to_dict.__doc__ = RunningStats.to_dict.__doc__
 
 
 class Gamma(Distribution):
@@ -13,6 +87,13 @@ class Gamma(Distribution):
             theta (float) scale parameter that stretches/shrinks distribution (theta > 0)
     """
 
+    __slots__ = ('_k', '_theta', 'fit', 'data_file')
+
+    k = _Parameter('k')
+    theta = _Parameter('theta')
+
+    summary_class = GammaStats
+
     def __init__(self, k=2, theta=2, fit=False, data_file='demo_gamma_data'):
         """
         Init function to instantiate Gamma distribution
@@ -31,16 +112,45 @@ class Gamma(Distribution):
             self.fit = True
             self.data_file = data_file
             self.read_data_file(data_file)
-            total = sum(self.data)
-            sample_mean = total / float(len(self.data))
-            running = 0
-            for each in self.data:
-                running += math.pow((each-sample_mean), 2)
-            sample_var = running / float(len(self.data))
-            self.k = round(math.pow(sample_mean, 2) / sample_var)
-            self.theta = sample_var / sample_mean
+            self.replace_stats_with_chunks([self.data])
             Distribution.__init__(self, self.calculate_mean(), self.calculate_stdev())
 
+    def replace_stats_with_summary(self, summary):
+        """
+        Function to fit k and theta, by maximum likelihood, to the sufficient
+        statistics of a data set, as returned by summarize.
+
+        k solves log(k) - digamma(k) = log(mean) - mean of log(x), found by
+        Newton steps on 1 / k from the approximation of Minka (2002), and
+        theta = mean / k. It falls back to the method of moments when the
+        summary has no log_mean, or a value is not positive.
+            Args:
+                summary (GammaStats): statistics of the data set
+            Returns:
+                float: the k value
+                float: the theta value
+        """
+        if not summary.count:
+            raise ValueError('No data found in summary')
+        gap = math.log(summary.mean) - getattr(summary, 'log_mean', math.nan) \
+            if summary.mean > 0 else math.nan
+        if not 0 < gap < math.inf:
+            sample_var = summary.variance(sample=False)
+            self.k = math.pow(summary.mean, 2) / sample_var
+            self.theta = sample_var / summary.mean
+        else:
+            k = (3 - gap + math.sqrt((gap - 3) ** 2 + 24 * gap)) / (12 * gap)
+            for _ in range(FIT_ITERATIONS):
+                step = (_log_minus_digamma_scalar(k) - gap) / (k * (1 - k * _trigamma_scalar(k)))
+                k = 1 / (1 / k + step)
+                if abs(step) * k <= 1e-15:
+                    break
+            self.k = k
+            self.theta = summary.mean / k
+        self.calculate_mean()
+        self.calculate_stdev()
+        return self.k, self.theta
+
     def calculate_mean(self, round_to=2):
         """
         Function to calculate the mean of the data set.
@@ -69,16 +179,33 @@ class Gamma(Distribution):
         """
         Probability density function calculator for the Gamma distribution.
             Args:
-                x (float): point for calculating the probability density function
+                x (float or array-like): point(s) for calculating the probability density function
                 round_to (int): Round the mean value. [Default value: 2 floating point]
 
             Returns:
-                float: probability density function output
+                float or numpy.ndarray: probability density function output
         """
-        self.pdf = (1 / (math.factorial(self.k - 1) * math.pow(self.theta, self.k))) * (math.pow(x, self.k - 1)) * (
-            math.exp((-1 * x / self.theta)))
+        if _is_array(x):
+            self.pdf = self._pdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.pdf, round_to)
+        if 0 < x < math.inf:
+            log_theta, stirling_pdf, _ = self._constants()
+            self.pdf = math.exp(_log_poisson_pmf_scalar(self.k - 1, x / self.theta, stirling_pdf) - log_theta)
+        else:
+            self.pdf = float(self._pdf(np.float64(x)))
         return round(self.pdf, round_to)
 
+    def _pdf(self, x):
+        """
+        Vectorized probability density function, without rounding.
+            Args:
+                x (numpy.ndarray): points for calculating the probability density function
+
+            Returns:
+                numpy.ndarray: probability density function output
+        """
+        return np.exp(self._logpdf(x))
+
     def plot_bar_pdf(self, points=25):
         """
         Method to plot the pdf of the exponential distribution.
@@ -88,6 +215,8 @@ class Gamma(Distribution):
                 list: x values for the pdf plot
                 list: y values for the pdf plot
         """
+        import matplotlib.pyplot as plt
+
         x = []
         y = []
 
@@ -110,27 +239,109 @@ class Gamma(Distribution):
         """
         Cumulative density function calculator for the Gamma distribution.
             Args:
-                x (float): Point for calculating the cumulative distribution function
+                x (float or array-like): Point(s) for calculating the cumulative distribution function
                 is_upper (boolean): Upper or lower CDF results. [Default value: True]
                 round_to (int): Round the CDF results. [Default value: 2]
             Returns:
-                float: CDF output based on 'is_upper' argument rounded to 'round_to'
-        """
-        #initialize and declare the return variable self.cdf
-        self.cdf = 0
-        if x >= 0:
-            #initiate cdfvalue variable
-            cdfvalue = 0
-            for i in range (self.k):
-                cdfvalue += (math.pow((x / self.theta), i) * math.exp(-1 * x / self.theta)) / math.factorial(i)
-            if is_upper == True:
-                self.cdf = cdfvalue
-            elif is_upper == False:
-                self.cdf = 1 - cdfvalue
+                float or numpy.ndarray: CDF output based on 'is_upper' argument rounded to 'round_to'
+        """
+        if _is_array(x):
+            x = np.asarray(x, dtype=np.float64)
+            if np.any(x < 0):
+                raise Exception('x has to be a positive real number')
+            self.cdf = self._cdf(x, is_upper)
+            return np.round(self.cdf, round_to)
+        if x < 0:
+            raise Exception('x has to be a positive real number')
+        if 0 < x < math.inf:
+            _, _, stirling_cdf = self._constants()
+            self.cdf = _gammainc_scalar(self.k, x / self.theta, is_upper, stirling_cdf)
         else:
-            raise Exception ('x has to be a positive real number')
+            self.cdf = float(self._cdf(np.float64(x), is_upper))
         return round(self.cdf, round_to)
 
+    def _cdf(self, x, is_upper=False):
+        """
+        Vectorized cumulative density function, without rounding.
+            Args:
+                x (numpy.ndarray): Points for calculating the cumulative distribution function
+                is_upper (boolean): Upper or lower CDF results. [Default value: False]
+            Returns:
+                numpy.ndarray: CDF output based on 'is_upper' argument
+        """
+        # regularized incomplete gamma functions, for any real k > 0
+        if is_upper:
+            return gammaincc(self.k, np.maximum(x, 0) / self.theta)
+        return gammainc(self.k, np.maximum(x, 0) / self.theta)
+
+    def calculate_ppf(self, q, round_to=2):
+        """
+        Percent point function (inverse of the lower cdf) calculator for the Gamma distribution.
+            Args:
+                q (float or array-like): Probability or probabilities for calculating the percent point function
+                round_to (int): Round the ppf results. [Default value: 2]
+            Returns:
+                float or numpy.ndarray: point(s) x such that the lower cdf at x is q,
+                nan where q is outside [0, 1]
+        """
+        ppf = self._ppf(np.asarray(q, dtype=np.float64))
+        if _is_array(q):
+            return np.round(ppf, round_to)
+        return round(float(ppf), round_to)
+
+    def _ppf(self, q):
+        """
+        Vectorized percent point function, without rounding.
+            Args:
+                q (numpy.ndarray): Probabilities for calculating the percent point function
+            Returns:
+                numpy.ndarray: percent point function output
+        """
+        # inverse of the regularized incomplete gamma function, for any real k > 0
+        return self.theta * gammaincinv(self.k, q)
+
+    def _logpdf(self, x):
+        """
+        Vectorized log of the probability density function, without rounding.
+        """
+        # x^(k-1) * exp(-x/theta) / (gamma(k) * theta^k) is the Poisson pmf
+        # of k - 1 at x/theta, over theta, which stays accurate for large k
+        with np.errstate(invalid='ignore'):
+            log_pdf = log_poisson_pmf(self.k - 1, np.where(x >= 0, x, 0) / self.theta) - self._constants()[0]
+        return np.where(x >= 0, log_pdf, -np.inf)
+
+    def _logcdf(self, x):
+        """
+        Vectorized log of the (lower) cumulative distribution function, without rounding.
+        """
+        return _gammainc(self.k, x / self.theta, upper=False, log=True)
+
+    def _sf(self, x):
+        """
+        Vectorized survival function, the upper cumulative distribution function, without rounding.
+        """
+        return gammaincc(self.k, x / self.theta)
+
+    def _logsf(self, x):
+        """
+        Vectorized log of the survival function, without rounding.
+        """
+        return _gammainc(self.k, x / self.theta, upper=True, log=True)
+
+    def _calculate_constants(self):
+        """
+        Constants of the scalar pdf and cdf: log(theta), and the errors of
+        Stirling's approximation at k - 1 and k, which only depend on k.
+        """
+        stirling_pdf = _stirling_error_scalar(self.k - 1) if self.k > 1 else None
+        return math.log(self.theta), stirling_pdf, _stirling_error_scalar(self.k)
+
+    def _sample(self, rng, size):
+        """
+        Vectorized random values of the distribution, from a numpy Generator.
+        """
+        return rng.gamma(self.k, self.theta, size)
+
     def __add__(self, other):
         """
         Function to add together two Gamma distributions
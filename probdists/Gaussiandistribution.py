@@ -1,6 +1,7 @@
 import math
-import matplotlib.pyplot as plt
-from .Generaldistribution import Distribution
+import numpy as np
+from .Generaldistribution import Distribution, RunningStats, _is_array
+from .Specialfunctions import log_ndtr, ndtr, ndtri
 
 
 class Gaussian(Distribution):
@@ -13,6 +14,8 @@ class Gaussian(Distribution):
         data_list (list of floats) extracted from the data file
     """
 
+    __slots__ = ()
+
     def __init__(self, mu=0, sigma=1):
 
         Distribution.__init__(self, mu, sigma)
@@ -27,9 +30,11 @@ class Gaussian(Distribution):
                float: mean of the data set
         """
 
-        avg = 1.0 * sum(self.data) / len(self.data)
+        stats = RunningStats(self.data)
+        if not stats.count:
+            raise ValueError('No data found')
 
-        self.mean = avg
+        self.mean = stats.mean
 
         return round(self.mean, round_to)
 
@@ -44,39 +49,122 @@ class Gaussian(Distribution):
             float: standard deviation of the data set
         """
 
-        if sample:
-            n = len(self.data) - 1
-        else:
-            n = len(self.data)
+        # mean and deviations in a single pass over the data
+        stats = RunningStats(self.data)
 
-        self.calculate_mean()
-        mean = self.mean
+        self.mean = stats.mean
+        self.stdev = stats.stdev(sample)
 
-        sigma = 0
+        return round(self.stdev, round_to)
 
-        for d in self.data:
-            sigma += (d - mean) ** 2
+    def replace_stats_with_summary(self, stats, sample=True):
+        """Function to set the mean and standard deviation from the
+        RunningStats of a data set, which can be kept up to date while an
+        unbounded stream is read, or merged from the statistics of shards.
 
-        sigma = math.sqrt(sigma / n)
+        Args:
+             stats (RunningStats): statistics of the data set
+             sample (bool): whether the data represents a sample or population
 
-        self.stdev = sigma
+        Returns:
+            float: mean of the data set
+            float: standard deviation of the data set
+        """
 
-        return round(self.stdev, round_to)
+        if not stats.count:
+            raise ValueError('No data found in summary')
+        self.mean = stats.mean
+        self.stdev = stats.stdev(sample)
+
+        return self.mean, self.stdev
 
     def calculate_cdf(self, x, round_to=2):
         """Cumulative distribution function calculator for the gaussian distribution.
 
                 Args:
-                        x (float): point for calculating the
+                        x (float or array-like): point(s) for calculating the
                                    cumulative distribution function
                         round_to (int): Round the mean value. [Default value: 2 floating point]
 
                 Returns:
-                        float: cumulative distribution function output
+                        float or numpy.ndarray: cumulative distribution function output
                 """
-        self.cdf = (0.5 * (1 + math.erf((x - self.mean) / (self.stdev * math.sqrt(2)))))
+        if _is_array(x):
+            self.cdf = self._cdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.cdf, round_to)
+        _, erf_scale = self._constants()
+        self.cdf = (0.5 * (1 + math.erf((x - self.mean) / erf_scale)))
         return round(self.cdf, round_to)
 
+    def _cdf(self, x):
+        """Vectorized cumulative distribution function, without rounding.
+
+                Args:
+                        x (numpy.ndarray): points for calculating the
+                                   cumulative distribution function
+
+                Returns:
+                        numpy.ndarray: cumulative distribution function output
+                """
+        return ndtr((x - self.mean) / self.stdev)
+
+    def calculate_ppf(self, q, round_to=2):
+        """Percent point function (inverse of the cdf) calculator for the gaussian distribution.
+
+                Args:
+                        q (float or array-like): probability or probabilities
+                                   for calculating the percent point function
+                        round_to (int): Round the ppf value. [Default value: 2 floating point]
+
+                Returns:
+                        float or numpy.ndarray: point(s) x such that cdf(x) = q,
+                                   nan where q is outside [0, 1]
+                """
+        ppf = self._ppf(np.asarray(q, dtype=np.float64))
+        if _is_array(q):
+            return np.round(ppf, round_to)
+        return round(float(ppf), round_to)
+
+    def _ppf(self, q):
+        """Vectorized percent point function, without rounding.
+
+                Args:
+                        q (numpy.ndarray): probabilities for calculating the
+                                   percent point function
+
+                Returns:
+                        numpy.ndarray: percent point function output
+                """
+        return self.mean + self.stdev * ndtri(q)
+
+    def _logpdf(self, x):
+        """Vectorized log of the probability density function, without rounding."""
+        z = (x - self.mean) / self.stdev
+        return -0.5 * z * z - math.log(self.stdev * math.sqrt(2 * math.pi))
+
+    def _logcdf(self, x):
+        """Vectorized log of the cumulative distribution function, without rounding."""
+        return log_ndtr((x - self.mean) / self.stdev)
+
+    def _sf(self, x):
+        """Vectorized survival function, without rounding."""
+        return ndtr((self.mean - x) / self.stdev)
+
+    def _logsf(self, x):
+        """Vectorized log of the survival function, without rounding."""
+        return log_ndtr((self.mean - x) / self.stdev)
+
+    def _calculate_constants(self):
+        """Normalizing factor of the pdf, and scale of the erf argument in the cdf."""
+        return 1.0 / (self.stdev * math.sqrt(2 * math.pi)), self.stdev * math.sqrt(2)
+
+    def _update_moments(self):
+        """The mean and standard deviation are the parameters, nothing to update."""
+
+    def _sample(self, rng, size):
+        """Vectorized random values of the distribution, from a numpy Generator."""
+        return rng.normal(self.mean, self.stdev, size)
+
     def plot_histogram(self):
         """Function to output a histogram of the instance variable data using
                 matplotlib pyplot library.
@@ -87,6 +175,8 @@ class Gaussian(Distribution):
                 Returns:
                         None
                 """
+        import matplotlib.pyplot as plt
+
         plt.hist(self.data)
         plt.title("Histogram of Data")
         plt.xlabel("data")
@@ -96,16 +186,34 @@ class Gaussian(Distribution):
         """Probability density function calculator for the gaussian distribution.
 
                 Args:
-                        x (float): point for calculating the
+                        x (float or array-like): point(s) for calculating the
                                    probability density function
                         round_to (int): Round the mean value. [Default value: 2 floating point]
 
                 Returns:
-                        float: probability density function output
+                        float or numpy.ndarray: probability density function output
         """
-        self.pdf = (1.0 / (self.stdev * math.sqrt(2 * math.pi))) * math.exp(-0.5 * ((x - self.mean) / self.stdev) ** 2)
+        if _is_array(x):
+            self.pdf = self._pdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.pdf, round_to)
+        norm, _ = self._constants()
+        self.pdf = norm * math.exp(-0.5 * ((x - self.mean) / self.stdev) ** 2)
         return round(self.pdf, round_to)
 
+    def _pdf(self, x):
+        """Vectorized probability density function, without rounding.
+
+                Args:
+                        x (numpy.ndarray): points for calculating the
+                                   probability density function
+
+                Returns:
+                        numpy.ndarray: probability density function output
+        """
+        norm, _ = self._constants()
+        z = (x - self.mean) / self.stdev
+        return norm * np.exp(-0.5 * z * z)
+
     def plot_histogram_pdf(self, n_spaces=50):
         """Function to plot the normalized histogram of the data and a plot of the
                 probability density function along the same range
@@ -118,6 +226,7 @@ class Gaussian(Distribution):
                         list: y values for the pdf plot
 
                 """
+        import matplotlib.pyplot as plt
 
         min_range = min(self.data)
         max_range = max(self.data)
@@ -1,111 +1,1958 @@
+import bz2
+import copy
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import glob
+import gzip
+import lzma
+import math
+import operator
+import os
 from pathlib import Path
-import pandas as pd
-import traceback
+import tempfile
+import threading
+import numpy as np
+import warnings
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # Python < 3.8: fit_many pickles the arrays to its workers instead
+    shared_memory = None
+
+# Number of characters read from a text file per block while parsing
+BLOCK_SIZE = 1 << 22
+
+# Default number of values yielded at a time by Distribution.iter_data_file
+CHUNK_SIZE = 1 << 20
+
+# Upper bound on the memory used by the cache of parsed data files
+DATA_CACHE_BYTES = 1 << 28
+
+# Extension of the binary format written by Distribution.save_data_file
+BINARY_FORMAT = 'npy'
+
+# Ways of handling values which are not numbers while reading a file
+ERROR_MODES = ('raise', 'skip', 'collect')
+
+# Number of invalid values kept as examples in a ParseReport
+MAX_SAMPLES = 10
+
+# Data sets fitted per task of Distribution.fit_many, and bytes of arrays
+# after which a task is sent early, through a block of shared memory
+FIT_BATCH_SIZE = 64
+FIT_BATCH_BYTES = 1 << 26
+
+# Compressed files are decompressed on the fly while being read
+COMPRESSIONS = {'gz': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+
+MAGIC_NUMBERS = {b'\x1f\x8b': 'gz', b'BZh': 'bz2', b'\xfd7zXZ\x00': 'xz'}
+
+EXCEL_FORMATS = {'xls', 'xlsx', 'xlsm', 'xlsb',
+                 'odf', 'ods', 'odt'}
+
+DEMO_FILES = {
+    'demo_gaussian_data': 'numbers.txt',
+    'demo_binomial_data': 'numbers_binomial.txt',
+    'demo_exponential_data': 'numbers_exponential.txt',
+    'demo_gamma_data': 'numbers_gamma.txt',
+    'demo_uniform_data': 'numbers_uniform.txt',
+    'demo_bernoulli_data': 'numbers_bernoulli.txt',
+    'demo_triangular_data': 'numbers_triangular.txt'
+}
+
+
+def _find_file(file_name):
+    """Maps the demo dataset names to their files.
+
+    Args:
+        file_name (string): name of a file or of a demo dataset
+
+    Returns:
+        string: name of the file
+    """
+
+    if file_name in DEMO_FILES:
+        dirname = Path(__file__).parent.parent.absolute()
+        file_name = str(Path(dirname, 'probdists/' + DEMO_FILES[file_name]))
+    return file_name
+
+
+def _resolve_file_name(file_name, separator):
+    """Maps the demo dataset names to their files, detects compressed
+    files and selects the separator for csv files.
+
+    Args:
+        file_name (string): name of a file or of a demo dataset
+        separator (character): separator requested by the caller
+
+    Returns:
+        string: name of the file to read from
+        string: extension of the file, without the compression extension
+        string: separator to use for the file
+        string: compression of the file, None if not compressed
+    """
+
+    file_name = _find_file(file_name)
+
+    # Compression is found from the extension, or else from the magic number
+    parts = file_name.split('.')
+    if parts[-1] in COMPRESSIONS and len(parts) > 1:
+        compression = parts.pop()
+    else:
+        compression = None
+        with open(file_name, 'rb') as file:
+            start = file.read(6)
+        for magic, name in MAGIC_NUMBERS.items():
+            if start.startswith(magic):
+                compression = name
+
+    # Finding the file extension and selecting separator for csv file
+    extension = parts[-1]
+    if extension == 'csv':
+        separator = ','
+
+    return file_name, extension, separator, compression
+
+
+def _open_data_file(file_name, compression, mode='rt'):
+    """Opens a data file, decompressing it on the fly if needed.
+
+    Args:
+        file_name (string): name of a file to open
+        compression (string): compression of the file, None if not compressed
+        mode (string): mode to open the file in
+
+    Returns:
+        file object: the opened file
+    """
+
+    if compression is None:
+        return open(file_name, mode)
+    return COMPRESSIONS[compression](file_name, mode)
+
+
+def _read_binary_file(file_name, compression=None):
+    """Memory-maps a binary data file written by save_data_file.
+
+    The returned array is read-only and shares its pages with every other
+    process mapping the same file, so nothing is parsed nor copied.
+    Compressed files cannot be mapped and are loaded in memory instead.
+
+    Args:
+        file_name (string): name of a file to read from
+        compression (string): compression of the file, None if not compressed
+
+    Returns:
+        numpy.memmap: numbers stored in the file
+    """
+
+    if compression is None:
+        data = np.load(file_name, mmap_mode='r')
+    else:
+        with _open_data_file(file_name, compression, 'rb') as file:
+            data = np.load(file)
+    if data.dtype != np.float64 or data.ndim != 1:
+        raise ValueError('{} does not contain a one dimensional float64 array'.format(file_name))
+    return data
+
+
+def _read_excel_file(file_name, header, report, sheet_name=0, column=0,
+                     compression=None):
+    """Reads one column of an excel file into a float64 numpy array.
+
+    Only the requested column is loaded, and it is converted as a whole:
+    the cells which are not numbers are recorded together and skipped.
+
+    Args:
+        file_name (string): name of a file to read from
+        header (int or None): row containing the header, if any
+        report (ParseReport): report of the invalid values
+        sheet_name (string or int): name or position of the sheet
+        column (string or int): name or position of the column
+        compression (string): compression of the file, None if not compressed
+
+    Returns:
+        numpy.ndarray: numbers found in the file
+    """
+    # pandas is slow to import and only needed for excel files
+    import pandas as pd
+
+    if compression is None:
+        df = pd.read_excel(file_name, header=header, sheet_name=sheet_name,
+                           usecols=[column])
+    else:
+        with _open_data_file(file_name, compression, 'rb') as file:
+            df = pd.read_excel(file, header=header, sheet_name=sheet_name,
+                               usecols=[column])
+    cells = df.iloc[:, 0]
+    numbers = pd.to_numeric(cells, errors='coerce')
+
+    # Empty cells stay NaN, only cells holding something else are invalid
+    invalid = numbers.isna() & cells.notna()
+    if invalid.any():
+        # Excel rows are numbered from 1 and start after the header row
+        first_row = 1 if header is None else header + 2
+        positions = np.flatnonzero(invalid.to_numpy())[:report.max_samples]
+        report.add_many(cells.iloc[positions].tolist(),
+                        (positions + first_row).tolist(), int(invalid.sum()))
+        numbers = numbers[~invalid]
+    return numbers.to_numpy(dtype=np.float64)
+
+
+def _split_block(block, separator):
+    """Splits a block of text at the last complete token.
+
+    Args:
+        block (string): text read from the file
+        separator (character): separator used in the file
+
+    Returns:
+        string: text made of complete tokens only
+        string: trailing partial token to be carried to the next block
+    """
+
+    cut = block.rfind('\n')
+    if cut == -1:
+        if separator == '\\n' or separator == ' ':
+            cut = max(block.rfind(' '), block.rfind('\t'))
+        else:
+            cut = block.rfind(separator)
+    if cut == -1:
+        return '', block
+    return block[:cut + 1], block[cut + 1:]
+
+
+def _iter_text_blocks(file, separator, block_size=BLOCK_SIZE):
+    """Generator reading an open text file in large blocks which never
+    cut a number in two.
+
+    Args:
+        file (file object): text file opened for reading
+        separator (character): separator used in the file
+        block_size (int): number of characters to read at a time
+
+    Yields:
+        string: block of text made of complete tokens
+    """
+
+    remainder = ''
+    block = file.read(block_size)
+    while block:
+        complete, remainder = _split_block(remainder + block, separator)
+        if complete:
+            yield complete
+        block = file.read(block_size)
+    if remainder:
+        yield remainder
+
+
+class ParseReport:
+    """ Summary of the values which could not be converted to numbers
+    while reading a data file.
+
+    Only the number of invalid values and the first few of them are
+    kept, so reading a file full of invalid values stays cheap.
+
+    Attributes:
+        errors (string) how invalid values are handled, one of 'raise',
+        'skip' or 'collect'
+        count (int) number of invalid values found
+        values (list of strings) first invalid values found
+        lines (list of ints) line (or excel row) number of each of these values
+    """
+
+    def __init__(self, errors='skip', max_samples=MAX_SAMPLES):
+
+        if errors not in ERROR_MODES:
+            raise ValueError('errors has to be one of ' + ', '.join(ERROR_MODES))
+
+        self.errors = errors
+        self.max_samples = max_samples
+        self.count = 0
+        self.values = []
+        self.lines = []
+
+    def add(self, value, line):
+        """Function to record an invalid value.
+
+        Args:
+            value (string): value which could not be converted
+            line (int): line number of the value
+
+        Returns:
+            None
+        """
+
+        self.add_many([value], [line], 1)
+
+    def add_many(self, values, lines, count):
+        """Function to record a batch of invalid values at once.
+
+        Args:
+            values (list): invalid values, only the first ones are kept
+            lines (list of ints): line numbers of the values
+            count (int): number of invalid values in the batch
+
+        Returns:
+            None
+        """
+
+        if self.errors == 'raise':
+            raise ValueError('Could not convert {!r} on line {} to float'.format(values[0], lines[0]))
+
+        room = self.max_samples - len(self.values)
+        self.values.extend(values[:room])
+        self.lines.extend(lines[:room])
+        self.count += count
+
+    def __repr__(self):
+        """Function to output the summary of the invalid values
+
+        Args:
+            None
+
+        Returns:
+            string: summary of the invalid values
+        """
+
+        samples = ', '.join('{!r} (line {})'.format(value, line)
+                            for value, line in zip(self.values, self.lines))
+        return "{} values could not be converted to float: {}".format(self.count, samples)
+
+
+def _parse_tokens(text, separator, report, first_line=1):
+    """Slow path converting the numbers of a block one at a time,
+    recording the tokens which are not numbers in the report.
+
+    Args:
+        text (string): block of text to convert
+        separator (character): separator used in the text
+        report (ParseReport): report of the invalid values
+        first_line (int): line number of the start of the block
+
+    Returns:
+        list: numbers found in the text
+    """
+
+    data_list = []
+    for line_number, line in enumerate(text.splitlines(), first_line):
+        # Stripping white spaces from start and end of string
+        line = line.strip()
+
+        # If text is space or newline seperated
+        if separator == '\\n' or separator == ' ':
+            # Splitting text with space seperaor
+            line = line.split()
+        else:
+            # Splitting text based on custom separator
+            line = line.split(separator)
+        for number in line:
+            try:
+                data_list.append(float(number))
+            except ValueError:
+                # Blank lines and trailing separators are not values
+                if number.strip():
+                    report.add(number, line_number)
+    return data_list
+
+
+def _parse_text_block(text, separator, report, first_line=1):
+    """Converts a block of text into a float64 numpy array.
+
+    The whole block is handed to numpy's C parser at once, and only
+    blocks containing something else than numbers go through the slow
+    token by token path.
+
+    Args:
+        text (string): block of text to convert
+        separator (character): separator used in the text
+        report (ParseReport): report of the invalid values
+        first_line (int): line number of the start of the block
+
+    Returns:
+        numpy.ndarray: numbers found in the text
+    """
+
+    # numpy reads a block of only white spaces, or trailing ones, as -1
+    if not text.strip():
+        return np.empty(0)
+    if separator == '\\n' or separator == ' ':
+        sep = ' '
+        joined = text.strip()
+    else:
+        sep = separator
+        joined = text.strip().replace('\n', separator)
+    try:
+        with warnings.catch_warnings():
+            # Older numpy versions only warn on unparsable data
+            warnings.simplefilter('error', DeprecationWarning)
+            return np.fromstring(joined, dtype=np.float64, sep=sep)
+    except (ValueError, DeprecationWarning):
+        return np.array(_parse_tokens(text, separator, report, first_line),
+                        dtype=np.float64)
+
+
+def _iter_parsed_blocks(file, separator, report, block_size=BLOCK_SIZE):
+    """Generator converting an open text file block by block.
+
+    Args:
+        file (file object): text file opened for reading
+        separator (character): separator used in the file
+        report (ParseReport): report of the invalid values
+        block_size (int): number of characters to read at a time
+
+    Yields:
+        numpy.ndarray: numbers found in each block
+    """
+
+    first_line = 1
+    for text in _iter_text_blocks(file, separator, block_size):
+        yield _parse_text_block(text, separator, report, first_line)
+        first_line += text.count('\n')
+
+
+def _read_text_file(file_name, separator, report=None, compression=None,
+                    block_size=BLOCK_SIZE):
+    """Reads a whole text file into a contiguous float64 numpy array.
+
+    Args:
+        file_name (string): name of a file to read from
+        separator (character): separator used in the file
+        report (ParseReport): report of the invalid values
+        compression (string): compression of the file, None if not compressed
+        block_size (int): number of characters to read at a time
+
+    Returns:
+        numpy.ndarray: numbers found in the file
+    """
+
+    if report is None:
+        report = ParseReport()
+    with _open_data_file(file_name, compression) as file:
+        blocks = list(_iter_parsed_blocks(file, separator, report, block_size))
+    if not blocks:
+        return np.empty(0, dtype=np.float64)
+    return np.concatenate(blocks)
+
+
+def _read_data_file(file_name, separator, header, sheet_name, column, report):
+    """Reads a whole data file of any supported format into a float64
+    numpy array.
+
+    Args:
+        file_name (string): name of a file or of a demo dataset
+        separator (character): separator used in text files
+        header (int or None): row containing the excel header, if any
+        sheet_name (string or int): name or position of the excel sheet
+        column (string or int): name or position of the excel column
+        report (ParseReport): report of the invalid values
+
+    Returns:
+        numpy.ndarray: numbers found in the file, memory-mapped for
+        binary files
+    """
+
+    file_name, extension, separator, compression = _resolve_file_name(file_name, separator)
+
+    if extension == BINARY_FORMAT:
+        return _read_binary_file(file_name, compression)
+    if extension in EXCEL_FORMATS:
+        return _read_excel_file(file_name, header, report, sheet_name,
+                                column, compression)
+    return _read_text_file(file_name, separator, report, compression)
+
+
+class _DataCache:
+    """ Least recently used cache of parsed data files, bounded by the
+    memory used by the cached arrays.
+
+    Cached arrays are read-only so that every distribution reading the
+    same file shares them. An entry is only found again while the file
+    keeps the same modification time and size. Other arrays shared by
+    distributions, such as the tables of Binomial, use the same cache
+    with their own keys.
+    """
+
+    def __init__(self, max_bytes=DATA_CACHE_BYTES):
+
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def key(self, file_name, *options):
+        """Builds the key of a file, None if the file is not cached."""
+
+        file_name = _find_file(file_name)
+        if file_name.split('.')[-1] == BINARY_FORMAT or self.max_bytes <= 0:
+            return None
+        stat = os.stat(file_name)
+        return (os.path.realpath(file_name), stat.st_mtime_ns, stat.st_size) + options
+
+    def get(self, key):
+        """Returns the cached data and report of a key, None if missing."""
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key, data, report):
+        """Caches the data and report of a key, evicting the least
+        recently used entries to stay within max_bytes."""
+
+        if data.nbytes > self.max_bytes:
+            return
+        data.flags.writeable = False
+        with self.lock:
+            if key in self.entries:
+                return
+            self.entries[key] = (data, report)
+            self.bytes += data.nbytes
+            while self.bytes > self.max_bytes:
+                _, (evicted, _) = self.entries.popitem(last=False)
+                self.bytes -= evicted.nbytes
+
+    def clear(self):
+        """Removes every entry and resets the hit counters."""
+
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Returns the statistics of the cache as a dictionary."""
+
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'hit_rate': self.hits / lookups if lookups else 0.0,
+                    'entries': len(self.entries),
+                    'bytes': self.bytes,
+                    'max_bytes': self.max_bytes}
+
+
+_data_cache = _DataCache()
+
+
+def _read_data_file_cached(file_name, separator, header, sheet_name, column, report):
+    """Reads a whole data file through the cache of parsed data files.
+
+    The values skipped when the file was parsed are added to report
+    again on every cache hit.
+
+    Args:
+        file_name (string): name of a file or of a demo dataset
+        separator (character): separator used in text files
+        header (int or None): row containing the excel header, if any
+        sheet_name (string or int): name or position of the excel sheet
+        column (string or int): name or position of the excel column
+        report (ParseReport): report of the invalid values
+
+    Returns:
+        numpy.ndarray: numbers found in the file, read-only when cached
+    """
+
+    key = _data_cache.key(file_name, separator, header, sheet_name, column)
+    if key is None:
+        return _read_data_file(file_name, separator, header, sheet_name, column, report)
+
+    entry = _data_cache.get(key)
+    if entry is not None:
+        data, cached_report = entry
+        if cached_report.count:
+            report.add_many(cached_report.values, cached_report.lines, cached_report.count)
+        return data
+
+    # The cached report is replayed by later reads, whatever their errors mode
+    file_report = ParseReport('raise' if report.errors == 'raise' else 'collect')
+    data = _read_data_file(file_name, separator, header, sheet_name, column, file_report)
+    if file_report.count:
+        report.add_many(file_report.values, file_report.lines, file_report.count)
+    _data_cache.put(key, data, file_report)
+    return data
+
+
+def _read_data_file_task(task):
+    """Reads one data file in a worker process of read_data_files.
+
+    Args:
+        task (tuple): file name, separator, header, sheet name, column
+        and errors mode
+
+    Returns:
+        numpy.ndarray: numbers found in the file
+        ParseReport: report of the invalid values of the file
+    """
+
+    file_name, separator, header, sheet_name, column, errors = task
+    report = ParseReport(errors)
+    data = _read_data_file(file_name, separator, header, sheet_name, column, report)
+    return np.asarray(data), report
+
+
+def _fit_columns(cls):
+    """Names of the parameters of a distribution class, the fields of the
+    table returned by fit_many after the count of values."""
+
+    return tuple(name for base in reversed(cls.__mro__)
+                 for name, value in vars(base).items() if isinstance(value, _Parameter))
+
+
+def _fit_row(cls, data):
+    """Fits a new distribution of class cls to data.
+
+    Returns:
+        tuple: number of values, then the value of each parameter
+    """
+
+    distribution = cls()
+    summary = distribution.summarize(data)
+    distribution.replace_stats_with_summary(summary)
+    distribution._update_moments()
+    return (summary.count,) + tuple(getattr(distribution, name) for name in _fit_columns(cls))
+
+
+def _fit_task(cls, batch, options, shared):
+    """Builds the task of fit_many fitting a batch of data sets, copying
+    their arrays, if shared, into a new block of shared memory.
+
+    Args:
+        cls (class): distribution class to fit
+        batch (list): (index, source) pairs, source being a file name or
+        a numpy array
+        options (tuple): separator, header, sheet name, column and errors
+        mode used to read the files
+        shared (bool): whether the task is sent to another process
+
+    Returns:
+        tuple: the task for _fit_many_task
+        SharedMemory: the block of shared memory, None if not needed
+    """
+
+    size = sum(source.nbytes for _, source in batch if not isinstance(source, str))
+    if not shared or not size or shared_memory is None:
+        return (cls, None, batch, options), None
+
+    memory = shared_memory.SharedMemory(create=True, size=size)
+    datasets = []
+    offset = 0
+    for index, source in batch:
+        if not isinstance(source, str):
+            np.ndarray(source.shape, np.float64, memory.buf, offset)[:] = source
+            source = (offset, len(source))
+            offset += source[1] * 8
+        datasets.append((index, source))
+    return (cls, memory.name, datasets, options), memory
+
+
+def _fit_many_task(task):
+    """Fits a batch of data sets, in a worker process of fit_many.
+
+    Args:
+        task (tuple): distribution class, name of the block of shared
+        memory or None, (index, source) pairs where source is a file name,
+        an array or the offset and length of an array in the shared
+        memory, and the options used to read the files
+
+    Returns:
+        list: (index, row) pairs, see _fit_row
+    """
+
+    cls, memory_name, datasets, options = task
+    separator, header, sheet_name, column, errors = options
+    memory = shared_memory.SharedMemory(memory_name) if memory_name else None
+    try:
+        rows = []
+        for index, source in datasets:
+            if isinstance(source, str):
+                data = _read_data_file(source, separator, header, sheet_name, column,
+                                       ParseReport(errors))
+            elif isinstance(source, tuple):
+                data = np.ndarray((source[1],), np.float64, memory.buf, source[0])
+            else:
+                data = source
+            rows.append((index, _fit_row(cls, data)))
+            del data
+        return rows
+    finally:
+        if memory is not None:
+            try:
+                memory.close()
+            except BufferError:
+                # an array of the block is still referenced by the traceback
+                # of an error, the block is unmapped when it is collected
+                pass
+
+
+def _rechunk(arrays, chunk_size):
+    """Generator regrouping a stream of arrays of any length into
+    chunks of chunk_size values.
+
+    Args:
+        arrays (iterable): numpy arrays to regroup
+        chunk_size (int): number of values per chunk
+
+    Yields:
+        numpy.ndarray: chunk_size values, the last chunk may be shorter
+    """
+
+    buffer = np.empty(0, dtype=np.float64)
+    for array in arrays:
+        buffer = np.concatenate((buffer, array))
+        while len(buffer) >= chunk_size:
+            yield buffer[:chunk_size]
+            buffer = buffer[chunk_size:]
+    if len(buffer):
+        yield buffer
+
+
+class RunningStats:
+    """ Count, mean, sum of squared deviations, minimum and maximum of a
+    stream of numbers, updated in a single numerically stable pass.
+
+    Single values are added with Welford's update, and arrays and other
+    RunningStats are merged with the parallel formula of Chan et al., so
+    statistics computed per chunk, shard or thread combine exactly. They
+    are the sufficient statistics from which most distributions fit
+    their parameters, see Distribution.summarize.
+
+    Attributes:
+        count (int) number of values seen
+        mean (float) mean of the values
+        m2 (float) sum of the squared deviations of the values from the mean
+        minimum (float) smallest value, inf if there are none
+        maximum (float) largest value, -inf if there are none
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'minimum', 'maximum')
+
+    def __init__(self, values=()):
+
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.update(values)
+
+    def update(self, values):
+        """Function to add a value, or an array of values, to the statistics.
+
+        Args:
+            values (float or array-like): new values
+
+        Returns:
+            RunningStats: the updated statistics
+        """
+
+        if not _is_array(values):
+            value = float(values)
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (value - self.mean)
+            self.minimum = min(self.minimum, value)
+            self.maximum = max(self.maximum, value)
+            return self
+
+        # Large arrays, such as memory-mapped data, are read CHUNK_SIZE
+        # values at a time to bound the memory of the temporaries
+        values = np.asarray(values, dtype=np.float64).ravel()
+        for start in range(0, len(values), CHUNK_SIZE):
+            self._update_chunk(values[start:start + CHUNK_SIZE])
+        return self
+
+    def _update_chunk(self, values):
+        mean = float(values.mean())
+        self._combine(len(values), mean, float(((values - mean) ** 2).sum()),
+                      float(values.min()), float(values.max()))
+
+    def merge(self, other):
+        """Function to add the values seen by other RunningStats.
+
+        Args:
+            other (RunningStats): statistics of other values
+
+        Returns:
+            RunningStats: the updated statistics
+        """
+
+        if other.count:
+            self._combine(other.count, other.mean, other.m2, other.minimum, other.maximum)
+        return self
+
+    def _combine(self, count, mean, m2, minimum, maximum):
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta ** 2 * self.count * count / total
+        self.count = total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    def variance(self, sample=True):
+        """Function to calculate the variance of the values.
+
+        Args:
+            sample (bool): whether the values represent a sample or population
+
+        Returns:
+            float: variance of the values
+        """
+
+        degrees = self.count - 1 if sample else self.count
+        if degrees < 1:
+            raise ValueError('At least {} values are needed for the variance'.format(2 if sample else 1))
+        return self.m2 / degrees
+
+    def stdev(self, sample=True):
+        """Function to calculate the standard deviation of the values.
+
+        Args:
+            sample (bool): whether the values represent a sample or population
+
+        Returns:
+            float: standard deviation of the values
+        """
+
+        return math.sqrt(self.variance(sample))
+
+    def to_dict(self):
+        """Function to export the statistics as a dictionary of numbers,
+        for example to send them as json.
+
+        Args:
+            None
+
+        Returns:
+            dict: value of each attribute
+        """
+
+        return {'count': self.count, 'mean': self.mean, 'm2': self.m2,
+                'minimum': self.minimum, 'maximum': self.maximum}
+
+    @classmethod
+    def from_dict(cls, values):
+        """Function to import statistics exported by to_dict.
+
+        Args:
+            values (dict): value of each attribute
+
+        Returns:
+            RunningStats: the statistics
+        """
+
+        stats = cls()
+        for name, value in values.items():
+            setattr(stats, name, value)
+        return stats
+
+    def __repr__(self):
+        return 'count {}, mean {}, m2 {}, minimum {}, maximum {}'.format(
+            self.count, self.mean, self.m2, self.minimum, self.maximum)
+
+
+class DataArray(MutableSequence):
+    """ Array of float64 values storing the data of a distribution.
+
+    It takes 8 bytes per value where a list of floats takes about 32,
+    and numpy can use it without copying it through np.asarray. It
+    behaves like a list of floats: it can be indexed, sliced, iterated,
+    appended to, sorted, concatenated with + and repeated with *, and
+    compares equal to a list holding the same numbers.
+
+    Read-only numpy arrays, such as memory-mapped files or cached data
+    files, are shared rather than copied, and only copied the first time
+    the DataArray is modified.
+    """
+
+    __slots__ = ('_values', '_size')
+
+    def __init__(self, values=(), copy=True):
+
+        if isinstance(values, DataArray):
+            values = values._view()
+        if not isinstance(values, (np.ndarray, list, tuple)):
+            values = list(values)
+        if (copy and isinstance(values, np.ndarray)
+                and (values.flags.writeable or values.dtype != np.float64)):
+            values = np.array(values, dtype=np.float64)
+        else:
+            values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError('data has to be one dimensional')
+
+        self._values = values
+        self._size = len(values)
+
+    def _view(self):
+
+        return self._values[:self._size]
+
+    def _reserve(self, size):
+        """Makes the DataArray writeable and able to hold size values,
+        growing its buffer geometrically like a list does."""
+
+        capacity = len(self._values)
+        if self._values.flags.writeable and size <= capacity:
+            return
+        if size > capacity:
+            capacity = max(size, 2 * capacity, 8)
+        values = np.empty(capacity, dtype=np.float64)
+        values[:self._size] = self._view()
+        self._values = values
+
+    def _replace(self, values):
+
+        self._values = np.ascontiguousarray(values, dtype=np.float64)
+        self._size = len(self._values)
+
+    def __array__(self, dtype=None, copy=None):
+
+        view = self._view()
+        if copy:
+            view = view.copy()
+        if dtype is not None:
+            view = view.astype(dtype, copy=False)
+        return view
+
+    def __len__(self):
+
+        return self._size
+
+    def __getitem__(self, index):
+
+        if isinstance(index, slice):
+            return DataArray(self._view()[index])
+        return float(self._view()[index])
+
+    def __setitem__(self, index, value):
+
+        if isinstance(index, slice):
+            values = self.tolist()
+            values[index] = value
+            self._replace(values)
+        else:
+            self._reserve(self._size)
+            self._view()[index] = value
+
+    def __delitem__(self, index):
+
+        self._replace(np.delete(self._view(), index))
+
+    def __iter__(self):
+
+        # Converting a block at a time is much faster than yielding numpy
+        # scalars, without converting the whole array at once
+        view = self._view()
+        for start in range(0, self._size, BLOCK_SIZE):
+            yield from view[start:start + BLOCK_SIZE].tolist()
+
+    def insert(self, index, value):
+
+        self._replace(np.insert(self._view(), index, value))
+
+    def append(self, value):
+
+        self._reserve(self._size + 1)
+        self._values[self._size] = value
+        self._size += 1
+
+    def extend(self, values):
+
+        values = np.asarray(values if isinstance(values, (np.ndarray, list, tuple, DataArray))
+                            else list(values), dtype=np.float64)
+        self._reserve(self._size + len(values))
+        self._values[self._size:self._size + len(values)] = values
+        self._size += len(values)
+
+    def sort(self, key=None, reverse=False):
+
+        if key is None:
+            values = np.sort(self._view())
+            self._replace(values[::-1] if reverse else values)
+        else:
+            self._replace(sorted(self, key=key, reverse=reverse))
+
+    def reverse(self):
+
+        self._replace(self._view()[::-1])
+
+    def copy(self):
+
+        return self.__copy__()
+
+    def tolist(self):
+
+        return self._view().tolist()
+
+    # + and * concatenate and repeat, as they do for lists, rather than
+    # act on the values like numpy arrays
+
+    def __add__(self, other):
+
+        if not isinstance(other, (DataArray, list, tuple)):
+            return NotImplemented
+        return DataArray(np.concatenate([self._view(), np.asarray(other, dtype=np.float64)]),
+                         copy=False)
+
+    def __radd__(self, other):
+
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return DataArray(np.concatenate([np.asarray(other, dtype=np.float64), self._view()]),
+                         copy=False)
+
+    def __iadd__(self, other):
+
+        self.extend(other)
+        return self
+
+    def __mul__(self, count):
+
+        if not isinstance(count, int):
+            return NotImplemented
+        return DataArray(np.tile(self._view(), max(count, 0)), copy=False)
+
+    __rmul__ = __mul__
+
+    def __imul__(self, count):
+
+        if not isinstance(count, int):
+            return NotImplemented
+        self._replace(np.tile(self._view(), max(count, 0)))
+        return self
+
+    def __eq__(self, other):
+
+        if isinstance(other, (DataArray, list, tuple, np.ndarray)):
+            return len(self) == len(other) and bool(np.all(self._view() == np.asarray(other)))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __copy__(self):
+
+        return DataArray(self._view().copy(), copy=False)
+
+    def __deepcopy__(self, memo):
+
+        return self.__copy__()
+
+    def __reduce__(self):
+
+        return DataArray, (self._view().copy(), False)
+
+    def __repr__(self):
+
+        return repr(self.tolist())
+
+
+def _as_data(values):
+    """Converts values to the DataArray used for the data attribute.
+
+    Args:
+        values (iterable): numbers to store
+
+    Returns:
+        DataArray: the stored numbers
+    """
+
+    if isinstance(values, DataArray):
+        return values
+    return DataArray(values)
+
+
+def _is_array(x):
+    """Whether x holds several points rather than a single one. Python
+    numbers are checked first, since np.ndim converts them to arrays,
+    which costs more than evaluating most distributions at one point."""
+
+    if isinstance(x, (float, int)):
+        return False
+    return np.ndim(x) > 0
+
+
+def _evaluate(kernel, x):
+    """Applies a vectorized kernel to a point or an array of points,
+    returning a float for a point and a numpy array otherwise."""
+
+    value = kernel(np.asarray(x, dtype=np.float64))
+    if _is_array(x):
+        return value
+    return float(value)
+
+
+class _Parameter(property):
+    """Parameter of a distribution, stored in the slot of the same name
+    with a leading underscore. Assigning it clears the constants cached by
+    Distribution._constants, which are derived from the parameters."""
+
+    def __init__(self, name):
+
+        slot = '_' + name
+
+        def set_value(distribution, value):
+            setattr(distribution, slot, value)
+            distribution._cache = None
+
+        property.__init__(self, operator.attrgetter(slot), set_value)
 
 
 class Distribution:
     """ Generic distribution class for calculating and
         visualizing a probability distribution.
 
-    Attributes:
-        mean (float) representing the mean value of the distribution
-        stdev (float) representing the standard deviation of the distribution
-        data (list of floats) extracted from the data file
-        pdf (float) representing the Probability density function
-        cdf (float) representing the Cumulative distribution function
-    """
+    Attributes:
+        mean (float) representing the mean value of the distribution
+        stdev (float) representing the standard deviation of the distribution
+        data (DataArray of floats) extracted from the data file
+        pdf (float) representing the Probability density function
+        cdf (float) representing the Cumulative distribution function
+    """
+
+    __slots__ = ('_mean', '_stdev', '_data', 'pdf', 'cdf', '_cache')
+
+    mean = _Parameter('mean')
+    stdev = _Parameter('stdev')
+
+    # Sufficient statistics of a data set, see summarize
+    summary_class = RunningStats
+
+    def __init__(self, mu=0, sigma=1):
+
+        self.mean = mu
+        self.stdev = sigma
+        self.data = []
+        self.pdf = None
+        self.cdf = None
+
+    @property
+    def data(self):
+        """DataArray of the numbers of the data set. Lists and other
+        sequences assigned to it are converted."""
+
+        return self._data
+
+    @data.setter
+    def data(self, values):
+
+        self._data = _as_data(values)
+
+    def read_data_file(self, file_name, separator='\\n', header=None,
+                       sheet_name=0, column=0, errors='skip'):
+
+        """Function to read in data from a txt file, csv file
+        and excel formats (xls, xlsx, xlsm, xlsb, odf, ods and odt)
+
+        The txt file should have one number (float) per line or
+        numbers should be separator seperated.
+
+        No need for separator argument with csv file, it will
+        by default be ',' so csv files should have , seperated
+        numbers
+
+        For excel file formats. The numbers are read from the column
+        and sheet given by name or position (the first column of the
+        first sheet by default), and if 0th row is header then header
+        argument should be 0. The numbers are taken from next row
+        mentioned in header parameter.
+
+        Binary npy files written by save_data_file are memory-mapped
+        instead of being parsed: the data attribute is then a read-only
+        numpy array backed by the file.
+
+        Files compressed with gzip, bz2 or xz, found from their .gz, .bz2
+        or .xz extension or from their first bytes, are decompressed on
+        the fly without any intermediate file.
+
+        Values which are not numbers either raise a ValueError
+        (errors='raise'), or are skipped and summarized in one warning
+        (errors='skip') or silently (errors='collect'). Blank lines and
+        empty excel cells are not considered as invalid values.
+
+        Text and excel files are parsed once and then served from an in
+        memory cache while they are not modified, see data_cache_info.
+        Distributions reading the same file share its numbers until one
+        of them modifies its data.
+
+        The numbers are stored in the data attribute.
+
+        Args:
+                file_name (string): name of a file to read from
+                separator (character): custom separator to use if required
+                header (int or by default None): to specify if excel file
+                contains header.
+                sheet_name (string or int): excel sheet to read from
+                column (string or int): excel column to read from
+                errors (string): 'raise', 'skip' or 'collect', how to
+                handle values which are not numbers
+        Returns:
+                ParseReport: summary of the values which were skipped
+        """
+
+        report = ParseReport(errors)
+        data = _read_data_file_cached(file_name, separator, header, sheet_name,
+                                      column, report)
+
+        if report.count and errors == 'skip':
+            warnings.warn(repr(report))
+
+        self.data = DataArray(data, copy=False)
+
+        return report
+
+    def read_data_files(self, file_names, separator='\\n', header=None,
+                        sheet_name=0, column=0, errors='skip', workers=None):
+
+        """Function to read in data from several files in parallel, one
+        process per file at a time, and store all their numbers in the
+        data attribute.
+
+        The files can be of any format accepted by read_data_file and
+        are merged in a deterministic order: the order of the list, or
+        the alphabetical order of the files matching a glob pattern.
+
+        Args:
+                file_names (string or list of strings): glob pattern
+                such as 'shards/*.txt', or list of files to read from
+                separator (character): custom separator to use if required
+                header (int or by default None): to specify if excel files
+                contain header.
+                sheet_name (string or int): excel sheet to read from
+                column (string or int): excel column to read from
+                errors (string): 'raise', 'skip' or 'collect', how to
+                handle values which are not numbers
+                workers (int): number of processes, by default the number
+                of CPUs. With 1 worker the files are read in this process.
+        Returns:
+                ParseReport: summary of the values which were skipped,
+                with line numbers relative to their own file
+        """
+
+        if isinstance(file_names, str):
+            file_names = sorted(glob.glob(file_names))
+        if not file_names:
+            raise ValueError('No data file to read')
+        if workers is None:
+            workers = os.cpu_count() or 1
+        workers = min(workers, len(file_names))
 
-    def __init__(self, mu=0, sigma=1):
+        tasks = [(file_name, separator, header, sheet_name, column, errors)
+                 for file_name in file_names]
+        if workers == 1:
+            results = [_read_data_file_task(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_read_data_file_task, tasks))
 
-        self.mean = mu
-        self.stdev = sigma
-        self.data = []
-        self.pdf = None
-        self.cdf = None
+        report = ParseReport(errors)
+        for _, file_report in results:
+            if file_report.count:
+                report.add_many(file_report.values, file_report.lines,
+                                file_report.count)
+        if report.count and errors == 'skip':
+            warnings.warn(repr(report))
 
-    def read_data_file(self, file_name, separator='\\n', header=None):
+        self.data = DataArray(np.concatenate([data for data, _ in results]), copy=False)
 
-        """Function to read in data from a txt file, csv file
-        and excel formats (xls, xlsx, xlsm, xlsb, odf, ods and odt)
+        return report
 
-        The txt file should have one number (float) per line or
-        numbers should be separator seperated.
+    @classmethod
+    def iter_fit_many(cls, datasets, workers=None, batch_size=FIT_BATCH_SIZE,
+                      separator='\\n', header=None, sheet_name=0, column=0,
+                      errors='skip'):
 
-        No need for separator argument with csv file, it will
-        by default be ',' so csv files should have , seperated
-        numbers
+        """Generator fitting a new distribution to each of many independent
+        data sets in parallel processes, yielding the results as they
+        finish, in any order.
 
-        For excel file formats. There should only be one column
-        containing numbers, and if 0th row is header then header
-        argument should be 0. The numbers are taken from next row
-        mentioned in header parameter.
+        The data sets are sent to the workers in batches of batch_size.
+        Files are read by the workers, and arrays are copied to them
+        through a block of shared memory per batch. At most two batches
+        per worker are in flight, so datasets can be a long, lazy
+        iterable.
 
-        The numbers are stored in the data attribute.
+        Args:
+                datasets (iterable): file names, read as by
+                read_data_file, or array-like data sets
+                workers (int): number of processes, by default the number
+                of CPUs. With 1 worker the data sets are fitted in this
+                process.
+                batch_size (int): number of data sets per task
+                separator, header, sheet_name, column, errors: options
+                used to read the files, see read_data_file
+        Yields:
+                int: position of the data set in datasets
+                tuple: its number of values then its fitted parameters, in
+                the order of the fields of the table of fit_many
+        """
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        options = (separator, header, sheet_name, column, errors)
+
+        def batches():
+            batch = []
+            size = 0
+            for index, dataset in enumerate(datasets):
+                if isinstance(dataset, (str, os.PathLike)):
+                    batch.append((index, os.fspath(dataset)))
+                else:
+                    dataset = np.asarray(dataset, dtype=np.float64).ravel()
+                    batch.append((index, dataset))
+                    size += dataset.nbytes
+                if len(batch) >= batch_size or size >= FIT_BATCH_BYTES:
+                    yield _fit_task(cls, batch, options, workers > 1)
+                    batch = []
+                    size = 0
+            if batch:
+                yield _fit_task(cls, batch, options, workers > 1)
+
+        if workers == 1:
+            for task, _ in batches():
+                yield from _fit_many_task(task)
+            return
+
+        # block of shared memory of each batch in flight
+        pending = {}
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            tasks = batches()
+            while True:
+                for task, memory in tasks:
+                    pending[executor.submit(_fit_many_task, task)] = memory
+                    if len(pending) >= 2 * workers:
+                        break
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    memory = pending.pop(future)
+                    if memory is not None:
+                        memory.close()
+                        memory.unlink()
+                    yield from future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+            for memory in pending.values():
+                if memory is not None:
+                    memory.close()
+                    memory.unlink()
+
+    @classmethod
+    def fit_many(cls, datasets, workers=None, batch_size=FIT_BATCH_SIZE,
+                 separator='\\n', header=None, sheet_name=0, column=0,
+                 errors='skip'):
+
+        """Function to fit a new distribution to each of many independent
+        data sets in parallel processes, see iter_fit_many.
+
+        Args:
+                datasets (iterable): file names, read as by
+                read_data_file, or array-like data sets
+                workers (int): number of processes, by default the number
+                of CPUs
+                batch_size (int): number of data sets per task
+                separator, header, sheet_name, column, errors: options
+                used to read the files, see read_data_file
+        Returns:
+                numpy.ndarray: structured array with one row per data set,
+                in the order of datasets, and the fields count, the number
+                of values, then mean, stdev and the other parameters
+        """
+
+        rows = dict(cls.iter_fit_many(datasets, workers, batch_size, separator,
+                                      header, sheet_name, column, errors))
+        dtype = [('count', np.int64)] + [(name, np.float64) for name in _fit_columns(cls)]
+        return np.array([rows[index] for index in range(len(rows))], dtype=dtype)
+
+    @staticmethod
+    def data_cache_info():
+
+        """Function to report the statistics of the cache of parsed data
+        files shared by every distribution of the process.
+
+        read_data_file keeps the numbers of text and excel files in this
+        cache, keyed by file, modification time, size and reading
+        options, so reading an unchanged file again skips parsing it.
+
+        Args:
+                None
+        Returns:
+                dict: hits, misses, hit_rate, entries, bytes and max_bytes
+        """
+
+        return _data_cache.info()
+
+    @staticmethod
+    def clear_data_cache():
+
+        """Function to empty the cache of parsed data files and reset its
+        statistics.
+
+        Args:
+                None
+        Returns:
+                None
+        """
+
+        _data_cache.clear()
+
+    @staticmethod
+    def resize_data_cache(max_bytes):
+
+        """Function to change the memory available to the cache of parsed
+        data files. The cache is emptied, and disabled when max_bytes is 0.
+
+        Args:
+                max_bytes (int): upper bound on the memory used by the
+                cached numbers
+        Returns:
+                None
+        """
+
+        _data_cache.clear()
+        _data_cache.max_bytes = max_bytes
+
+    def iter_data_file(self, file_name, separator='\\n', header=None,
+                       sheet_name=0, column=0, chunk_size=CHUNK_SIZE,
+                       errors='skip', report=None):
+
+        """Generator reading in data from the same file formats as
+        read_data_file, chunk_size numbers at a time.
+
+        Only one block of the file and one chunk are held in memory at
+        any time, so files larger than the memory can be processed.
+        The data attribute is left untouched.
+
+        Values which are not numbers are handled as in read_data_file,
+        with errors='skip' warning once the whole file has been read.
+        As a generator cannot return the summary, errors='collect' adds
+        the skipped values to the ParseReport given as report instead,
+        once the file has been read or the generator is closed.
 
         Args:
                 file_name (string): name of a file to read from
                 separator (character): custom separator to use if required
                 header (int or by default None): to specify if excel file
                 contains header.
+                sheet_name (string or int): excel sheet to read from
+                column (string or int): excel column to read from
+                chunk_size (int): number of values per chunk
+                errors (string): 'raise', 'skip' or 'collect', how to
+                handle values which are not numbers
+                report (ParseReport or None): summary to add the skipped
+                values to
+        Yields:
+                numpy.ndarray: chunk_size numbers, the last chunk may be
+                shorter
+        """
+
+        if chunk_size < 1:
+            raise ValueError('chunk_size has to be a positive integer')
+
+        file_report = ParseReport(errors)
+        file_name, extension, separator, compression = _resolve_file_name(file_name, separator)
+
+        try:
+            if extension == BINARY_FORMAT:
+                data = _read_binary_file(file_name, compression)
+                for start in range(0, len(data), chunk_size):
+                    yield data[start:start + chunk_size]
+            elif extension in EXCEL_FORMATS:
+                data = _read_excel_file(file_name, header, file_report, sheet_name,
+                                        column, compression)
+                yield from _rechunk([data], chunk_size)
+            else:
+                with _open_data_file(file_name, compression) as file:
+                    blocks = _iter_parsed_blocks(file, separator, file_report)
+                    yield from _rechunk(blocks, chunk_size)
+        finally:
+            if report is not None and file_report.count:
+                report.add_many(file_report.values, file_report.lines,
+                                file_report.count)
+
+        if file_report.count and errors == 'skip':
+            warnings.warn(repr(file_report))
+
+    def save_data_file(self, file_name):
+
+        """Function to save the data attribute to a binary npy file,
+        which read_data_file can then memory-map without parsing it.
+
+        The file is written next to its final location and moved into
+        place once complete, so processes reading it never see a
+        partially written file.
+
+        Args:
+                file_name (string): name of the file to write, it has to
+                end with .npy
         Returns:
                 None
         """
 
-        file_name_map = {
-            'demo_gaussian_data': 'numbers.txt',
-            'demo_binomial_data': 'numbers_binomial.txt',
-            'demo_exponential_data': 'numbers_exponential.txt',
-            'demo_gamma_data': 'numbers_gamma.txt',
-            'demo_uniform_data': 'numbers_uniform.txt',
-            'demo_bernoulli_data': 'numbers_bernoulli.txt',
-            'demo_triangular_data': 'numbers_triangular.txt'
-        }
-        if file_name in file_name_map:
-            dirname = Path(__file__).parent.parent.absolute()
-            file_name = str(Path(dirname, 'probdists/' + file_name_map[file_name]))
-
-        # Finding the file extension and selecting separator for csv file
-        extension = file_name.split('.')[-1]
-        if extension == 'csv':
-            separator = ','
-
-        excel_formats = {'xls', 'xlsx', 'xlsm', 'xlsb',
-                         'odf', 'ods', 'odt'}
-
-        if extension in excel_formats:
-            df = pd.read_excel(file_name, header=header)
-            data_list = []
-            for i in df.iterrows():
-                try:
-                    data_list.append(float(df.iat[i[0], 0]))
-                except:  # pylint: disable=W0702
-                    traceback.print_exc()
-                    print('Could not convert', df.iat[i[0], 0], ' to int.')
+        if file_name.split('.')[-1] != BINARY_FORMAT:
+            raise ValueError('Binary data files have to end with .' + BINARY_FORMAT)
+
+        # a unique temporary file, so concurrent writers never move each
+        # other's partial files into place
+        file = tempfile.NamedTemporaryFile(dir=os.path.dirname(file_name) or '.',
+                                           suffix='.tmp', delete=False)
+        try:
+            with file:
+                np.save(file, np.asarray(self.data, dtype=np.float64))
+            os.replace(file.name, file_name)
+        except BaseException:
+            os.remove(file.name)
+            raise
+
+    def summarize(self, data=None):
+
+        """Function to compute the sufficient statistics of a data set, all
+        that replace_stats_with_summary needs to fit the parameters.
+
+        The statistics of separate parts of a data set can be merged, in
+        any order, with their merge method, and exported to and imported
+        from a dictionary of numbers with to_dict and from_dict, so a fit
+        can be spread over many processes or machines.
+
+        Args:
+                data (array-like): data set, or a part of it.
+                [Default value: the data attribute]
+        Returns:
+                summary_class: statistics of the data set
+        """
+
+        return self.summary_class(self.data if data is None else data)
+
+    def replace_stats_with_chunks(self, chunks):
+
+        """Function to fit the parameters to a stream of data chunks, such
+        as the one returned by iter_data_file, without holding the whole
+        data set in memory.
+
+        Args:
+                chunks (iterable): array-like chunks of numbers
+        Returns:
+                the parameters, as returned by replace_stats_with_summary
+        """
+
+        summary = self.summary_class()
+        for chunk in chunks:
+            summary.update(chunk)
+        return self.replace_stats_with_summary(summary)
+
+    @classmethod
+    def from_summary(cls, summary):
+
+        """Function to create a distribution fitted to the sufficient
+        statistics of a data set, as returned by summarize.
+
+        Args:
+                summary (summary_class): statistics of the data set
+        Returns:
+                Distribution: the fitted distribution
+        """
+
+        distribution = cls()
+        distribution.replace_stats_with_summary(summary)
+        return distribution
+
+    def logpdf(self, x):
+
+        """Function to calculate the logarithm of the probability density
+        function, without rounding, so that it keeps its precision far in
+        the tails where the pdf itself underflows.
+
+        Args:
+                x (float or array-like): point(s) for calculating the log
+                of the probability density function
+        Returns:
+                float or numpy.ndarray: log of the probability density
+                function, -inf outside the support
+        """
+
+        return _evaluate(self._logpdf, x)
+
+    def logcdf(self, x):
+
+        """Function to calculate the logarithm of the cumulative
+        distribution function, without rounding.
+
+        Args:
+                x (float or array-like): point(s) for calculating the log
+                of the cumulative distribution function
+        Returns:
+                float or numpy.ndarray: log of the cumulative distribution
+                function
+        """
+
+        return _evaluate(self._logcdf, x)
+
+    def sf(self, x):
+
+        """Function to calculate the survival function, 1 - cdf, without
+        rounding and without the cancellation of computing 1 - cdf.
+
+        Args:
+                x (float or array-like): point(s) for calculating the
+                survival function
+        Returns:
+                float or numpy.ndarray: probability of exceeding x
+        """
+
+        return _evaluate(self._sf, x)
+
+    def logsf(self, x):
+
+        """Function to calculate the logarithm of the survival function,
+        without rounding.
+
+        Args:
+                x (float or array-like): point(s) for calculating the log
+                of the survival function
+        Returns:
+                float or numpy.ndarray: log of the probability of
+                exceeding x
+        """
+
+        return _evaluate(self._logsf, x)
+
+    def loglikelihood(self, data=None):
+
+        """Function to calculate the log-likelihood of a data set, the sum
+        of logpdf over its values. Arrays are evaluated CHUNK_SIZE values
+        at a time, which bounds the memory used by temporary arrays.
+
+        Args:
+                data (array-like or iterable): data set, or chunks of it
+                such as those returned by iter_data_file.
+                [Default value: the data attribute]
+        Returns:
+                float: log-likelihood, -inf if a value is outside the support
+        """
+
+        if data is None:
+            data = self.data
+        if hasattr(data, '__len__'):
+            values = np.asarray(data, dtype=np.float64).ravel()
+            chunks = (values[start:start + CHUNK_SIZE]
+                      for start in range(0, len(values), CHUNK_SIZE))
         else:
-            with open(file_name) as file:
-                data_list = []
-
-                # Reading whole file content as string
-                line = file.readline()
-
-                while line:
-                    # Stripping white spaces from start and end of string
-                    line = line.strip()
-
-                    # If text is space or newline seperated
-                    if separator == '\\n' or separator == ' ':
-                        # Splitting text with space seperaor
-                        line = line.split()
-                    else:
-                        # Splitting text based on custom separator
-                        line = line.split(separator)
-                    for number in line:
-                        try:
-                            data_list.append(float(number))
-                        except:  # pylint: disable=W0702
-                            traceback.print_exc()
-                            print('Could not convert', number, ' to int.')
-                    line = file.readline()
-
-        # No need to explicitly close file when using with statement.
-        self.data = data_list
+            chunks = data
+
+        total = 0.0
+        for chunk in chunks:
+            total += float(np.sum(self._logpdf(np.asarray(chunk, dtype=np.float64))))
+        return total
+
+    def sample(self, size, seed=None):
+
+        """Function to draw random values from the distribution.
+
+        Args:
+                size (int or tuple of ints): number of values, or shape of
+                the array of values
+                seed (None, int, numpy.random.SeedSequence or
+                numpy.random.Generator): seed of the random values, the
+                same seed always gives the same values.
+                [Default value: None, fresh entropy from the system]
+        Returns:
+                numpy.ndarray: contiguous float64 array of random values
+        """
+
+        values = self._sample(np.random.default_rng(seed), size)
+        return np.ascontiguousarray(values, dtype=np.float64)
+
+    def iter_samples(self, size, seed=None, chunk_size=CHUNK_SIZE):
+
+        """Function to draw a large number of random values in chunks,
+        without holding them all in memory.
+
+        Each chunk is drawn from its own stream, spawned from the seed in
+        order, so a chunk only depends on the seed and its position. The
+        chunks can therefore be drawn in any order, or by different
+        processes with spawn_seeds, and still give the same values.
+
+        Args:
+                size (int): total number of values
+                seed (None, int or numpy.random.SeedSequence): seed of the
+                random values. [Default value: None]
+                chunk_size (int): number of values per chunk.
+                [Default value: CHUNK_SIZE]
+        Returns:
+                generator: numpy arrays of at most chunk_size values
+        """
+
+        count = -(-size // chunk_size)
+        for index, child in enumerate(self.spawn_seeds(seed, count)):
+            yield self.sample(min(chunk_size, size - index * chunk_size), child)
+
+    @staticmethod
+    def spawn_seeds(seed, count):
+
+        """Function to spawn independent, reproducible seeds from one seed,
+        for example one per process of a pool, to be passed to sample.
+
+        Args:
+                seed (None, int or numpy.random.SeedSequence): parent seed
+                count (int): number of seeds to spawn
+        Returns:
+                list: numpy.random.SeedSequence, one per stream
+        """
+
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        return seed.spawn(count)
+
+    def freeze(self):
+
+        """Function to create an immutable copy of the distribution, for
+        sharing one instance between threads. Its methods do not store
+        results or round them, so they can be called concurrently.
+
+        Args:
+                None
+        Returns:
+                FrozenDistribution: immutable copy of the distribution
+                with its current parameters, without the data set
+        """
+
+        return FrozenDistribution(self)
+
+    def _constants(self):
+        """Constants derived from the parameters, such as normalizing
+        factors, computed by _calculate_constants on first use and kept
+        until a parameter is assigned."""
+
+        constants = self._cache
+        if constants is None:
+            constants = self._cache = self._calculate_constants()
+        return constants
+
+    def _calculate_constants(self):
+        """Computes the constants returned by _constants, a tuple which
+        distributions extend with whatever their formulas reuse."""
+
+        return ()
+
+    def _update_moments(self):
+        """Stores the unrounded mean and standard deviation, for the
+        distributions which derive them from their other parameters."""
+
+        self.calculate_mean()
+        self.calculate_stdev()
+
+    # Vectorized kernels of the methods above, which distributions
+    # override where a direct formula is more accurate
+
+    def _logpdf(self, x):
+        with np.errstate(divide='ignore'):
+            return np.log(self._pdf(x))
+
+    def _logcdf(self, x):
+        with np.errstate(divide='ignore'):
+            return np.log(self._cdf(x))
+
+    def _sf(self, x):
+        return 1 - self._cdf(x)
+
+    def _logsf(self, x):
+        with np.errstate(divide='ignore'):
+            return np.log(self._sf(x))
+
+
+def _parameters(cls):
+    """Names of the parameters of a distribution class, and of its other
+    public slots without the results stored by the calculate methods."""
+
+    names = []
+    for base in reversed(cls.__mro__):
+        names.extend(name for name, value in vars(base).items()
+                      if isinstance(value, _Parameter))
+        names.extend(name for name in getattr(base, '__slots__', ())
+                     if not name.startswith('_') and name not in ('pdf', 'cdf'))
+    return tuple(names)
+
+
+class FrozenDistribution:
+    """ Immutable distribution returned by Distribution.freeze.
+
+    Its methods are pure functions of the parameters: they neither store
+    nor round their results, so one instance can serve any number of
+    threads. The parameters of the distribution, such as mean, stdev, p
+    or theta, can be read but not assigned.
+    """
+
+    __slots__ = ('_distribution', '_parameters')
+
+    def __init__(self, distribution):
+
+        distribution = copy.copy(distribution)
+        distribution.data = []
+        distribution.pdf = None
+        distribution.cdf = None
+        distribution._update_moments()
+        # computed now, so that the methods never write to the copy
+        distribution._constants()
+        object.__setattr__(self, '_distribution', distribution)
+        object.__setattr__(self, '_parameters', _parameters(type(distribution)))
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self._parameters:
+            raise AttributeError("{!r} object has no attribute {!r}".format(type(self).__name__, name))
+        return getattr(self._distribution, name)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FrozenDistribution is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('FrozenDistribution is immutable')
+
+    def pdf(self, x):
+
+        """Function to calculate the probability density function, or the
+        probability mass function of a discrete distribution.
+
+        Args:
+                x (float or array-like): point(s) for calculating the
+                probability density function
+        Returns:
+                float or numpy.ndarray: probability density function
+        """
+
+        return _evaluate(self._distribution._pdf, x)
+
+    def cdf(self, x):
+
+        """Function to calculate the cumulative distribution function.
+
+        Args:
+                x (float or array-like): point(s) for calculating the
+                cumulative distribution function
+        Returns:
+                float or numpy.ndarray: cumulative distribution function
+        """
+
+        return _evaluate(self._distribution._cdf, x)
+
+    def ppf(self, q):
+
+        """Function to calculate the percent point function, the inverse
+        of the cumulative distribution function.
+
+        Args:
+                q (float or array-like): probability or probabilities
+        Returns:
+                float or numpy.ndarray: percent point function, nan where
+                q is outside [0, 1]
+        """
+
+        return _evaluate(self._distribution._ppf, q)
+
+    def logpdf(self, x):
+
+        """Function to calculate the logarithm of the probability density
+        function.
+
+        Args:
+                x (float or array-like): point(s) for calculating the log
+                of the probability density function
+        Returns:
+                float or numpy.ndarray: log of the probability density
+                function, -inf outside the support
+        """
+
+        return _evaluate(self._distribution._logpdf, x)
+
+    def logcdf(self, x):
+
+        """Function to calculate the logarithm of the cumulative
+        distribution function.
+
+        Args:
+                x (float or array-like): point(s) for calculating the log
+                of the cumulative distribution function
+        Returns:
+                float or numpy.ndarray: log of the cumulative distribution
+                function
+        """
+
+        return _evaluate(self._distribution._logcdf, x)
+
+    def sf(self, x):
+
+        """Function to calculate the survival function, 1 - cdf.
+
+        Args:
+                x (float or array-like): point(s) for calculating the
+                survival function
+        Returns:
+                float or numpy.ndarray: probability of exceeding x
+        """
+
+        return _evaluate(self._distribution._sf, x)
+
+    def logsf(self, x):
+
+        """Function to calculate the logarithm of the survival function.
+
+        Args:
+                x (float or array-like): point(s) for calculating the log
+                of the survival function
+        Returns:
+                float or numpy.ndarray: log of the probability of
+                exceeding x
+        """
+
+        return _evaluate(self._distribution._logsf, x)
+
+    def loglikelihood(self, data):
+
+        """Function to calculate the log-likelihood of a data set.
+
+        Args:
+                data (array-like or iterable): data set, or chunks of it
+                such as those returned by iter_data_file
+        Returns:
+                float: log-likelihood, -inf if a value is outside the support
+        """
+
+        return self._distribution.loglikelihood(data)
+
+    def sample(self, size, seed=None):
+
+        """Function to draw random values from the distribution, see
+        Distribution.sample.
+
+        Args:
+                size (int or tuple of ints): number of values, or shape of
+                the array of values
+                seed (None, int, numpy.random.SeedSequence or
+                numpy.random.Generator): seed of the random values
+        Returns:
+                numpy.ndarray: contiguous float64 array of random values
+        """
+
+        return self._distribution.sample(size, seed)
+
+    def __reduce__(self):
+        return type(self), (self._distribution,)
+
+    def __repr__(self):
+        return 'frozen {}'.format(self._distribution)
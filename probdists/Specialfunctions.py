@@ -0,0 +1,993 @@
+import math
+import numpy as np
+
+# Rational approximations of the error functions from the Cephes library
+# (Stephen L. Moshier), accurate to about 1e-15 in double precision.
+# erf(x) = x * T(x^2) / U(x^2) for |x| < 1
+ERF_T = [9.60497373987051638749E0, 9.00260197203842689217E1,
+         2.23200534594684319226E3, 7.00332514112805075473E3,
+         5.55923013010394962768E4]
+ERF_U = [3.35617141647503099647E1, 5.21357949780152679795E2,
+         4.59432382970980127987E3, 2.26290000613890934246E4,
+         4.92673942608635921086E4]
+
+# erfc(x) = exp(-x^2) * P(x) / Q(x) for 1 <= x < 8
+ERFC_P = [2.46196981473530512524E-10, 5.64189564831068821977E-1,
+          7.46321056442269912687E0, 4.86371970985681366614E1,
+          1.96520832956077098242E2, 5.26445194995477358631E2,
+          9.34528527171957607540E2, 1.02755188689515710272E3,
+          5.57535335369399327526E2]
+ERFC_Q = [1.32281951154744992508E1, 8.67072140885989742329E1,
+          3.54937778887819891062E2, 9.75708501743205489753E2,
+          1.82390916687909736289E3, 2.24633760818710981792E3,
+          1.65666309194161350182E3, 5.57535340817727675546E2]
+
+# erfc(x) = exp(-x^2) * R(x) / S(x) for x >= 8
+ERFC_R = [5.64189583547755073984E-1, 1.27536670759978104416E0,
+          5.01905042251180477414E0, 6.16021097993053585195E0,
+          7.40974269950448939160E0, 2.97886665372100240670E0]
+ERFC_S = [2.26052863220117276590E0, 9.39603524938001434673E0,
+          1.20489539808096656605E1, 1.70814450747565897222E1,
+          9.60896809063285878198E0, 3.36907645100081516050E0]
+
+# Rational approximations of the inverse of the standard normal cdf by
+# Peter J. Acklam, with a relative error below 1.15e-9, for the central
+# region |q - 0.5| <= 0.5 - NDTRI_TAIL and for the tails
+NDTRI_A = [-3.969683028665376E1, 2.209460984245205E2, -2.759285104469687E2,
+           1.383577518672690E2, -3.066479806614716E1, 2.506628277459239E0]
+NDTRI_B = [-5.447609879822406E1, 1.615858368580409E2, -1.556989798598866E2,
+           6.680131188771972E1, -1.328068155288572E1, 1.0]
+NDTRI_C = [-7.784894002430293E-3, -3.223964580411365E-1, -2.400758277161838E0,
+           -2.549671348149094E0, 4.374664141464968E0, 2.938163982698783E0]
+NDTRI_D = [7.784695709041462E-3, 3.224671290700398E-1, 2.445134137142996E0,
+           3.754408661907416E0, 1.0]
+NDTRI_TAIL = 0.02425
+
+# Asymptotic series of ndtr(z) * sqrt(2 pi) * (-z) * exp(z^2 / 2) in 1/z^2,
+# (-1)^n (2n - 1)!!, accurate to double precision for z < LOG_NDTR_TAIL
+LOG_NDTR_SERIES = [-34459425.0, 2027025.0, -135135.0, 10395.0, -945.0,
+                   105.0, -15.0, 3.0, -1.0, 1.0]
+LOG_NDTR_TAIL = -20
+
+# Coefficients of the Stirling series of log(gamma(x)) in powers of 1/x^2,
+# accurate to 1e-15 for x >= 10; smaller x are shifted up by recurrence
+STIRLING = [-691 / 360360, 1 / 1188, -1 / 1680, 1 / 1260, -1 / 360, 1 / 12]
+STIRLING_MIN = 10
+
+# Asymptotic series of log(x) - digamma(x) and of trigamma(x) in powers of
+# 1/x^2, from the Bernoulli numbers, accurate to 1e-15 for x >= STIRLING_MIN
+DIGAMMA_SERIES = [1 / 12, -691 / 32760, 1 / 132, -1 / 240, 1 / 252, -1 / 120, 1 / 12]
+TRIGAMMA_SERIES = [7 / 6, -691 / 2730, 5 / 66, -1 / 30, 1 / 42, -1 / 30, 1 / 6]
+
+# Continued fractions and series of the incomplete beta and gamma
+# functions: relative tolerance, and an upper bound on their terms, which
+# grow slowly with the shape parameters near the mean
+FRACTION_EPSILON = 1e-16
+FRACTION_TINY = 1e-300
+FRACTION_MAX_TERMS = 100000
+
+# Coefficients of Temme's uniform asymptotic expansion of the incomplete
+# gamma function, DLMF 8.12: row j holds the Taylor series in eta of
+# c_j(eta), from c_0 = 1 / (lambda - 1) - 1 / eta and
+# c_j = c_(j-1)' / eta + (-1)^j g_j / (lambda - 1), g_j being the Stirling
+# coefficients of gamma(k), computed in exact rational arithmetic
+TEMME = [
+    [-0.3333333333333333, 0.08333333333333333, -0.014814814814814815,
+     0.0011574074074074073, 0.0003527336860670194, -0.0001787551440329218,
+     3.919263178522438e-05, -2.185448510679992e-06, -1.85406221071516e-06,
+     8.296711340953087e-07, -1.7665952736826078e-07, 6.707853543401498e-09,
+     1.0261809784240309e-08, -4.382036018453353e-09, 9.14769958223679e-10,
+     -2.5514193994946248e-11],
+    [-0.001851851851851852, -0.003472222222222222, 0.0026455026455026454,
+     -0.0009902263374485596, 0.00020576131687242798, -4.018775720164609e-07,
+     -1.8098550334489977e-05, 7.64916091608111e-06, -1.6120900894563446e-06,
+     4.647127802807434e-09, 1.378633446915721e-07, -5.752545603517705e-08,
+     1.1951628599778148e-08, -1.7543241719747647e-11, -1.0091543710600413e-09,
+     4.162792991842583e-10],
+    [0.004133597883597883, -0.0026813271604938273, 0.0007716049382716049,
+     2.0093878600823047e-06, -0.0001073665322636516, 5.2923448829120125e-05,
+     -1.2760635188618728e-05, 3.423578734096138e-08, 1.3721957309062934e-06,
+     -6.298992138380055e-07, 1.4280614206064242e-07, -2.0477098421990866e-10,
+     -1.409252991086752e-08, 6.228974084922022e-09, -1.3670488396617114e-09,
+     9.428356159014678e-13],
+    [0.0006494341563786008, 0.00022947209362139917, -0.0004691894943952557,
+     0.00026772063206283885, -7.561801671883977e-05, -2.396505113867297e-07,
+     1.1082654115347302e-05, -5.6749528269915965e-06, 1.4230900732435883e-06,
+     -2.7861080291528143e-11, -1.6958404091930278e-07, 8.099464905388083e-08,
+     -1.9111168485973655e-08, 2.3928620439808118e-12, 2.0620131815488797e-09,
+     -9.460496661855133e-10],
+    [-0.0008618882909167117, 0.0007840392217200666, -0.0002990724803031902,
+     -1.4638452578843418e-06, 6.641498215465122e-05, -3.968365047179435e-05,
+     1.1375726970678419e-05, 2.507497226237533e-10, -1.6954149536558305e-06,
+     8.907507532205309e-07, -2.292934834000805e-07, 2.956794137544049e-11,
+     2.8865829742708783e-08, -1.4189739437803219e-08, 3.4463580499464896e-09,
+     -2.3024517174528067e-13],
+    [-0.00033679855336635813, -6.972813758365857e-05, 0.0002772753244959392,
+     -0.00019932570516188847, 6.797780477937208e-05, 1.419062920643967e-07,
+     -1.3594048189768693e-05, 8.018470256334202e-06, -2.291481176508095e-06,
+     -3.252473551298454e-10, 3.4652846491085265e-07, -1.8447187191171344e-07,
+     4.8240967037894184e-08, -1.7989466721743514e-14, -6.306194500013523e-09,
+     3.162417628774568e-09],
+    [0.0005313079364639922, -0.0005921664373536939, 0.0002708782096718045,
+     7.902353232660328e-07, -8.153969367561969e-05, 5.61168275310625e-05,
+     -1.8329116582843375e-05, -3.0796134506033047e-09, 3.465155368803609e-06,
+     -2.0291327396058603e-06, 5.788792863149004e-07, 2.338630673826657e-13,
+     -8.828600746330484e-08, 4.7435958880408125e-08, -1.2545415020710383e-08,
+     8.649648858010293e-14],
+    [0.00034436760689237765, 5.171790908260592e-05, -0.00033493161081142234,
+     0.0002812695154763237, -0.00010976582244684731, -1.2741009095484485e-07,
+     2.7744451511563645e-05, -1.8263488805711332e-05, 5.7876949497350525e-06,
+     4.93875893393627e-10, -1.0595367014026043e-06, 6.166714376110408e-07,
+     -1.7562973359060463e-07, -1.297447328701544e-12, 2.695423606288966e-08,
+     -1.4578352908731272e-08],
+    [-0.0006526239185953094, 0.0008394987206720873, -0.000438297098541721,
+     -6.969091458420552e-07, 0.00016644846642067547, -0.00012783517679769218,
+     4.629953263691304e-05, 4.557909867922708e-09, -1.0595271125805195e-05,
+     6.783342904865167e-06, -2.1075476666258803e-06, -1.7213731432817144e-11,
+     3.773587741611098e-07, -2.1867506700122867e-07, 6.220228804018927e-08,
+     6.597703826733e-16],
+    [-0.0005967612901927463, -7.204895416020011e-05, 0.0006782308837667328,
+     -0.0006401475260262758, 0.00027750107634328704, 1.819700838046515e-07,
+     -8.479507117068503e-05, 6.105192082501531e-05, -2.1073920183404862e-05,
+     -8.858589014125599e-10, 4.5284535953805374e-06, -2.8427815022504407e-06,
+     8.708234177864641e-07, 3.6886101871706966e-12, -1.534469519070206e-07,
+     8.862466778790695e-08]]
+
+# The expansion replaces the series and the continued fraction, whose
+# number of terms grows like sqrt(k) near the mean, for k > TEMME_MIN_K
+# and |z - k| < TEMME_RATIO * k, where it is accurate to about 1e-14
+TEMME_MIN_K = 20
+TEMME_RATIO = 0.3
+
+# Bound on the Newton iterations inverting the incomplete gamma function,
+# which converge quadratically
+GAMMAINCINV_ITERATIONS = 50
+
+
+def _polevl(x, coefficients):
+    """Evaluates a polynomial by Horner's rule, highest degree first."""
+
+    result = np.full(x.shape, coefficients[0])
+    for coefficient in coefficients[1:]:
+        result *= x
+        result += coefficient
+    return result
+
+
+def _p1evl(x, coefficients):
+    """Evaluates a polynomial whose leading coefficient is 1 and omitted."""
+
+    result = x + coefficients[0]
+    for coefficient in coefficients[1:]:
+        result *= x
+        result += coefficient
+    return result
+
+
+def _exp_minus_square(x):
+    """Computes exp(-x^2) without the error that rounding x^2 would
+    amplify for large x, by splitting x into a coarse and a fine part."""
+
+    coarse = np.round(x * 128) / 128
+    fine = x - coarse
+    with np.errstate(under='ignore'):
+        return np.exp(-coarse * coarse) * np.exp(-(2 * coarse * fine + fine * fine))
+
+
+def _erf_small(x):
+    """erf(x) for |x| < 1."""
+
+    square = x * x
+    return x * _polevl(square, ERF_T) / _p1evl(square, ERF_U)
+
+
+def _erfc_large(x):
+    """erfc(x) for x >= 1, keeping its relative accuracy in the tail."""
+
+    result = np.zeros(x.shape)
+    near = x < 8
+    far = ~near & (x < 27)  # erfc(x) underflows to 0 beyond 27
+    for mask, numerator, denominator in ((near, ERFC_P, ERFC_Q),
+                                         (far, ERFC_R, ERFC_S)):
+        if mask.any():
+            y = x[mask]
+            with np.errstate(under='ignore'):
+                result[mask] = (_exp_minus_square(y) * _polevl(y, numerator)
+                                / _p1evl(y, denominator))
+    return result
+
+
+def _erfc(x):
+    """erfc(x) for a float64 array, evaluating each range only where needed."""
+
+    result = np.empty(x.shape)
+    absolute = np.abs(x)
+    small = absolute < 1
+    if small.any():
+        result[small] = 1 - _erf_small(x[small])
+    large = ~small
+    if large.any():
+        tail = _erfc_large(absolute[large])
+        result[large] = np.where(x[large] < 0, 2 - tail, tail)
+    result[np.isnan(x)] = np.nan
+    return result
+
+
+def erf(x):
+    """Error function, vectorized.
+
+    Args:
+        x (array-like): points of evaluation
+
+    Returns:
+        numpy.ndarray: erf(x)
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    result = np.empty(x.shape)
+    absolute = np.abs(x)
+    small = absolute < 1
+    if small.any():
+        result[small] = _erf_small(x[small])
+    large = ~small
+    if large.any():
+        result[large] = np.sign(x[large]) * (1 - _erfc_large(absolute[large]))
+    result[np.isnan(x)] = np.nan
+    return result
+
+
+def erfc(x):
+    """Complementary error function, vectorized, keeping its relative
+    accuracy in the upper tail.
+
+    Args:
+        x (array-like): points of evaluation
+
+    Returns:
+        numpy.ndarray: erfc(x)
+    """
+
+    return _erfc(np.asarray(x, dtype=np.float64))
+
+
+def ndtr(z):
+    """Cumulative distribution function of the standard normal distribution,
+    vectorized, keeping its relative accuracy in the lower tail.
+
+    Args:
+        z (array-like): points of evaluation
+
+    Returns:
+        numpy.ndarray: probability that a standard normal variable is below z
+    """
+
+    z = np.asarray(z, dtype=np.float64)
+    return 0.5 * _erfc(-z / math.sqrt(2))
+
+
+def log_ndtr(z):
+    """Logarithm of the standard normal cdf, vectorized, which stays finite
+    and accurate far in the lower tail, where ndtr underflows.
+
+    Args:
+        z (array-like): points of evaluation
+
+    Returns:
+        numpy.ndarray: log(ndtr(z))
+    """
+
+    z = np.asarray(z, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # log1p keeps the precision of values close to 0 above the mean
+        direct = np.where(z > 0, np.log1p(-ndtr(-np.abs(z))), np.log(ndtr(z)))
+
+        tail = z < LOG_NDTR_TAIL
+        y = np.where(tail, z, LOG_NDTR_TAIL)
+        inverse = 1 / (y * y)
+        asymptotic = (-0.5 * y * y - np.log(-y) - 0.5 * math.log(2 * math.pi)
+                      + np.log(_polevl(inverse, LOG_NDTR_SERIES)))
+    return np.where(tail, asymptotic, direct)
+
+
+def ndtri(q):
+    """Inverse of the standard normal cdf, vectorized. Acklam's rational
+    approximation is refined by one step of Halley's method on the lower
+    tail, min(q, 1 - q), where ndtr keeps its relative precision, which
+    brings it to full double precision.
+
+    Args:
+        q (array-like): probabilities, 0 <= q <= 1
+
+    Returns:
+        numpy.ndarray: z such that ndtr(z) = q, nan where q is outside [0, 1]
+    """
+
+    q = np.asarray(q, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        centered = q - 0.5
+        square = centered * centered
+        central = centered * _polevl(square, NDTRI_A) / _polevl(square, NDTRI_B)
+
+        # the tails are symmetric, and approximated in sqrt(-2 log(q))
+        tail = np.sqrt(-2 * np.log(np.minimum(q, 1 - q)))
+        tail = _polevl(tail, NDTRI_C) / _polevl(tail, NDTRI_D)
+        z = np.where(np.abs(centered) <= 0.5 - NDTRI_TAIL, central,
+                     np.where(q < 0.5, tail, -tail))
+
+        # 1 - q is exact for q >= 0.5, while ndtr(z) - q cancels near 1
+        lower = -np.abs(z)
+        error = ndtr(lower) - np.minimum(q, 1 - q)
+        step = error * math.sqrt(2 * math.pi) * np.exp(0.5 * lower * lower)
+        lower = lower - step / (1 + 0.5 * lower * step)
+        z = np.where(q < 0.5, lower, -lower)
+
+    z = np.where(q == 0, -np.inf, np.where(q == 1, np.inf, z))
+    return np.where((q >= 0) & (q <= 1), z, np.nan)
+
+
+def gammaln(x):
+    """Logarithm of the gamma function, vectorized, for x > 0.
+
+    Args:
+        x (array-like): points of evaluation
+
+    Returns:
+        numpy.ndarray: log(gamma(x)), inf at 0 and nan for negative x
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.where(x > 0, x, np.nan)
+
+    # log(gamma(y)) = log(gamma(y + 1)) - log(y) moves small y into the
+    # range of the series
+    shift = np.zeros(x.shape)
+    small = y < STIRLING_MIN
+    while small.any():
+        shift[small] += np.log(y[small])
+        y[small] += 1
+        small = y < STIRLING_MIN
+
+    with np.errstate(invalid='ignore'):
+        inverse = 1 / y
+        series = _polevl(inverse * inverse, STIRLING) * inverse
+        result = (y - 0.5) * np.log(y) - y + 0.5 * math.log(2 * math.pi) + series - shift
+    return np.where((x == 0) | (x == np.inf), np.inf, result)
+
+
+def stirling_error(x):
+    """Error of Stirling's approximation of the factorial,
+    log(x!) - (x + 0.5) * log(x) + x - 0.5 * log(2 * pi), vectorized,
+    for x > 0. It is small and known to full precision, where the
+    difference of the two large logarithms is not.
+
+    Args:
+        x (array-like): points of evaluation
+
+    Returns:
+        numpy.ndarray: error of Stirling's approximation at x
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    large = x >= STIRLING_MIN
+    y = np.where(large, x, STIRLING_MIN)
+    inverse = 1 / y
+    series = _polevl(inverse * inverse, STIRLING) * inverse
+
+    y = np.where(large, 1.0, x)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        direct = gammaln(y + 1) - (y + 0.5) * np.log(y) + y - 0.5 * math.log(2 * math.pi)
+    return np.where(large, series, direct)
+
+
+def _stirling_error_scalar(x):
+    """stirling_error for a single point x > 0, in plain floats."""
+
+    if x >= STIRLING_MIN:
+        inverse = 1 / x
+        square = inverse * inverse
+        series = 0.0
+        for coefficient in STIRLING:
+            series = series * square + coefficient
+        return series * inverse
+    return math.lgamma(x + 1) - (x + 0.5) * math.log(x) + x - 0.5 * math.log(2 * math.pi)
+
+
+def _log_minus_digamma_scalar(x):
+    """log(x) - digamma(x) for a single point x > 0, in plain floats. It is
+    positive and close to 1 / (2x) for large x, where the difference of
+    the two logarithms would lose its precision."""
+
+    # digamma(x) = digamma(x + 1) - 1 / x moves small x into the range of
+    # the series
+    shift = 0.0
+    y = x
+    while y < STIRLING_MIN:
+        shift += 1 / y
+        y += 1
+    inverse = 1 / y
+    square = inverse * inverse
+    series = 0.0
+    for coefficient in DIGAMMA_SERIES:
+        series = series * square + coefficient
+    result = 0.5 * inverse + series * square + shift
+    return result + math.log(x / y) if y != x else result
+
+
+def _trigamma_scalar(x):
+    """Derivative of the digamma function for a single point x > 0, in
+    plain floats."""
+
+    shift = 0.0
+    y = x
+    while y < STIRLING_MIN:
+        shift += 1 / (y * y)
+        y += 1
+    inverse = 1 / y
+    square = inverse * inverse
+    series = 0.0
+    for coefficient in TRIGAMMA_SERIES:
+        series = series * square + coefficient
+    return inverse + 0.5 * square + series * square * inverse + shift
+
+
+def deviance(x, m):
+    """x * log(x / m) + m - x, vectorized, keeping its relative accuracy
+    when x is close to m, where the two terms nearly cancel.
+
+    Args:
+        x (array-like): observed values, x >= 0
+        m (array-like): expected values, m >= 0
+
+    Returns:
+        numpy.ndarray: deviance of x from m
+    """
+
+    x, m = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                               np.asarray(m, dtype=np.float64))
+    difference = x - m
+    close = np.abs(difference) < 0.1 * (x + m)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        # (x - m)^2 / (x + m) + 2x * sum(v^(2j+1) / (2j+1)), v < 0.1
+        v = np.where(close, difference / (x + m), 0.0)
+        square = v * v
+        series = difference * v
+        term = 2 * x * v
+        for j in range(1, 9):
+            term = term * square
+            series = series + term / (2 * j + 1)
+
+        direct = np.where(x > 0, x * np.log(x / m), 0.0) + m - x
+    return np.where(close, series, direct)
+
+
+def _deviance_scalar(x, m):
+    """deviance for a single point, in plain floats, for x >= 0 and m > 0."""
+
+    difference = x - m
+    if abs(difference) < 0.1 * (x + m):
+        v = difference / (x + m)
+        square = v * v
+        series = difference * v
+        term = 2 * x * v
+        for j in range(1, 9):
+            term *= square
+            series += term / (2 * j + 1)
+        return series
+    return (x * math.log(x / m) if x > 0 else 0.0) + m - x
+
+
+def log_binomial_pmf(k, n, p, q=None):
+    """Logarithm of the binomial probability mass function
+    n! / (k! (n - k)!) * p^k * q^(n - k), vectorized, for 0 <= k <= n.
+    n and k need not be integers.
+
+    Loader's saddle point form avoids the cancellation between log(n!),
+    log(k!) and log((n - k)!), which are huge next to the result when n
+    is large.
+
+    Args:
+        k (array-like): number of successes
+        n (array-like): number of trials
+        p (array-like): probability of a success
+        q (array-like): 1 - p, if known more accurately. [Default value: None]
+
+    Returns:
+        numpy.ndarray: log of the probability of k successes
+    """
+
+    k, n, p = np.broadcast_arrays(np.asarray(k, dtype=np.float64),
+                                  np.asarray(n, dtype=np.float64),
+                                  np.asarray(p, dtype=np.float64))
+    q = 1 - p if q is None else np.asarray(q, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # at both ends of the support the binomial coefficient is 1
+        edge = (np.where(k > 0, k * np.log(p), 0.0)
+                + np.where(k < n, (n - k) * np.log(q), 0.0))
+
+        inner = (0 < k) & (k < n)
+        k = np.where(inner, k, 1.0)
+        n = np.where(inner, n, 2.0)
+        log_pmf = (stirling_error(n) - stirling_error(k) - stirling_error(n - k)
+                   - deviance(k, n * p) - deviance(n - k, n * q)
+                   - 0.5 * (math.log(2 * math.pi) + np.log(k) + np.log1p(-k / n)))
+
+    return np.where(inner, log_pmf, edge)
+
+
+def _log_binomial_pmf_scalar(k, n, p, q, stirling=None):
+    """log_binomial_pmf for a single point, in plain floats, for
+    0 <= k <= n and 0 < p < 1. stirling is stirling_error(n), which
+    callers evaluating many points with the same n can compute once."""
+
+    if k == 0:
+        return n * math.log(q)
+    if k == n:
+        return n * math.log(p)
+    if stirling is None:
+        stirling = _stirling_error_scalar(n)
+    return (stirling - _stirling_error_scalar(k) - _stirling_error_scalar(n - k)
+            - _deviance_scalar(k, n * p) - _deviance_scalar(n - k, n * q)
+            - 0.5 * (math.log(2 * math.pi) + math.log(k) + math.log1p(-k / n)))
+
+
+def _complement(log_value, same_side, log):
+    """Turns the logarithm of the side of an incomplete function computed
+    into the side requested, as a value or as a logarithm."""
+
+    if log:
+        return np.where(same_side, log_value, np.log1p(-np.exp(log_value)))
+    value = np.exp(log_value)
+    return np.where(same_side, value, 1 - value)
+
+
+def _beta_fraction(a, b, x):
+    """Continued fraction of the incomplete beta function, by the modified
+    Lentz method. It converges quickly for x < (a + 1) / (a + b + 2)."""
+
+    if x.ndim == 0:
+        return _beta_fraction_scalar(float(a), float(b), float(x))
+
+    def nonzero(value):
+        return np.where(np.abs(value) < FRACTION_TINY, FRACTION_TINY, value)
+
+    c = np.ones(x.shape)
+    d = 1 / nonzero(1 - (a + b) * x / (a + 1))
+    fraction = d
+    # converged points stop taking factors, whose rounding errors would
+    # otherwise pile up while the slowest point converges
+    active = np.ones(x.shape, dtype=bool)
+    for m in range(1, FRACTION_MAX_TERMS):
+        # even and odd terms of the fraction
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 / nonzero(1 + numerator * d)
+            c = nonzero(1 + numerator / c)
+            delta = d * c
+            fraction = np.where(active, fraction * delta, fraction)
+        active &= np.abs(delta - 1) >= FRACTION_EPSILON
+        if not active.any():
+            break
+    return fraction
+
+
+def _beta_fraction_scalar(a, b, x):
+    """_beta_fraction for a single point, in plain floats, which is much
+    faster than numpy on 0-d arrays when many terms are needed."""
+
+    def nonzero(value):
+        return FRACTION_TINY if abs(value) < FRACTION_TINY else value
+
+    c = 1.0
+    d = 1 / nonzero(1 - (a + b) * x / (a + 1))
+    fraction = d
+    for m in range(1, FRACTION_MAX_TERMS):
+        for numerator in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                          -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1 / nonzero(1 + numerator * d)
+            c = nonzero(1 + numerator / c)
+            delta = d * c
+            fraction *= delta
+        if not abs(delta - 1) >= FRACTION_EPSILON:
+            break
+    return np.float64(fraction)
+
+
+def _betainc(a, b, x, upper, log=False):
+    """Regularized incomplete beta function or its complement, or their
+    logarithms, evaluating the continued fraction on whichever side of the
+    mean it converges. That side is the smaller one, so its logarithm
+    stays finite far in the tails. Close to the mean the fraction needs
+    about sqrt(a * b / (a + b)) terms, so its cost grows with a and b."""
+
+    a, b, x = np.broadcast_arrays(np.asarray(a, dtype=np.float64),
+                                  np.asarray(b, dtype=np.float64),
+                                  np.asarray(x, dtype=np.float64))
+    y = 1 - x
+    missing = np.isnan(x)
+
+    # I_x(a, b) = 1 - I_(1-x)(b, a)
+    swap = x > (a + 1) / (a + b + 2)
+    a, b = np.where(swap, b, a), np.where(swap, a, b)
+    x, y = np.where(swap, y, x), np.where(swap, x, y)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        inside = (x > 0) & (y > 0)
+        x = np.where(inside, x, 0.5)
+        y = np.where(inside, y, 0.5)
+        # x^a * y^b / (a * B(a, b)) = y * binomial pmf of a in a + b - 1 trials
+        log_factor = np.where(
+            b >= 1, np.log(y) + log_binomial_pmf(a, a + b - 1, x, y),
+            a * np.log(x) + b * np.log(y) + gammaln(a + b) - gammaln(a + 1) - gammaln(b))
+        log_value = log_factor + np.log(_beta_fraction(a, b, x))
+
+        # the side computed is 0 at both ends, x = 0 and x = 1
+        log_value = np.where(inside, log_value, -np.inf)
+        value = _complement(log_value, swap == upper, log)
+    return np.where(missing, np.nan, value)
+
+
+def _betainc_scalar(a, b, x, upper, stirling=None):
+    """_betainc for a single point, in plain floats, for a, b >= 1 and
+    0 < x < 1. stirling is stirling_error(a + b - 1), as in
+    _log_binomial_pmf_scalar."""
+
+    y = 1 - x
+    swap = x > (a + 1) / (a + b + 2)
+    if swap:
+        a, b, x, y = b, a, y, x
+
+    log_value = (math.log(y) + _log_binomial_pmf_scalar(a, a + b - 1, x, y, stirling)
+                 + math.log(_beta_fraction_scalar(a, b, x)))
+    value = math.exp(log_value)
+    return value if swap == upper else 1 - value
+
+
+def betainc(a, b, x):
+    """Regularized incomplete beta function I_x(a, b), vectorized.
+
+    Args:
+        a (array-like): first shape parameter, a > 0
+        b (array-like): second shape parameter, b > 0
+        x (array-like): points of evaluation, 0 <= x <= 1
+
+    Returns:
+        numpy.ndarray: I_x(a, b)
+    """
+
+    return _betainc(a, b, x, False)
+
+
+def betaincc(a, b, x):
+    """Complement 1 - I_x(a, b) of the regularized incomplete beta function,
+    vectorized, keeping its relative accuracy when it is small.
+
+    Args:
+        a (array-like): first shape parameter, a > 0
+        b (array-like): second shape parameter, b > 0
+        x (array-like): points of evaluation, 0 <= x <= 1
+
+    Returns:
+        numpy.ndarray: 1 - I_x(a, b)
+    """
+
+    return _betainc(a, b, x, True)
+
+
+def log_poisson_pmf(m, lmbda):
+    """Logarithm of the Poisson probability mass function
+    lmbda^m * exp(-lmbda) / m!, vectorized, for real m > -1.
+
+    Loader's saddle point form is used for m > 0, for the same reason as
+    in log_binomial_pmf.
+
+    Args:
+        m (array-like): number of events
+        lmbda (array-like): expected number of events, lmbda >= 0
+
+    Returns:
+        numpy.ndarray: log of the probability of m events
+    """
+
+    m, lmbda = np.broadcast_arrays(np.asarray(m, dtype=np.float64),
+                                   np.asarray(lmbda, dtype=np.float64))
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        positive = m > 0
+        n = np.where(positive, m, 1.0)
+        loader = (-stirling_error(n) - deviance(n, lmbda)
+                  - 0.5 * (math.log(2 * math.pi) + np.log(n)))
+        direct = np.where(m == 0, 0.0, m * np.log(lmbda)) - lmbda - gammaln(m + 1)
+
+    return np.where(positive, loader, direct)
+
+
+def _log_poisson_pmf_scalar(m, lmbda, stirling=None):
+    """log_poisson_pmf for a single point, in plain floats, for lmbda > 0.
+    stirling is stirling_error(m), as in _log_binomial_pmf_scalar."""
+
+    if m <= 0:
+        return (m * math.log(lmbda) if m else 0.0) - lmbda - math.lgamma(m + 1)
+    if stirling is None:
+        stirling = _stirling_error_scalar(m)
+    return -stirling - _deviance_scalar(m, lmbda) - 0.5 * (math.log(2 * math.pi) + math.log(m))
+
+
+def _gamma_series(k, z):
+    """Series of the lower incomplete gamma function,
+    sum of z^n / ((k + 1) ... (k + n)) for n >= 0. It converges quickly for
+    z < k + 1."""
+
+    if z.ndim == 0:
+        return _gamma_series_scalar(float(k), float(z))
+
+    term = np.ones(z.shape)
+    series = term
+    active = np.ones(z.shape, dtype=bool)
+    for n in range(1, FRACTION_MAX_TERMS):
+        term = term * z / (k + n)
+        series = np.where(active, series + term, series)
+        active &= np.abs(term) >= np.abs(series) * FRACTION_EPSILON
+        if not active.any():
+            break
+    return series
+
+
+def _gamma_series_scalar(k, z):
+    """_gamma_series for a single point, in plain floats."""
+
+    term = series = 1.0
+    for n in range(1, FRACTION_MAX_TERMS):
+        term *= z / (k + n)
+        series += term
+        if not abs(term) >= abs(series) * FRACTION_EPSILON:
+            break
+    return np.float64(series)
+
+
+def _gamma_fraction(k, z):
+    """Continued fraction of the upper incomplete gamma function, by the
+    modified Lentz method. It converges quickly for z > k + 1."""
+
+    if z.ndim == 0:
+        return _gamma_fraction_scalar(float(k), float(z))
+
+    def nonzero(value):
+        return np.where(np.abs(value) < FRACTION_TINY, FRACTION_TINY, value)
+
+    b = z + 1 - k
+    c = np.full(z.shape, 1 / FRACTION_TINY)
+    d = 1 / nonzero(b)
+    fraction = d
+    active = np.ones(z.shape, dtype=bool)
+    for i in range(1, FRACTION_MAX_TERMS):
+        numerator = -i * (i - k)
+        b = b + 2
+        d = 1 / nonzero(numerator * d + b)
+        c = nonzero(b + numerator / c)
+        delta = d * c
+        fraction = np.where(active, fraction * delta, fraction)
+        active &= np.abs(delta - 1) >= FRACTION_EPSILON
+        if not active.any():
+            break
+    return fraction
+
+
+def _gamma_fraction_scalar(k, z):
+    """_gamma_fraction for a single point, in plain floats."""
+
+    def nonzero(value):
+        return FRACTION_TINY if abs(value) < FRACTION_TINY else value
+
+    b = z + 1 - k
+    c = 1 / FRACTION_TINY
+    d = 1 / nonzero(b)
+    fraction = d
+    for i in range(1, FRACTION_MAX_TERMS):
+        numerator = -i * (i - k)
+        b += 2
+        d = 1 / nonzero(numerator * d + b)
+        c = nonzero(b + numerator / c)
+        delta = d * c
+        fraction *= delta
+        if not abs(delta - 1) >= FRACTION_EPSILON:
+            break
+    return np.float64(fraction)
+
+
+def _log1p_minus(x):
+    """x - log(1 + x), vectorized, by its Taylor series, accurate for
+    |x| <= TEMME_RATIO where the difference cancels."""
+
+    series = np.zeros(np.shape(x))
+    for n in range(40, 1, -1):
+        series = series * x + (-1) ** n / n
+    return series * x * x
+
+
+def _log1p_minus_scalar(x):
+    """_log1p_minus for a single point, in plain floats."""
+
+    series = 0.0
+    for n in range(40, 1, -1):
+        series = series * x + (-1) ** n / n
+    return series * x * x
+
+
+def _temme_series(eta, k):
+    """Sum of c_j(eta) / k^j of Temme's expansion, vectorized."""
+
+    total = np.zeros(np.shape(eta))
+    for row in reversed(TEMME):
+        coefficient = np.zeros(np.shape(eta))
+        for value in reversed(row):
+            coefficient = coefficient * eta + value
+        total = total / k + coefficient
+    return total
+
+
+def _gammainc_temme(k, z, upper, log=False):
+    """_gammainc by Temme's uniform asymptotic expansion, for large k and z
+    close to k, in a number of operations independent of k:
+    Q(k, z) = ndtr(-eta sqrt(k)) + exp(-k eta^2 / 2) S / sqrt(2 pi k), where
+    eta^2 / 2 = z / k - 1 - log(z / k) and S is _temme_series."""
+
+    sigma = (z - k) / k
+    eta = np.sign(sigma) * np.sqrt(2 * _log1p_minus(sigma))
+    sign = 1 if upper else -1
+    # the correction term, relative to exp(-k eta^2 / 2)
+    correction = sign * _temme_series(eta, k) / np.sqrt(2 * math.pi * k)
+    if log:
+        leading = log_ndtr(-sign * eta * np.sqrt(k))
+        return leading + np.log1p(np.exp(-0.5 * k * eta * eta - leading) * correction)
+    return ndtr(-sign * eta * np.sqrt(k)) + np.exp(-0.5 * k * eta * eta) * correction
+
+
+def _gammainc_temme_scalar(k, z, upper):
+    """_gammainc_temme for a single point, in plain floats."""
+
+    sigma = (z - k) / k
+    eta = math.copysign(math.sqrt(2 * _log1p_minus_scalar(sigma)), sigma)
+    total = 0.0
+    for row in reversed(TEMME):
+        coefficient = 0.0
+        for value in reversed(row):
+            coefficient = coefficient * eta + value
+        total = total / k + coefficient
+    sign = 1 if upper else -1
+    return (0.5 * math.erfc(sign * eta * math.sqrt(0.5 * k))
+            + sign * math.exp(-0.5 * k * eta * eta) * total / math.sqrt(2 * math.pi * k))
+
+
+def _gammainc(k, z, upper, log=False):
+    """Regularized incomplete gamma function or its complement, or their
+    logarithms, evaluating the series or the continued fraction, whichever
+    converges. That side is the smaller one, as in _betainc. Both need
+    about sqrt(k) terms close to the mean, so for large k near the mean
+    Temme's expansion is used instead, see _gammainc_temme."""
+
+    k, z = np.broadcast_arrays(np.asarray(k, dtype=np.float64),
+                               np.asarray(z, dtype=np.float64))
+    missing = np.isnan(z)
+    temme = (k > TEMME_MIN_K) & (np.abs(z - k) < TEMME_RATIO * k)
+    if temme.any():
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+            asymptotic = _gammainc_temme(np.where(temme, k, 2 * TEMME_MIN_K),
+                                         np.where(temme, z, 2 * TEMME_MIN_K), upper, log)
+        # the series and fraction are evaluated at k = z = 1 instead, which
+        # converge at once
+        k = np.where(temme, 1.0, k)
+        z = np.where(temme, 1.0, z)
+    series = z < k + 1
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        inside = (z > 0) & (z < np.inf)
+        z = np.where(inside, z, 1.0)
+        # z^k * exp(-z) / gamma(k + 1), the Poisson pmf of k at z
+        log_factor = log_poisson_pmf(k, z)
+        lower = log_factor + np.log(_gamma_series(k, np.where(series, z, 0.0)))
+        tail = log_factor + np.log(k * _gamma_fraction(k, np.where(series, k + 1, z)))
+
+        # the side computed is 0 at both ends, z = 0 and z = inf
+        log_value = np.where(inside, np.where(series, lower, tail), -np.inf)
+        value = _complement(log_value, series != upper, log)
+    if temme.any():
+        value = np.where(temme, asymptotic, value)
+    return np.where(missing, np.nan, value)
+
+
+def _gammainc_scalar(k, z, upper, stirling=None):
+    """_gammainc for a single point, in plain floats, for 0 < z < inf.
+    stirling is stirling_error(k), as in _log_binomial_pmf_scalar."""
+
+    if k > TEMME_MIN_K and abs(z - k) < TEMME_RATIO * k:
+        return _gammainc_temme_scalar(k, z, upper)
+    series = z < k + 1
+    log_factor = _log_poisson_pmf_scalar(k, z, stirling)
+    if series:
+        log_value = log_factor + math.log(_gamma_series_scalar(k, z))
+    else:
+        log_value = log_factor + math.log(k * _gamma_fraction_scalar(k, z))
+    value = math.exp(log_value)
+    return value if series != upper else 1 - value
+
+
+def gammainc(k, z):
+    """Regularized lower incomplete gamma function P(k, z), vectorized.
+
+    Args:
+        k (array-like): shape parameter, k > 0
+        z (array-like): points of evaluation, z >= 0
+
+    Returns:
+        numpy.ndarray: P(k, z)
+    """
+
+    return _gammainc(k, z, False)
+
+
+def gammaincc(k, z):
+    """Regularized upper incomplete gamma function Q(k, z) = 1 - P(k, z),
+    vectorized, keeping its relative accuracy when it is small.
+
+    Args:
+        k (array-like): shape parameter, k > 0
+        z (array-like): points of evaluation, z >= 0
+
+    Returns:
+        numpy.ndarray: Q(k, z)
+    """
+
+    return _gammainc(k, z, True)
+
+
+def gammaincinv(k, q):
+    """Inverse of the regularized lower incomplete gamma function in z,
+    vectorized.
+
+    Newton's method is applied to log P(k, z) in log z below the median,
+    and to log Q(k, z) above it; both are concave there, so the iterations
+    converge from any starting point, deep into the tails too. The start
+    is the Wilson-Hilferty approximation, or the behaviour of P near 0
+    where that one fails.
+
+    Args:
+        k (array-like): shape parameter, k > 0
+        q (array-like): probabilities, 0 <= q <= 1
+
+    Returns:
+        numpy.ndarray: z such that gammainc(k, z) = q, nan where q is
+        outside [0, 1]
+    """
+
+    k, q = np.broadcast_arrays(np.asarray(k, dtype=np.float64),
+                               np.asarray(q, dtype=np.float64))
+    inside = (q > 0) & (q < 1)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore', under='ignore'):
+        q_inside = np.where(inside, q, 0.5)
+        lower = q_inside < 0.5
+        target = np.where(lower, np.log(q_inside), np.log1p(-q_inside))
+
+        cube = 1 - 1 / (9 * k) + ndtri(q_inside) / (3 * np.sqrt(k))
+        # P(k, z) is close to z^k / gamma(k + 1) near 0
+        log_z = np.where(cube > 0.1, np.log(k) + 3 * np.log(cube),
+                         (np.log(q_inside) + gammaln(k + 1)) / k)
+
+        active = inside.copy()
+        for _ in range(GAMMAINCINV_ITERATIONS):
+            z = np.exp(log_z)
+            side = np.where(lower, gammainc(k, z), gammaincc(k, z))
+            # d log P / d log z = z * pdf / P, and minus that for Q
+            slope = np.exp(log_z + log_poisson_pmf(k - 1, z) - np.log(side))
+            step = (np.log(side) - target) / np.where(lower, slope, -slope)
+            step = np.where(active & np.isfinite(step), step, 0.0)
+            log_z = log_z - step
+            active &= np.abs(step) >= FRACTION_EPSILON * 100
+            if not active.any():
+                break
+        z = np.exp(log_z)
+
+    z = np.where(q == 0, 0.0, np.where(q == 1, np.inf, z))
+    return np.where(inside | (q == 0) | (q == 1), z, np.nan)
@@ -1,8 +1,204 @@
 import math
-import matplotlib.pyplot as plt
-from .Generaldistribution import Distribution
+import numpy as np
+from .Generaldistribution import CHUNK_SIZE, Distribution, RunningStats, _Parameter, _is_array
 from collections import Counter
 
+# Default largest number of distinct values counted by ModeStats, and of
+# bins of its histogram once there are more
+MODE_BINS = 256
+
+
+class ModeStats(RunningStats):
+    """ RunningStats that also keep a frequency table of the values, the
+    sufficient statistics of the triangular distribution.
+
+    The table counts each distinct value, as suits discrete data, until
+    there are more than bins of them. It then becomes a histogram of at most
+    bins bins of equal width, a power of two which doubles as the range of
+    the values grows, so its memory stays bounded however many continuous
+    values stream through it.
+
+    Attributes:
+        frequency (Counter) number of occurrences of each value, or of the
+            values of each bin, keyed by floor(value / width)
+        width (float) width of the bins, 0 while values are counted exactly
+        bins (int) largest number of entries of the table
+    """
+
+    __slots__ = ('frequency', 'width', 'bins')
+
+    def __init__(self, values=(), bins=MODE_BINS):
+
+        if bins < 2:
+            raise ValueError('bins should be at least 2')
+        self.frequency = Counter()
+        self.width = 0.0
+        self.bins = bins
+        RunningStats.__init__(self, values)
+
+    def update(self, values):
+        """Function to add a value, or an array of values, to the statistics.
+
+        Args:
+            values (float or array-like): values to add
+
+        Returns:
+            ModeStats: the updated statistics
+        """
+
+        RunningStats.update(self, values)
+        values = np.asarray(values, dtype=np.float64).ravel()
+        for start in range(0, len(values), CHUNK_SIZE):
+            chunk = values[start:start + CHUNK_SIZE]
+            if not self.width:
+                keys, counts = np.unique(chunk, return_counts=True)
+                if len(keys) + len(self.frequency) <= self.bins or \
+                        len(np.union1d(keys, list(self.frequency))) <= self.bins:
+                    self.frequency.update(dict(zip(keys.tolist(), counts.tolist())))
+                    continue
+                # too many distinct values: the chunk goes straight into
+                # the histogram, without counting its values first
+                width = self._histogram_width(self.bins)
+                self.frequency = self._binned(width)
+                self.width = width
+            self._fit_bins()
+            keys, counts = np.unique(np.floor(chunk / self.width).astype(np.int64), return_counts=True)
+            self.frequency.update(dict(zip(keys.tolist(), counts.tolist())))
+        return self
+
+    def merge(self, other):
+        """Function to add the statistics of another stream of numbers.
+
+        Args:
+            other (ModeStats): statistics to add
+
+        Returns:
+            ModeStats: the updated statistics
+        """
+
+        RunningStats.merge(self, other)
+        width = max(self.width, other.width)
+        if width:
+            if self.width != width:
+                self.frequency = self._binned(width)
+                self.width = width
+            self._fit_bins()
+            self.frequency.update(other._binned(self.width))
+        else:
+            self.frequency.update(other.frequency)
+        self._bound_size()
+        return self
+
+    def _binned(self, width):
+        # frequency table with bins of the given width, a multiple of the
+        # current one
+        if self.width == width:
+            return Counter(self.frequency)
+        frequency = Counter()
+        if self.width:
+            ratio = int(width / self.width)
+            for index, count in self.frequency.items():
+                frequency[index // ratio] += count
+        else:
+            for value, count in self.frequency.items():
+                frequency[math.floor(value / width)] += count
+        return frequency
+
+    def _fit_bins(self):
+        # double the width until the range of the values spans at most
+        # bins bins
+        width = self._widen(self.width, self.bins)
+        if width != self.width:
+            self.frequency = self._binned(width)
+            self.width = width
+
+    def _widen(self, width, bins):
+        # smallest power of two multiple of width for which the range of
+        # the values spans at most bins bins
+        while math.floor(self.maximum / width) - math.floor(self.minimum / width) >= bins:
+            width *= 2
+        return width
+
+    def _histogram_width(self, bins):
+        # power of two width of a histogram of the values in bins bins
+        width = 2.0 ** math.ceil(math.log2((self.maximum - self.minimum) / bins))
+        return self._widen(width, bins)
+
+    def _bound_size(self):
+        if not self.width and len(self.frequency) > self.bins:
+            width = self._histogram_width(self.bins)
+            self.frequency = self._binned(width)
+            self.width = width
+
+    def mode(self):
+        """Function to find the mode of the values: the single most
+        frequent value while they are counted exactly, or else the peak of
+        the parabola through the highest bin of the histogram and its two
+        neighbours.
+
+        When several values are the most frequent, as in a small sample of
+        continuous data where each value occurs once, the mode is found
+        from a histogram of about sqrt(count) bins, at most bins.
+
+        Args:
+            None
+
+        Returns:
+            float: the mode
+        """
+
+        if self.width:
+            return self._peak(self.frequency, self.width)
+
+        frequency = self.frequency
+        max_frequency = max(list(frequency.values()))
+
+        # Create list of modes from data
+        mode = [k for k, v in frequency.items() if v == max_frequency]
+
+        if len(mode) == 1:
+            return mode[0]
+        width = self._histogram_width(min(self.bins, max(2, int(math.sqrt(self.count)))))
+        return self._peak(self._binned(width), width)
+
+    def _peak(self, frequency, width):
+        # ties are broken by the counts of the neighbouring bins
+        def height(i):
+            return frequency[i], frequency[i - 1] + frequency[i + 1]
+
+        highest = max(height(i) for i in frequency)
+        peaks = [i for i in frequency if height(i) == highest]
+        if len(peaks) > 1:
+            # Multiple modes
+            mode = [(i + 0.5) * width for i in sorted(peaks)]
+            msg = f"""Multiple modes found: {str(mode)}, Triangular Distribution requires single mode"""
+            raise TriangularValueException(msg)
+
+        index = peaks[0]
+        below, count, above = frequency[index - 1], frequency[index], frequency[index + 1]
+        curvature = 2 * count - below - above
+        offset = 0.5 + 0.5 * (above - below) / curvature if curvature else 0.5
+        return min(max((index + offset) * width, self.minimum), self.maximum)
+
+    def to_dict(self):
+        values = RunningStats.to_dict(self)
+        values['frequency'] = [[key, count] for key, count in self.frequency.items()]
+        values['width'] = self.width
+        values['bins'] = self.bins
+        return values
+
+    to_dict.__doc__ = RunningStats.to_dict.__doc__
+
+    @classmethod
+    def from_dict(cls, values):
+        values = dict(values)
+        frequency = values.pop('frequency', ())
+        stats = super().from_dict(values)
+        stats.frequency = Counter({key: count for key, count in frequency})
+        return stats
+
+    from_dict.__func__.__doc__ = RunningStats.from_dict.__doc__
+
 
 class Triangular(Distribution):
     """
@@ -22,6 +218,14 @@ class Triangular(Distribution):
 
     """
 
+    __slots__ = ('_a', '_b', '_mode')
+
+    a = _Parameter('a')
+    b = _Parameter('b')
+    mode = _Parameter('mode')
+
+    summary_class = ModeStats
+
     def __init__(self, a=0, b=1, mode=0.5):
         if b < mode < a or a == b:
             raise ValueError
@@ -81,15 +285,28 @@ class Triangular(Distribution):
             float: b, the maximum value
             float: mode, the mode of the dataset
         """
-        if not self.data:
+        return self.replace_stats_with_summary(self.summarize())
+
+    def replace_stats_with_summary(self, summary):
+        """ Method to calculate a, b, mode from the sufficient statistics
+        of a data set, as returned by summarize.
+
+        Args:
+            summary (ModeStats): statistics of the data set
+
+        Returns:
+            float: a, the minimum value
+            float: b, the maximum value
+            float: mode, the mode of the dataset
+        """
+        if not summary.count:
             # Use default values
             min_a, max_b, mode = 0, 1, 0.5
         else:
-            min_a = min(self.data)
-            max_b = max(self.data)
-            mode = self.calculate_mode()
+            min_a, max_b = summary.minimum, summary.maximum
+            mode = summary.mode()
 
-        if min == max or min == mode or max == mode:
+        if min_a == max_b or min_a == mode or max_b == mode:
             raise TriangularValueException()
 
         self.a = min_a
@@ -98,89 +315,206 @@ class Triangular(Distribution):
 
         return self.a, self.b, self.mode
 
-    def calculate_mode(self, round_to=2):
+    def calculate_mode(self, round_to=2, bins=MODE_BINS):
         """
         Calculates the mode of a dataset
-        If no single mode, it will approximate the mode using the mean
+        Discrete data with at most bins distinct values must have a single
+        mode; the mode of other data is estimated from a histogram of at
+        most bins bins, see ModeStats
 
         Args:
             round_to (int): Round the mode value. [Default value: 2]
+            bins (int): Resolution of the estimate. [Default value: MODE_BINS]
 
         Returns:
             float: mode of data
         """
-        frequency_dict = dict(Counter(self.data))
-        max_frequency = max(list(frequency_dict.values()))
+        return round(self.summarize(bins=bins).mode(), round_to)
 
-        # Create list of modes from data
-        mode = [k for k, v in frequency_dict.items() if v == max_frequency]
+    def summarize(self, data=None, bins=MODE_BINS):
+        """
+        Computes the sufficient statistics of a data set, see
+        Distribution.summarize
 
-        if len(mode) == 1:
-            return mode[0]
-        else:
-            # Multiple modes
-            msg = f"""Multiple modes found: {str(mode)}, Triangular Distribution requires single mode"""
-            raise TriangularValueException(msg)
+        Args:
+            data (array-like): data set, or a part of it. [Default value: the data attribute]
+            bins (int): Resolution of the mode estimate. [Default value: MODE_BINS]
+
+        Returns:
+            ModeStats: statistics of the data set
+        """
+        return ModeStats(self.data if data is None else data, bins)
 
     def calculate_pdf(self, x, round_to=2):
         """
         Probability density function calculator for the Triangular distribution.
 
         Args:
-            x (float): point for calculating the probability density function
+            x (float or array-like): point(s) for calculating the probability density function
             round_to (int): Round the pdf value. [Default value: 2]
 
         Returns:
-            float: probability density function
+            float or numpy.ndarray: probability density function
         """
-        # Check equivalence
-        if self.a == self.b or self.a == self.mode or self.b == self.mode:
-            raise TriangularValueException()
+        height, rising, falling = self._constants()
+
+        if _is_array(x):
+            self.pdf = self._pdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.pdf, round_to)
 
         value = 0  # default value for when x < min or x > max
         if self.a <= x < self.mode:
-            value = (2 * (x - self.a)) / (
-                    (self.b - self.a) * (self.mode - self.a))
+            value = (2 * (x - self.a)) / rising
         elif self.mode == x:
-            value = 2 / (self.b - self.a)
+            value = height
         elif self.mode < x <= self.b:
-            value = (2 * (self.b - x)) / (
-                    (self.b - self.a) * (self.b - self.mode))
+            value = (2 * (self.b - x)) / falling
 
         self.pdf = value
         return round(self.pdf, round_to)
 
+    def _pdf(self, x):
+        """
+        Vectorized probability density function, without rounding.
+
+        Args:
+            x (numpy.ndarray): points for calculating the probability density function
+
+        Returns:
+            numpy.ndarray: probability density function
+        """
+        a, b, mode = self.a, self.b, self.mode
+        height, rising_scale, falling_scale = self._constants()
+        rising = (a <= x) & (x < mode)
+        falling = (mode < x) & (x <= b)
+
+        value = np.zeros(x.shape)  # default value for when x < min or x > max
+        value[rising] = (2 * (x[rising] - a)) / rising_scale
+        value[x == mode] = height
+        value[falling] = (2 * (b - x[falling])) / falling_scale
+        return value
+
     def calculate_cdf(self, x, round_to=2):
         """
         Cumulative density function calculator for the Triangular distribution.
 
         Args:
-            x (float): point for calculating the cumulative density function
+            x (float or array-like): point(s) for calculating the cumulative density function
             round_to (int): Round the value. [Default value: 2]
 
         Returns:
-            float: cumulative density function output
+            float or numpy.ndarray: cumulative density function output
         """
-        # Check equivalence
-        if self.a == self.b or self.a == self.mode or self.b == self.mode:
-            raise TriangularValueException()
+        _, rising, falling = self._constants()
+
+        if _is_array(x):
+            self.cdf = self._cdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.cdf, round_to)
 
         if x < self.a:
             value = 0
         elif self.a <= x <= self.mode:
-            num = ((x - self.a) ** 2)
-            den = (self.b - self.a) * (self.mode - self.a)
-            value = num / den
+            value = ((x - self.a) ** 2) / rising
         elif self.mode < x <= self.b:
-            num = ((self.b - x) ** 2)
-            den = (self.b - self.a) * (self.b - self.mode)
-            value = 1 - (num / den)
+            value = 1 - ((self.b - x) ** 2) / falling
         else:
             value = 1
 
         self.cdf = value
         return round(self.cdf, round_to)
 
+    def _cdf(self, x):
+        """
+        Vectorized cumulative density function, without rounding.
+
+        Args:
+            x (numpy.ndarray): points for calculating the cumulative density function
+
+        Returns:
+            numpy.ndarray: cumulative density function output
+        """
+        a, b, mode = self.a, self.b, self.mode
+        _, rising_scale, falling_scale = self._constants()
+        rising = (a <= x) & (x <= mode)
+        falling = (mode < x) & (x <= b)
+
+        value = np.where(x > b, 1.0, 0.0)
+        value[rising] = ((x[rising] - a) ** 2) / rising_scale
+        value[falling] = 1 - ((b - x[falling]) ** 2) / falling_scale
+        return value
+
+    def calculate_ppf(self, q, round_to=2):
+        """
+        Percent point function (inverse of the cdf) calculator for the Triangular distribution.
+
+        Args:
+            q (float or array-like): probability or probabilities for calculating the percent point function
+            round_to (int): Round the value. [Default value: 2]
+
+        Returns:
+            float or numpy.ndarray: point(s) x such that cdf(x) = q, nan where q is outside [0, 1]
+        """
+        ppf = self._ppf(np.asarray(q, dtype=np.float64))
+        if _is_array(q):
+            return np.round(ppf, round_to)
+        return round(float(ppf), round_to)
+
+    def _ppf(self, q):
+        """
+        Vectorized percent point function, without rounding.
+
+        Args:
+            q (numpy.ndarray): probabilities for calculating the percent point function
+
+        Returns:
+            numpy.ndarray: percent point function output
+        """
+        a, b, mode = self.a, self.b, self.mode
+        _, rising, falling = self._constants()
+        # cdf at the mode, where the two branches of the cdf meet
+        peak = (mode - a) / (b - a)
+
+        with np.errstate(invalid='ignore'):
+            value = np.where(q <= peak,
+                             a + np.sqrt(q * rising),
+                             b - np.sqrt((1 - q) * falling))
+            return np.where((q >= 0) & (q <= 1), value, np.nan)
+
+    def _sf(self, x):
+        """
+        Vectorized survival function, without rounding, computed from the
+        falling side of the distribution where it is small.
+        """
+        a, b, mode = self.a, self.b, self.mode
+        _, rising_scale, falling_scale = self._constants()
+        rising = (a <= x) & (x <= mode)
+        falling = (mode < x) & (x <= b)
+
+        value = np.where(x < a, 1.0, 0.0)
+        value[rising] = 1 - ((x[rising] - a) ** 2) / rising_scale
+        value[falling] = ((b - x[falling]) ** 2) / falling_scale
+        return value
+
+    def _calculate_constants(self):
+        """
+        Constants of the pdf and cdf: the height 2 / (b - a) at the mode,
+        and the denominators (b - a) * (mode - a) and (b - a) * (b - mode)
+        of the rising and falling sides. The parameters are checked here,
+        once for each set of parameters.
+        """
+        # Check equivalence
+        if self.a == self.b or self.a == self.mode or self.b == self.mode:
+            raise TriangularValueException()
+
+        width = self.b - self.a
+        return 2 / width, width * (self.mode - self.a), width * (self.b - self.mode)
+
+    def _sample(self, rng, size):
+        """
+        Vectorized random values of the distribution, from a numpy Generator.
+        """
+        return rng.triangular(self.a, self.mode, self.b, size)
+
     def plot_bar_pdf(self):
         """
         Method to plot the pdf of the triangular distribution.
@@ -190,6 +524,8 @@ class Triangular(Distribution):
         Returns:
             None
         """
+        import matplotlib.pyplot as plt
+
         x = [self.a, self.mode, self.b]
 
         peak = 2 / (self.b - self.a)
@@ -1,6 +1,6 @@
 import math
-import matplotlib.pyplot as plt
-from .Generaldistribution import Distribution
+import numpy as np
+from .Generaldistribution import Distribution, _Parameter, _is_array
 
 
 class Uniform(Distribution):
@@ -15,6 +15,11 @@ class Uniform(Distribution):
         high (float) representing the highest number in data_list
     """
 
+    __slots__ = ('_low', '_high')
+
+    low = _Parameter('low')
+    high = _Parameter('high')
+
     def __init__(self, low=0, high=10):
         if low == high:
             raise Exception('Invalid interval -  start and end of interval cannot be the same')
@@ -33,10 +38,25 @@ class Uniform(Distribution):
                     float: the low value
                     float: the high value
                 """
-        self.low = min(self.data)
-        self.high = max(self.data)
-        if self.low == self.high:
+        return self.replace_stats_with_summary(self.summarize())
+
+    def replace_stats_with_summary(self, summary):
+        """Function to calculate low and high from the sufficient statistics
+        of a data set, as returned by summarize.
+
+                Args:
+                    summary (RunningStats): statistics of the data set
+
+                Returns:
+                    float: the low value
+                    float: the high value
+                """
+        if not summary.count:
+            raise ValueError('No data found in summary')
+        if summary.minimum == summary.maximum:
             raise Exception('Invalid interval -  start and end of interval cannot be the same')
+        self.low = summary.minimum
+        self.high = summary.maximum
         self.calculate_mean()
         self.calculate_stdev()
         return self.low, self.high
@@ -76,21 +96,89 @@ class Uniform(Distribution):
         """Cumulative distribution function calculator for the uniform distribution.
 
                 Args:
-                        x (float): point for calculating the
+                        x (float or array-like): point(s) for calculating the
                                    cumulative distribution function
 
                 Returns:
-                        float: cumulative distribution function output
+                        float or numpy.ndarray: cumulative distribution function output
                 """
+        if _is_array(x):
+            self.cdf = self._cdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.cdf, round_to)
         if x < self.low:
             self.cdf = 0
         elif self.low<=x<=self.high:
-            self.cdf = (x - self.low)/(self.high-self.low)
+            width, _ = self._constants()
+            self.cdf = (x - self.low) / width
         else:
             self.cdf = 1
 
         return round(self.cdf, round_to)
 
+    def _cdf(self, x):
+        """Vectorized cumulative distribution function, without rounding.
+
+                Args:
+                        x (numpy.ndarray): points for calculating the
+                                   cumulative distribution function
+
+                Returns:
+                        numpy.ndarray: cumulative distribution function output
+                """
+        width, _ = self._constants()
+        return np.clip((x - self.low) / width, 0, 1)
+
+    def calculate_ppf(self, q, round_to=2):
+        """Percent point function (inverse of the cdf) calculator for the uniform distribution.
+
+                Args:
+                        q (float or array-like): probability or probabilities
+                                   for calculating the percent point function
+                        round_to (int): Round the ppf value. [Default value: 2 floating point]
+
+                Returns:
+                        float or numpy.ndarray: point(s) x such that cdf(x) = q,
+                                   nan where q is outside [0, 1]
+                """
+        ppf = self._ppf(np.asarray(q, dtype=np.float64))
+        if _is_array(q):
+            return np.round(ppf, round_to)
+        return round(float(ppf), round_to)
+
+    def _ppf(self, q):
+        """Vectorized percent point function, without rounding.
+
+                Args:
+                        q (numpy.ndarray): probabilities for calculating the
+                                   percent point function
+
+                Returns:
+                        numpy.ndarray: percent point function output
+                """
+        width, _ = self._constants()
+        with np.errstate(invalid='ignore'):
+            return np.where((q >= 0) & (q <= 1), self.low + q * width, np.nan)
+
+    def _logpdf(self, x):
+        """Vectorized log of the probability density function, without rounding."""
+        width, _ = self._constants()
+        inside = (self.low <= x) & (x <= self.high)
+        return np.where(inside, -math.log(width), -np.inf)
+
+    def _sf(self, x):
+        """Vectorized survival function, without rounding."""
+        width, _ = self._constants()
+        return np.clip((self.high - x) / width, 0, 1)
+
+    def _calculate_constants(self):
+        """Width of the interval, and the density 1 / width inside it."""
+        width = self.high - self.low
+        return width, 1 / width
+
+    def _sample(self, rng, size):
+        """Vectorized random values of the distribution, from a numpy Generator."""
+        return rng.uniform(self.low, self.high, size)
+
     def plot_histogram(self):
         """Function to output a histogram of the instance variable data using
                 matplotlib pyplot library.
@@ -101,6 +189,8 @@ class Uniform(Distribution):
                 Returns:
                         None
                 """
+        import matplotlib.pyplot as plt
+
         plt.hist(self.data)
         plt.title("Histogram of Data")
         plt.xlabel("data")
@@ -111,16 +201,34 @@ class Uniform(Distribution):
         """Probability density function calculator for the uniform distribution.
 
                 Args:
-                        x (float): point for calculating the
+                        x (float or array-like): point(s) for calculating the
                                    probability density function
                         round_to (int): Round the mean value. [Default value: 2 floating point]
 
                 Returns:
-                        float: probability density function output
+                        float or numpy.ndarray: probability density function output
         """
-        self.pdf = 1/(self.high-self.low) if self.high >= x >= self.low else 0
+        if _is_array(x):
+            self.pdf = self._pdf(np.asarray(x, dtype=np.float64))
+            return np.round(self.pdf, round_to)
+        _, density = self._constants()
+        self.pdf = density if self.high >= x >= self.low else 0
         return round(self.pdf, round_to)
 
+    def _pdf(self, x):
+        """Vectorized probability density function, without rounding.
+
+                Args:
+                        x (numpy.ndarray): points for calculating the
+                                   probability density function
+
+                Returns:
+                        numpy.ndarray: probability density function output
+        """
+        _, density = self._constants()
+        inside = (self.low <= x) & (x <= self.high)
+        return np.where(inside, density, 0.0)
+
     def plot_bar_pdf(self):
         """Function to plot the pdf of the uniform distribution
 
@@ -131,6 +239,7 @@ class Uniform(Distribution):
             list: x values for the pdf plot
             list: y values for the pdf plot
         """
+        import matplotlib.pyplot as plt
 
         x = []
         y = []
@@ -1,8 +1,42 @@
-from .Gaussiandistribution import Gaussian
-from .Binomialdistribution import Binomial
-from .Exponentialdistribution import Exponential
-from .Generaldistribution import Distribution
-from .Gammadistribution import Gamma
-from .Bernoullidistribution import Bernoulli
-from .Uniformdistribution import Uniform
-from .Triangulardistribution import Triangular, TriangularValueException
+import importlib
+import sys
+
+# Module of each public name, loaded on first access so that importing
+# probdists stays cheap
+_modules = {
+    'Gaussian': '.Gaussiandistribution',
+    'Binomial': '.Binomialdistribution',
+    'Exponential': '.Exponentialdistribution',
+    'Distribution': '.Generaldistribution',
+    'DataArray': '.Generaldistribution',
+    'ParseReport': '.Generaldistribution',
+    'FrozenDistribution': '.Generaldistribution',
+    'RunningStats': '.Generaldistribution',
+    'Gamma': '.Gammadistribution',
+    'GammaStats': '.Gammadistribution',
+    'Bernoulli': '.Bernoullidistribution',
+    'Uniform': '.Uniformdistribution',
+    'Triangular': '.Triangulardistribution',
+    'TriangularValueException': '.Triangulardistribution',
+    'ModeStats': '.Triangulardistribution',
+}
+
+__all__ = list(_modules)
+
+
+def __getattr__(name):
+    if name not in _modules:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(_modules[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+# Module level __getattr__ is only supported from python 3.7
+if sys.version_info < (3, 7):
+    for _name in __all__:
+        __getattr__(_name)
@@ -20,7 +20,8 @@ setuptools.setup(
     ],
     python_requires='>=3.6',
     install_requires=[
-        'matplotlib'
+        'matplotlib',
+        'numpy'
     ],
     zip_safe=False
 )
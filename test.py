@@ -1,13 +1,39 @@
 import unittest
+import numpy as np
+import bz2
+import gzip
+import json
+import lzma
 import math
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from probdists import Gaussian
 from probdists import Binomial
 from probdists import Exponential
-from probdists import Distribution
-from probdists import Gamma
+from probdists import Distribution, DataArray, FrozenDistribution, ParseReport, RunningStats
+from probdists import Gamma, GammaStats
 from probdists import Bernoulli
 from probdists import Uniform
-from probdists import Triangular, TriangularValueException
+from probdists import Triangular, TriangularValueException, ModeStats
+from probdists.Generaldistribution import _read_text_file, DATA_CACHE_BYTES
+from probdists.Binomialdistribution import TABLE_CACHE_BYTES
+from probdists.Specialfunctions import gammaincc
+
+
+class TestImport(unittest.TestCase):
+    def test_lazy_imports(self):
+        # pandas and matplotlib are only loaded by the methods using them
+        code = ('import sys, probdists; print(sorted(sys.modules.keys() & {"probdists.Gaussiandistribution"})); '
+                'probdists.Gaussian().calculate_cdf(1); '
+                'print("pandas" in sys.modules, "matplotlib.pyplot" in sys.modules)')
+        output = subprocess.run([sys.executable, '-c', code], check=True, stdout=subprocess.PIPE,
+                                cwd=os.path.dirname(os.path.abspath(__file__)), universal_newlines=True).stdout
+        self.assertEqual(output.split('\n')[:2], ['[]', 'False False'],
+                         'import probdists loads modules it does not need')
 
 
 class TestGeneraldistribution(unittest.TestCase):
@@ -30,6 +56,267 @@ class TestGeneraldistribution(unittest.TestCase):
         self.distribution.read_data_file('probdists/numbers.xls')
         self.assertEqual(self.distribution.data, [1, 2, 3, 4, 5, 6, 7, 8, 9], 'Xls file not read properly')
 
+    def test_excel_sheet_column(self):
+        self.distribution.read_data_file('probdists/numbers.xls', header=0,
+                                         sheet_name='Sheet1', column=0)
+        self.assertEqual(self.distribution.data, [2, 3, 4, 5, 6, 7, 8, 9],
+                         'Xls sheet and column not read properly')
+
+    def test_txt_small_blocks(self):
+        self.assertEqual(_read_text_file('probdists/numbers.txt', '\\n', block_size=4).tolist(),
+                         [1, 3, 99, 100, 120, 32, 330, 23, 76, 44, 31],
+                         'Txt file not read properly across blocks')
+        self.assertEqual(_read_text_file('probdists/numbers_semicolon.txt', ';', block_size=3).tolist(),
+                         [1, 2, 2.34, 5.67],
+                         'Txt file with custom separator not read properly across blocks')
+
+    def test_txt_white_spaces(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            file_name = os.path.join(dirname, 'numbers.txt')
+            for text, numbers in [('1\n2\n ', [1, 2]), ('1\n2\n\t', [1, 2]),
+                                  ('1 2 \n3 \t', [1, 2, 3]), ('\n', []), ('  \n', [])]:
+                with open(file_name, 'w') as file:
+                    file.write(text)
+                self.distribution.read_data_file(file_name)
+                self.assertEqual(self.distribution.data, numbers,
+                                 'White spaces read as numbers in {!r}'.format(text))
+                chunks = self.distribution.iter_data_file(file_name, chunk_size=2)
+                self.assertEqual([x for chunk in chunks for x in chunk], numbers,
+                                 'White spaces read as numbers by iter_data_file in {!r}'.format(text))
+                self.assertEqual(_read_text_file(file_name, '\\n', block_size=2).tolist(), numbers,
+                                 'White spaces read as numbers across blocks in {!r}'.format(text))
+
+    def test_txt_invalid_number(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            file_name = os.path.join(dirname, 'numbers.txt')
+            with open(file_name, 'w') as file:
+                file.write('1.5 abc 2\n\n3\n')
+            with self.assertWarns(UserWarning):
+                self.distribution.read_data_file(file_name)
+        self.assertEqual(self.distribution.data, [1.5, 2, 3], 'Invalid numbers not skipped')
+
+    def test_txt_errors(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            file_name = os.path.join(dirname, 'numbers.txt')
+            with open(file_name, 'w') as file:
+                file.write('1;x\n2\n\n3;y;4;z\n')
+
+            report = self.distribution.read_data_file(file_name, ';', errors='collect')
+            self.assertEqual(self.distribution.data, [1, 2, 3, 4], 'Invalid numbers not skipped')
+            self.assertEqual(report.count, 3, 'Invalid numbers not counted')
+            self.assertEqual(report.values, ['x', 'y', 'z'], 'Invalid numbers not collected')
+            self.assertEqual(report.lines, [1, 4, 4], 'Line numbers of invalid numbers incorrect')
+
+            with self.assertRaises(ValueError):
+                self.distribution.read_data_file(file_name, ';', errors='raise')
+
+            report = ParseReport()
+            chunks = list(self.distribution.iter_data_file(file_name, ';', chunk_size=3,
+                                                           errors='collect', report=report))
+            self.assertEqual([x for chunk in chunks for x in chunk], [1, 2, 3, 4],
+                             'Invalid numbers not skipped by iter_data_file')
+            self.assertEqual(report.count, 3, 'Invalid numbers not counted by iter_data_file')
+            self.assertEqual(report.values, ['x', 'y', 'z'], 'Invalid numbers not collected by iter_data_file')
+            self.assertEqual(report.lines, [1, 4, 4], 'Line numbers of invalid numbers incorrect')
+
+            with self.assertRaises(ValueError):
+                list(self.distribution.iter_data_file(file_name, ';', errors='raise'))
+
+    def test_iter_data_file(self):
+        chunks = list(self.distribution.iter_data_file('demo_gaussian_data', chunk_size=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 4, 3], 'Chunks not of the requested size')
+        self.assertEqual([x for chunk in chunks for x in chunk],
+                         [1, 3, 99, 100, 120, 32, 330, 23, 76, 44, 31],
+                         'Chunks not read properly')
+        self.assertEqual(self.distribution.data, [], 'iter_data_file should not fill data')
+
+    def test_data_storage(self):
+        self.distribution.read_data_file('probdists/numbers_space.txt')
+        data = self.distribution.data
+        self.assertIsInstance(data, DataArray, 'data not stored in a DataArray')
+        self.assertEqual(np.asarray(data).dtype, np.float64, 'data not stored as float64')
+
+        data.append(8)
+        self.assertEqual(data[1:3], [2, 3.4], 'DataArray slice not list compatible')
+        self.assertEqual(data, [1, 2, 3.4, 5.6, 7, 8], 'DataArray not list compatible')
+        self.assertNotEqual(data, [1, 2, 3.4, 5.6, 7], 'DataArray not list compatible')
+        self.assertEqual(repr(data), '[1.0, 2.0, 3.4, 5.6, 7.0, 8.0]')
+
+        data[0] = 0
+        del data[-1]
+        data.insert(1, 1)
+        data.extend([9, 10])
+        self.assertEqual(data, [0, 1, 2, 3.4, 5.6, 7, 9, 10], 'DataArray not modified like a list')
+
+        self.assertEqual(data[:2] + [1.5], [0, 1, 1.5], '+ should concatenate like a list')
+        self.assertEqual([-1] + data[:2], [-1, 0, 1], '+ should concatenate like a list')
+        self.assertEqual(data[:2] * 2, [0, 1, 0, 1], '* should repeat like a list')
+        self.assertEqual(2 * data[:1], [0, 0], '* should repeat like a list')
+        data.sort(reverse=True)
+        self.assertEqual(data, [10, 9, 7, 5.6, 3.4, 2, 1, 0], 'DataArray not sorted like a list')
+        data.sort(key=lambda x: abs(x - 5))
+        self.assertEqual(data[:2], [5.6, 3.4], 'DataArray not sorted by key')
+        data += [11]
+        self.assertEqual(data[-1], 11)
+
+        self.distribution.data = [4, 5]
+        self.assertIsInstance(self.distribution.data, DataArray, 'assigned list not converted')
+
+    def test_data_cache(self):
+        Distribution.clear_data_cache()
+        with tempfile.TemporaryDirectory() as dirname:
+            file_name = os.path.join(dirname, 'numbers.txt')
+            with open(file_name, 'w') as file:
+                file.write('1\n2\n3\n')
+
+            first, second = Distribution(), Distribution()
+            first.read_data_file(file_name)
+            second.read_data_file(file_name)
+            info = Distribution.data_cache_info()
+            self.assertEqual((info['hits'], info['misses'], info['entries']), (1, 1, 1), 'Cache not used')
+            self.assertEqual(info['hit_rate'], 0.5, 'Cache hit rate incorrect')
+            self.assertTrue(np.shares_memory(np.asarray(first.data), np.asarray(second.data)),
+                            'Cached data not shared')
+
+            # Modifying shared data copies it first
+            first.data.append(4)
+            self.assertEqual(first.data, [1, 2, 3, 4], 'Cached data not copied on write')
+            self.assertEqual(second.data, [1, 2, 3], 'Cached data modified through another distribution')
+
+            # A modified file is parsed again
+            with open(file_name, 'w') as file:
+                file.write('5\n6\n')
+            second.read_data_file(file_name)
+            self.assertEqual(second.data, [5, 6], 'Modified file not parsed again')
+            self.assertEqual(Distribution.data_cache_info()['misses'], 2, 'Modified file read from cache')
+
+        Distribution.resize_data_cache(0)
+        self.distribution.read_data_file('demo_gaussian_data')
+        self.assertEqual(Distribution.data_cache_info()['entries'], 0, 'Disabled cache still used')
+        Distribution.resize_data_cache(DATA_CACHE_BYTES)
+
+    def test_slots(self):
+        for distribution in [Distribution(), Gaussian(), Binomial(), Exponential(), Gamma(),
+                             Bernoulli(), Uniform(), Triangular()]:
+            self.assertFalse(hasattr(distribution, '__dict__'),
+                             '{} instances should not have a __dict__'.format(type(distribution).__name__))
+
+    def test_compressed(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            csv_name = os.path.join(dirname, 'numbers.csv.gz')
+            with gzip.open(csv_name, 'wt') as file:
+                file.write('1434,1453,1412\n1489,1507\n')
+            self.distribution.read_data_file(csv_name)
+            self.assertEqual(self.distribution.data, [1434.0, 1453.0, 1412.0, 1489.0, 1507.0],
+                             'Gzip compressed CSV file not read properly')
+
+            # Compression found from the magic number when there is no extension
+            bz2_name = os.path.join(dirname, 'numbers.txt')
+            with bz2.open(bz2_name, 'wt') as file:
+                file.write('1 2 3.4\n5.6 7\n')
+            self.distribution.read_data_file(bz2_name)
+            self.assertEqual(self.distribution.data, [1, 2, 3.4, 5.6, 7], 'Bz2 compressed file not read properly')
+
+            xz_name = os.path.join(dirname, 'numbers.xz')
+            with lzma.open(xz_name, 'wt') as file:
+                file.write('1\n2\n3\n')
+            chunks = list(self.distribution.iter_data_file(xz_name, chunk_size=2))
+            self.assertEqual([chunk.tolist() for chunk in chunks], [[1, 2], [3]],
+                             'Xz compressed file not chunked properly')
+
+    def test_read_data_files(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            for i in range(4):
+                with open(os.path.join(dirname, 'shard_{}.txt'.format(i)), 'w') as file:
+                    file.write('{0}\n{0}.5\n'.format(i))
+
+            self.distribution.read_data_files(os.path.join(dirname, 'shard_*.txt'), workers=2)
+            self.assertEqual(self.distribution.data, [0, 0.5, 1, 1.5, 2, 2.5, 3, 3.5],
+                             'Shards not merged in order')
+
+            file_names = [os.path.join(dirname, 'shard_3.txt'), 'demo_gaussian_data']
+            self.distribution.read_data_files(file_names, workers=1)
+            self.assertEqual(self.distribution.data, [3, 3.5, 1, 3, 99, 100, 120, 32, 330, 23, 76, 44, 31],
+                             'Files not merged in the order of the list')
+
+            with self.assertRaises(ValueError):
+                self.distribution.read_data_files(os.path.join(dirname, '*.csv'))
+
+    def test_fit_many(self):
+        rng = np.random.default_rng(4)
+        datasets = ['demo_gamma_data'] + [rng.gamma(2.5, 2, size) for size in (10, 300, 2000, 7)]
+        table = Gamma.fit_many(datasets, workers=2, batch_size=2)
+        self.assertEqual(table.dtype.names, ('count', 'mean', 'stdev', 'k', 'theta'))
+        self.assertEqual(table['count'].tolist(), [11, 10, 300, 2000, 7], 'rows not in the order of the data sets')
+        self.assertTrue(np.array_equal(table, Gamma.fit_many(datasets, workers=1)),
+                        'workers should not change the fit')
+        self.assertEqual(table['k'][3], Gamma.from_summary(GammaStats(datasets[3])).k)
+
+        results = list(Gaussian.iter_fit_many(iter([[1, 2, 3], 'demo_gaussian_data']), workers=2))
+        self.assertEqual(sorted(index for index, _ in results), [0, 1])
+        self.assertEqual(dict(results)[0], (3, 2, 1))
+
+    def test_empty_summary(self):
+        for cls in (Gaussian, Binomial, Exponential, Gamma, Bernoulli, Uniform):
+            with self.assertRaises(ValueError, msg=cls.__name__ + ' fitted to no data'):
+                cls().replace_stats_with_summary(cls().summarize([]))
+
+    def test_binary(self):
+        self.distribution.read_data_file('probdists/numbers.txt')
+        with tempfile.TemporaryDirectory() as dirname:
+            file_name = os.path.join(dirname, 'numbers.npy')
+            self.distribution.save_data_file(file_name)
+
+            binary = Distribution()
+            binary.read_data_file(file_name)
+            self.assertEqual(binary.data.tolist(), self.distribution.data, 'Binary file not read properly')
+            self.assertFalse(np.asarray(binary.data).flags.writeable, 'Binary file should be mapped read-only')
+            self.assertEqual([len(chunk) for chunk in binary.iter_data_file(file_name, chunk_size=5)],
+                             [5, 5, 1], 'Binary file not chunked properly')
+            del binary
+
+            # concurrent writers of the same file each use their own
+            # temporary file
+            writers = [Distribution() for _ in range(8)]
+            for size, writer in enumerate(writers):
+                writer.data = list(range(size * 1000))
+            with ThreadPoolExecutor(8) as executor:
+                list(executor.map(lambda writer: writer.save_data_file(file_name), writers * 4))
+            binary = Distribution()
+            binary.read_data_file(file_name)
+            self.assertIn(binary.data.tolist(), [writer.data for writer in writers], 'Binary file corrupted')
+            self.assertEqual(os.listdir(dirname), ['numbers.npy'], 'temporary files left behind')
+            del binary
+
+        with self.assertRaises(ValueError):
+            self.distribution.save_data_file('numbers.txt')
+
+    def test_running_stats(self):
+        values = np.random.default_rng(3).normal(1e9, 1, 10001)
+        stats = RunningStats()
+        for value in values[:100]:
+            stats.update(value)
+        stats.update(values[100:5000])
+        shard = RunningStats(values[5000:])
+        stats.merge(shard)
+
+        self.assertEqual(stats.count, len(values))
+        self.assertAlmostEqual(stats.mean, np.mean(values), 6)
+        self.assertAlmostEqual(stats.variance() / np.var(values, ddof=1), 1, 7,
+                               'variance should not lose precision far from 0')
+        self.assertAlmostEqual(stats.stdev(sample=False) / np.std(values), 1, 7)
+        self.assertEqual(RunningStats().merge(shard).count, shard.count, 'merge into empty stats')
+        self.assertEqual(pickle.loads(pickle.dumps(shard)).m2, shard.m2, 'stats not pickled properly')
+        exported = json.loads(json.dumps(shard.to_dict()))
+        self.assertEqual(repr(RunningStats.from_dict(exported)), repr(shard), 'stats not exported properly')
+        self.assertEqual((stats.minimum, stats.maximum), (values.min(), values.max()))
+
+        with self.assertRaises(ValueError):
+            RunningStats().variance(sample=False)
+        with self.assertRaises(ValueError):
+            RunningStats([1.0]).variance()
+        self.assertEqual(RunningStats([1.0]).variance(sample=False), 0.0)
+
 
 class TestGaussianClass(unittest.TestCase):
     def setUp(self):
@@ -59,6 +346,41 @@ class TestGaussianClass(unittest.TestCase):
         self.assertEqual(self.gaussian.calculate_stdev(False),
                          88.55, 'population standard deviation incorrect')
 
+    def test_empty_data(self):
+        gaussian = Gaussian()
+        with self.assertRaises(ValueError):
+            gaussian.calculate_mean()
+        with self.assertRaises(ValueError):
+            gaussian.calculate_stdev()
+        gaussian.data = [3.0]
+        with self.assertRaises(ValueError):
+            gaussian.calculate_stdev()
+        self.assertEqual(gaussian.calculate_stdev(sample=False), 0.0)
+
+    def test_binary_data(self):
+        with tempfile.TemporaryDirectory() as dirname:
+            file_name = os.path.join(dirname, 'numbers.npy')
+            self.gaussian.save_data_file(file_name)
+            gaussian = Gaussian()
+            gaussian.read_data_file(file_name)
+            self.assertEqual(gaussian.calculate_stdev(), 92.87, 'stdev of memory-mapped data incorrect')
+            del gaussian
+
+    def test_replace_stats_with_chunks(self):
+        mean, stdev = self.gaussian.replace_stats_with_chunks(
+            self.gaussian.iter_data_file('probdists/numbers.txt', chunk_size=3))
+        self.assertAlmostEqual(mean, 78.0909, 4)
+        self.assertEqual(round(stdev, 2), 92.87)
+
+    def test_replace_stats_with_summary(self):
+        stats = RunningStats()
+        for chunk in self.gaussian.iter_data_file('probdists/numbers.txt', chunk_size=3):
+            stats.update(chunk)
+        mean, stdev = self.gaussian.replace_stats_with_summary(stats)
+        self.assertAlmostEqual(mean, 78.0909, 4)
+        self.assertEqual(round(stdev, 2), 92.87)
+        self.assertEqual(self.gaussian.mean, mean)
+
     def test_cdf(self):
         self.assertEqual(self.gaussian.calculate_cdf(25, 3), 0.500,
                          'calculate_cdf function does not give expected result')
@@ -68,6 +390,96 @@ class TestGaussianClass(unittest.TestCase):
                          'calculate_cdf function after calculating mean and \
                              stdev does not give expected result')
 
+    def test_array_pdf_cdf(self):
+        points = np.linspace(15, 35, 41)
+        pdf = self.gaussian.calculate_pdf(points, 5)
+        cdf = self.gaussian.calculate_cdf(points, round_to=5)
+        self.assertIsInstance(pdf, np.ndarray)
+        np.testing.assert_allclose(pdf, [self.gaussian.calculate_pdf(x, 5) for x in points])
+        np.testing.assert_allclose(cdf, [self.gaussian.calculate_cdf(x, round_to=5) for x in points])
+
+    def test_ppf(self):
+        self.assertEqual(self.gaussian.calculate_ppf(0.975, 4), 28.9199)
+        self.assertEqual(self.gaussian.calculate_ppf(0.5), 25)
+        q = np.concatenate([np.logspace(-300, -1, 50), np.linspace(0.01, 0.99, 99)])
+        np.testing.assert_allclose(self.gaussian._cdf(self.gaussian._ppf(q)), q, rtol=1e-12)
+        self.assertTrue(np.isnan(self.gaussian.calculate_ppf(1.5)))
+
+        # upper tail, where 1 - q is exact for powers of two
+        np.testing.assert_allclose(self.gaussian._ppf([0.999, 0.99999]),
+                                   [25 + 2 * 3.090232306167813, 25 + 2 * 4.264890793922825], rtol=1e-13)
+        tail = 2.0 ** -np.arange(2, 53)
+        np.testing.assert_allclose(self.gaussian._ppf(1 - tail) - 25, 25 - self.gaussian._ppf(tail), rtol=1e-14)
+        np.testing.assert_allclose(self.gaussian.sf(self.gaussian._ppf(1 - tail)), tail, rtol=1e-12)
+
+    def test_log_functions(self):
+        points = np.linspace(15, 35, 41)
+        with np.errstate(divide='ignore'):
+            np.testing.assert_allclose(self.gaussian.logpdf(points), np.log(self.gaussian._pdf(points)))
+            np.testing.assert_allclose(self.gaussian.logcdf(points), np.log(self.gaussian._cdf(points)))
+        np.testing.assert_allclose(self.gaussian.sf(points), 1 - self.gaussian._cdf(points), atol=1e-15)
+        np.testing.assert_allclose(np.exp(self.gaussian.logsf(points)), self.gaussian.sf(points))
+        self.assertAlmostEqual(self.gaussian.loglikelihood(points), np.sum(self.gaussian.logpdf(points)))
+
+        # far in the tails, where the pdf and cdf underflow to 0
+        self.assertAlmostEqual(self.gaussian.logpdf(225), -5000 - math.log(2 * math.sqrt(2 * math.pi)))
+        self.assertAlmostEqual(self.gaussian.logcdf(-175), -5005.524208694205)
+        self.assertAlmostEqual(self.gaussian.logsf(225), -5005.524208694205)
+
+    def test_sample(self):
+        sample = self.gaussian.sample(10 ** 5, seed=1)
+        self.assertEqual(sample.shape, (10 ** 5,), 'sample shape is wrong')
+        self.assertTrue(sample.flags.c_contiguous, 'sample is not contiguous')
+        self.assertTrue(np.array_equal(sample, self.gaussian.sample(10 ** 5, seed=1)),
+                        'same seed should give the same sample')
+        self.assertAlmostEqual(sample.mean(), 25, 1, 'sample mean is wrong')
+        self.assertAlmostEqual(sample.std(), 2, 1, 'sample stdev is wrong')
+
+        chunks = list(self.gaussian.iter_samples(2500, seed=7, chunk_size=1000))
+        self.assertEqual([len(chunk) for chunk in chunks], [1000, 1000, 500],
+                         'samples not chunked properly')
+        seeds = self.gaussian.spawn_seeds(7, 3)
+        self.assertTrue(np.array_equal(chunks[2], self.gaussian.sample(500, seeds[2])),
+                        'chunk should only depend on the seed and its position')
+        self.assertFalse(np.array_equal(chunks[0], chunks[1][:1000]),
+                         'spawned streams should be independent')
+
+    def test_parameter_change(self):
+        self.assertEqual(self.gaussian.calculate_pdf(25, round_to=4), 0.1995)
+        self.gaussian.stdev = 4
+        self.assertEqual(self.gaussian.calculate_pdf(25, round_to=4), 0.0997,
+                         'pdf should follow the new stdev')
+        self.assertEqual(self.gaussian.calculate_cdf(29, round_to=4), 0.8413,
+                         'cdf should follow the new stdev')
+        self.gaussian.mean = 29
+        self.assertEqual(self.gaussian.calculate_cdf(29), 0.5, 'cdf should follow the new mean')
+
+    def test_freeze(self):
+        frozen = self.gaussian.freeze()
+        self.assertIsInstance(frozen, FrozenDistribution)
+        self.assertEqual((frozen.mean, frozen.stdev), (25, 2))
+        self.assertEqual(frozen.pdf(27), self.gaussian._pdf(np.float64(27)), 'frozen pdf should not be rounded')
+        self.assertEqual(frozen.cdf(27), self.gaussian._cdf(np.float64(27)), 'frozen cdf should not be rounded')
+        self.assertAlmostEqual(frozen.ppf(frozen.cdf(27)), 27)
+        self.assertIsNone(self.gaussian.pdf, 'freezing should not evaluate anything')
+
+        with self.assertRaises(AttributeError):
+            frozen.mean = 0
+        with self.assertRaises(AttributeError):
+            frozen.calculate_pdf(27)
+        self.gaussian.mean = 0
+        self.assertEqual(frozen.mean, 25, 'frozen copy should not follow the original')
+
+        points = np.linspace(15, 35, 1001)
+        expected = frozen.cdf(points)
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(frozen.cdf, [points] * 64))
+        for result in results:
+            np.testing.assert_array_equal(result, expected)
+
+        copy = pickle.loads(pickle.dumps(frozen))
+        self.assertEqual(copy.logsf(40), frozen.logsf(40), 'frozen distribution not pickled properly')
+
     def test_pdf(self):
         self.assertEqual(self.gaussian.calculate_pdf(25, 5), 0.19947,
                          'calculate_pdf function does not give expected result')
@@ -113,6 +525,19 @@ class TestBinomialClass(unittest.TestCase):
         self.assertEqual(round(p, 3), .615)
         self.assertEqual(n, 13)
 
+    def test_replace_stats_with_chunks(self):
+        p, n = self.binomial.replace_stats_with_chunks(
+            self.binomial.iter_data_file('probdists/numbers_binomial.txt', chunk_size=5))
+        self.assertEqual(round(p, 3), .615)
+        self.assertEqual(n, 13)
+
+    def test_from_summary(self):
+        data = np.loadtxt('probdists/numbers_binomial.txt')
+        summary = self.binomial.summarize(data[:6]).merge(self.binomial.summarize(data[6:]))
+        binomial = Binomial.from_summary(summary)
+        self.assertEqual(round(binomial.p, 3), .615)
+        self.assertEqual(binomial.n, 13)
+
     def test_pdf(self):
         self.assertEqual(self.binomial.calculate_pdf(5, 5), 0.07465)
         self.assertEqual(self.binomial.calculate_pdf(3, 5), 0.01235)
@@ -129,6 +554,138 @@ class TestBinomialClass(unittest.TestCase):
         self.assertEqual(self.binomial.calculate_cdf(5, 5), 0.07889)
         self.assertEqual(self.binomial.calculate_cdf(3, 5), 0.00561)
 
+    def test_pdf_large_n(self):
+        binomial = Binomial(0.5, 10 ** 6)
+        # sqrt(2 / (pi * n)) at the mode, by Stirling's formula
+        self.assertAlmostEqual(binomial.calculate_pdf(500000, 12),
+                               math.sqrt(2 / (math.pi * 10 ** 6)), places=9)
+        self.assertEqual(binomial.calculate_pdf(-1), 0)
+        self.assertEqual(binomial.calculate_pdf(10 ** 6 + 1), 0)
+
+        pdf = binomial.calculate_pdf(np.arange(10 ** 6 + 1), 20)
+        self.assertAlmostEqual(pdf.sum(), 1, places=12)
+        np.testing.assert_allclose(pdf[499000:501000:100],
+                                   np.exp(binomial._logpdf(np.arange(499000., 501000., 100))),
+                                   rtol=1e-12)
+
+    def test_cdf_large_n(self):
+        binomial = Binomial(0.5, 10 ** 7)
+        # by symmetry P(X <= n / 2) = (1 + P(X = n / 2)) / 2
+        self.assertAlmostEqual(binomial.calculate_cdf(5 * 10 ** 6, 15),
+                               (1 + binomial.calculate_pdf(5 * 10 ** 6, 15)) / 2, places=12)
+        self.assertEqual(binomial.calculate_cdf(-1), 0)
+        self.assertEqual(binomial.calculate_cdf(10 ** 7), 1)
+
+        binomial = Binomial(0.4, 20)
+        np.testing.assert_allclose(binomial.calculate_cdf(np.arange(-1, 19), 14),
+                                   np.cumsum(binomial.calculate_pdf(np.arange(-1, 19), 20)),
+                                   atol=1e-13)
+
+    def test_array_pdf_cdf(self):
+        points = np.arange(0, 21)
+        pdf = self.binomial.calculate_pdf(points, 5)
+        cdf = self.binomial.calculate_cdf(points, round_to=5)
+        self.assertIsInstance(pdf, np.ndarray)
+        np.testing.assert_allclose(pdf, [self.binomial.calculate_pdf(x, 5) for x in points])
+        np.testing.assert_allclose(cdf, [self.binomial.calculate_cdf(x, round_to=5) for x in points])
+
+    def test_ppf(self):
+        q = np.linspace(0, 1, 51)
+        # smallest k whose cdf reaches q, by table and by bisection
+        expected = [min(k for k in range(21) if self.binomial.calculate_cdf(k, round_to=17) >= x)
+                    for x in q]
+        np.testing.assert_array_equal(self.binomial.calculate_ppf(q), expected)
+        np.testing.assert_array_equal(self.binomial.calculate_ppf(q[::5]), expected[::5])
+        self.assertEqual(self.binomial.calculate_ppf(0.5), 8)
+        self.assertEqual(Binomial(0.4, 50).calculate_ppf(1), 50, 'ppf(1) should be n')
+        self.assertEqual(Binomial(0.4, 50, table=True).calculate_ppf(1), 50, 'ppf(1) should be n')
+        np.testing.assert_array_equal(Binomial(0.4, 50).calculate_ppf(np.linspace(0, 1, 60))[[0, -1]], [0, 50])
+
+    def test_log_functions(self):
+        points = np.arange(0, 21)
+        with np.errstate(divide='ignore'):
+            np.testing.assert_allclose(self.binomial.logpdf(points), np.log(self.binomial._pdf(points)))
+            np.testing.assert_allclose(self.binomial.logcdf(points),
+                                       [self.binomial.logcdf(point) for point in points], rtol=1e-10)
+        np.testing.assert_allclose(self.binomial.sf(points), 1 - self.binomial._cdf(points), atol=1e-14)
+        np.testing.assert_allclose(np.exp(self.binomial.logsf(points)), self.binomial.sf(points))
+        self.assertAlmostEqual(self.binomial.loglikelihood(points), np.sum(self.binomial.logpdf(points)))
+
+        # by bisection of the incomplete beta function and from the whole pdf
+        np.testing.assert_allclose(self.binomial.sf(np.arange(-1, 19)),
+                                   self.binomial.sf(np.arange(-1, 30))[:20], rtol=1e-13)
+        self.assertAlmostEqual(self.binomial.logsf(19), 20 * math.log(0.4))
+        self.assertAlmostEqual(Binomial(0.5, 10000).logsf(9000), -3687.0420145585526, places=8)
+
+    def test_sample(self):
+        sample = self.binomial.sample(10 ** 5, seed=1)
+        self.assertTrue(np.array_equal(sample, self.binomial.sample(10 ** 5, seed=1)),
+                        'same seed should give the same sample')
+        self.assertTrue(np.all(sample == np.round(sample)), 'sample should be whole numbers')
+        self.assertAlmostEqual(sample.mean(), 8, 1, 'sample mean is wrong')
+        self.assertAlmostEqual(sample.std(), 2.19, 1, 'sample stdev is wrong')
+
+    def test_parameter_change(self):
+        self.assertEqual(self.binomial.calculate_cdf(8, round_to=4), 0.5956)
+        self.binomial.n = 40
+        self.binomial.p = 0.2
+        self.assertEqual(self.binomial.calculate_cdf(8, round_to=4), 0.5931,
+                         'cdf should follow the new parameters')
+
+        binomial = Binomial(0.3, 1000)
+        for k in [0, 1, 150, 300, 301.5, 999, 1000]:
+            np.testing.assert_allclose(binomial.calculate_pdf(k, round_to=20),
+                                       binomial.calculate_pdf([k], round_to=20), rtol=1e-13)
+            np.testing.assert_allclose(binomial.calculate_cdf(k, round_to=20),
+                                       binomial.calculate_cdf([k], round_to=20), rtol=1e-13)
+
+    def test_table(self):
+        Binomial.clear_table_cache()
+        table = Binomial(0.3, 1000, table=True)
+        direct = Binomial(0.3, 1000)
+        for k in [-1, 0, 150, 300, 300.5, 1000, 1001]:
+            self.assertAlmostEqual(table.calculate_pdf(k, round_to=20), direct.calculate_pdf(k, round_to=20), 15)
+            self.assertAlmostEqual(table.calculate_cdf(k, round_to=20), direct.calculate_cdf(k, round_to=20), 13)
+        np.testing.assert_allclose(table.sf([100, 300, 500]), direct.sf([100, 300, 500]), rtol=1e-12)
+        self.assertEqual(table.calculate_ppf(0.5), direct.calculate_ppf(0.5))
+
+        # NaN points stay NaN, as in the direct path
+        points = np.array([np.nan, 150, 300, np.nan])
+        for function in ('calculate_cdf', 'sf', 'logcdf', 'logsf'):
+            values = getattr(table, function)(points)
+            np.testing.assert_allclose(values, getattr(direct, function)(points), rtol=1e-12,
+                                       err_msg=function + ' of NaN points incorrect')
+            self.assertTrue(np.isnan(values[[0, 3]]).all(), function + ' of NaN should be NaN')
+
+        info = Binomial.table_cache_info()
+        self.assertEqual(info['entries'], 1, 'table should be built once for the parameters')
+        self.assertEqual(info['misses'], 1)
+        Binomial(0.3, 1000, table=True).calculate_pdf(5)
+        self.assertEqual(Binomial.table_cache_info()['entries'], 1, 'table should be shared by instances')
+
+        table.n = 10
+        self.assertAlmostEqual(table.calculate_pdf(3, round_to=20), Binomial(0.3, 10).calculate_pdf(3, round_to=20), 15)
+        self.assertEqual(Binomial.table_cache_info()['entries'], 2)
+
+        Binomial.resize_table_cache(0)
+        self.assertAlmostEqual(table.calculate_cdf(3, round_to=20), Binomial(0.3, 10).calculate_cdf(3, round_to=20), 14)
+        self.assertEqual(Binomial.table_cache_info()['entries'], 0, 'a cache of size 0 keeps nothing')
+
+        # tables larger than the cache are not built on every call
+        Binomial.resize_table_cache(24 * 101 - 1)
+        large = Binomial(0.3, 100, table=True)
+        self.assertEqual(large.calculate_pdf(30, round_to=20), Binomial(0.3, 100).calculate_pdf(30, round_to=20))
+        self.assertEqual(large.calculate_cdf(30, round_to=20), Binomial(0.3, 100).calculate_cdf(30, round_to=20))
+        self.assertEqual(large.calculate_ppf(0.5), 30)
+        self.assertEqual(Binomial.table_cache_info()['misses'], 0, 'tables too large for the cache should not be built')
+        Binomial.resize_table_cache(TABLE_CACHE_BYTES)
+
+        # log of probabilities close to 1 keeps its relative precision
+        near_one = Binomial(0.4, 50, table=True)
+        np.testing.assert_allclose(near_one.logcdf([42, 45, 49]), Binomial(0.4, 50).logcdf([42, 45, 49]), rtol=1e-10)
+        np.testing.assert_allclose(near_one.logsf([1, 4, 8]), Binomial(0.4, 50).logsf([1, 4, 8]), rtol=1e-10)
+        self.assertLess(near_one.logcdf(45), 0, 'logcdf close to 1 should not round to 0')
+
     def test_add(self):
         binomial_one = Binomial(.4, 20)
         binomial_two = Binomial(.4, 60)
@@ -186,6 +743,39 @@ class TestExponentialClass(unittest.TestCase):
         self.assertEqual(self.exponential.calculate_cdf(9.5, 4), 0.907, \
                 'calculate_cdf does not return expected result after calculating mean and stdev')
 
+    def test_array_pdf_cdf(self):
+        points = np.linspace(-1, 10, 23)
+        pdf = self.exponential.calculate_pdf(points, 5)
+        cdf = self.exponential.calculate_cdf(points, round_to=5)
+        self.assertIsInstance(pdf, np.ndarray)
+        np.testing.assert_allclose(pdf, [self.exponential.calculate_pdf(x, 5) for x in points])
+        np.testing.assert_allclose(cdf, [self.exponential.calculate_cdf(x, round_to=5) for x in points])
+
+    def test_ppf(self):
+        self.assertEqual(self.exponential.calculate_ppf(0.5, 4), round(4 * math.log(2), 4))
+        q = np.linspace(0, 0.99, 100)
+        np.testing.assert_allclose(self.exponential._cdf(self.exponential._ppf(q)), q, rtol=1e-12)
+
+
+    def test_log_functions(self):
+        points = np.linspace(0, 10, 21)
+        with np.errstate(divide='ignore'):
+            np.testing.assert_allclose(self.exponential.logpdf(points), np.log(self.exponential._pdf(points)))
+            np.testing.assert_allclose(self.exponential.logcdf(points), np.log(self.exponential._cdf(points)))
+        np.testing.assert_allclose(self.exponential.sf(points), 1 - self.exponential._cdf(points), atol=1e-15)
+        np.testing.assert_allclose(np.exp(self.exponential.logsf(points)), self.exponential.sf(points))
+        self.assertAlmostEqual(self.exponential.loglikelihood(points), np.sum(self.exponential.logpdf(points)))
+
+        self.assertEqual(self.exponential.logsf(1000), -250)
+        self.assertAlmostEqual(self.exponential.logcdf(1e-20), math.log(0.25e-20))
+
+    def test_sample(self):
+        sample = self.exponential.sample((100, 1000), seed=1)
+        self.assertEqual(sample.shape, (100, 1000), 'sample shape is wrong')
+        self.assertTrue(np.array_equal(sample, self.exponential.sample((100, 1000), seed=1)),
+                        'same seed should give the same sample')
+        self.assertAlmostEqual(sample.mean() / 4, 1, 1, 'sample mean is wrong')
+
 class TestUniformClass(unittest.TestCase):
     def setUp(self):
         self.uniform = Uniform(0,10)
@@ -208,6 +798,20 @@ class TestUniformClass(unittest.TestCase):
         self.assertEqual(l, 1)
         self.assertEqual(h, 5)
 
+    def test_replace_stats_with_chunks(self):
+        l, h = self.uniform.replace_stats_with_chunks(
+            self.uniform.iter_data_file('probdists/numbers_uniform.txt', chunk_size=4))
+        self.assertEqual(l, 1)
+        self.assertEqual(h, 5)
+        self.assertEqual(self.uniform.mean, 3)
+
+    def test_from_summary(self):
+        data = np.loadtxt('probdists/numbers_uniform.txt')
+        summary = self.uniform.summarize(data[:7]).merge(self.uniform.summarize(data[7:]))
+        uniform = Uniform.from_summary(summary)
+        self.assertEqual((uniform.low, uniform.high), (1, 5))
+        with self.assertRaises(ValueError):
+            Uniform.from_summary(self.uniform.summarize([]))
 
     def test_meancalculation(self):
         self.uniform.calculate_mean()
@@ -237,6 +841,47 @@ class TestUniformClass(unittest.TestCase):
         self.assertEqual(self.uniform.calculate_cdf(7), 1, 'calculate_cdf function does not give expected result')
         self.assertEqual(self.uniform.calculate_cdf(4), 0.75, 'calculate_cdf function does not give expected result')
 
+    def test_array_pdf_cdf(self):
+        points = np.linspace(-1, 11, 25)
+        pdf = self.uniform.calculate_pdf(points, 5)
+        cdf = self.uniform.calculate_cdf(points, round_to=5)
+        self.assertIsInstance(pdf, np.ndarray)
+        np.testing.assert_allclose(pdf, [self.uniform.calculate_pdf(x, 5) for x in points])
+        np.testing.assert_allclose(cdf, [self.uniform.calculate_cdf(x, round_to=5) for x in points])
+
+    def test_ppf(self):
+        np.testing.assert_array_equal(self.uniform.calculate_ppf([0, 0.25, 1]), [0, 2.5, 10])
+        self.assertTrue(np.isnan(self.uniform.calculate_ppf(-0.5)))
+
+
+    def test_log_functions(self):
+        points = np.linspace(-1, 11, 25)
+        with np.errstate(divide='ignore'):
+            np.testing.assert_allclose(self.uniform.logpdf(points), np.log(self.uniform._pdf(points)))
+            np.testing.assert_allclose(self.uniform.logcdf(points), np.log(self.uniform._cdf(points)))
+        np.testing.assert_allclose(self.uniform.sf(points), 1 - self.uniform._cdf(points), atol=1e-15)
+        np.testing.assert_allclose(np.exp(self.uniform.logsf(points)), self.uniform.sf(points))
+        self.assertAlmostEqual(self.uniform.loglikelihood(points), np.sum(self.uniform.logpdf(points)))
+
+    def test_sample(self):
+        sample = self.uniform.sample(10 ** 5, seed=1)
+        self.assertTrue(np.array_equal(sample, self.uniform.sample(10 ** 5, seed=1)),
+                        'same seed should give the same sample')
+        self.assertTrue(np.all((sample >= 0) & (sample < 10)), 'sample out of range')
+        self.assertAlmostEqual(sample.mean(), 5, 1, 'sample mean is wrong')
+
+    def test_parameter_change(self):
+        uniform = Uniform(1, 5)
+        self.assertEqual(uniform.calculate_pdf(2), 0.25)
+        uniform.high = 3
+        self.assertEqual(uniform.calculate_pdf(2), 0.5, 'pdf should follow the new interval')
+        self.assertEqual(uniform.calculate_cdf(2), 0.5, 'cdf should follow the new interval')
+
+    def test_freeze(self):
+        frozen = Uniform(1, 5).freeze()
+        self.assertEqual((frozen.low, frozen.high), (1, 5))
+        self.assertAlmostEqual(frozen.stdev, 4 / math.sqrt(12), 15, 'frozen stdev should not be rounded')
+        np.testing.assert_allclose(frozen.pdf([0, 2, 6]), [0, 0.25, 0])
 
 
 class TestGammaClass(unittest.TestCase):
@@ -257,10 +902,34 @@ class TestGammaClass(unittest.TestCase):
                          'data not read in correctly')
 
     def test_fit(self):
-        self.assertEqual(self.gamma_wdata.k, 2,
-                         'approximate fit found incorrectly')
+        self.assertEqual(round(self.gamma_wdata.k, 2), 2.2,
+                         'maximum likelihood fit found incorrectly')
         self.assertEqual(round(self.gamma_wdata.theta, 2),
-                         2.37, 'approximate fit found incorrectly')
+                         2.32, 'maximum likelihood fit found incorrectly')
+
+    def test_replace_stats_with_chunks(self):
+        k, theta = self.gamma.replace_stats_with_chunks(
+            self.gamma.iter_data_file('probdists/numbers_gamma.txt', chunk_size=2))
+        self.assertEqual(round(k, 2), 2.2, 'maximum likelihood fit found incorrectly')
+        self.assertEqual(round(theta, 2), 2.32, 'maximum likelihood fit found incorrectly')
+
+    def test_from_summary(self):
+        data = np.loadtxt('probdists/numbers_gamma.txt')
+        summaries = [self.gamma.summarize(part) for part in np.array_split(data, 3)]
+        summary = summaries[2].merge(summaries[0]).merge(summaries[1])
+        gamma = Gamma.from_summary(summary)
+        self.assertEqual(round(gamma.k, 2), 2.2, 'fit from merged summaries incorrect')
+        self.assertEqual(round(gamma.theta, 2), 2.32, 'fit from merged summaries incorrect')
+        exported = GammaStats.from_dict(json.loads(json.dumps(summary.to_dict())))
+        self.assertEqual(Gamma.from_summary(exported).k, gamma.k, 'summary not exported properly')
+
+    def test_fit_non_integer_shape(self):
+        data = Gamma(0.7, 3).sample(200000, seed=5)
+        k, theta = self.gamma.replace_stats_with_chunks([data[:1000], data[1000:]])
+        self.assertAlmostEqual(k, 0.7, 2, 'maximum likelihood k incorrect')
+        self.assertAlmostEqual(theta, 3, 1, 'maximum likelihood theta incorrect')
+        k_moments, _ = self.gamma.replace_stats_with_summary(RunningStats(data))
+        self.assertAlmostEqual(k_moments, 0.7, 1, 'method of moments fallback incorrect')
 
     def test_meancalculation(self):
         self.assertEqual(self.gamma.calculate_mean(), 4,
@@ -281,6 +950,96 @@ class TestGammaClass(unittest.TestCase):
         self.assertEqual(self.gamma.calculate_cdf(4), round(3/math.exp(2), 2),
                          'cdf function does not give expected result')
 
+    def test_non_integer_k(self):
+        # with k = 1/2 and theta = 2, the gamma is the chi-squared with 1
+        # degree of freedom, the square of a standard normal
+        gamma = Gamma(0.5, 2)
+        self.assertAlmostEqual(gamma.calculate_pdf(1, 10),
+                               math.exp(-0.5) / math.sqrt(2 * math.pi), places=10)
+        self.assertAlmostEqual(gamma.calculate_cdf(4, False, 10), math.erf(math.sqrt(2)), places=10)
+        self.assertAlmostEqual(gamma.calculate_cdf(4, True, 16), math.erfc(math.sqrt(2)), places=14)
+        self.assertEqual(gamma.calculate_pdf(-1), 0)
+
+        gamma = Gamma(10 ** 6 + 0.5, 1)
+        # the gamma with a large k approaches a normal distribution
+        self.assertAlmostEqual(gamma.calculate_cdf(gamma.mean + gamma.stdev, False, 4),
+                               0.8413, places=3)
+        self.assertAlmostEqual(gamma.calculate_pdf(gamma.mean, 8),
+                               1 / (gamma.stdev * math.sqrt(2 * math.pi)), places=6)
+
+    def test_large_shape_cdf(self):
+        # near the mean a large k uses Temme's expansion, in constant time
+        gamma = Gamma(10 ** 8, 1)
+        x = gamma.mean + gamma.stdev
+        cdf = gamma.calculate_cdf(x, False, 16)
+        self.assertAlmostEqual(cdf, 0.8413447, places=4)
+        np.testing.assert_allclose(gamma.calculate_cdf(np.array([x]), False, 16), [cdf], rtol=1e-13)
+        self.assertAlmostEqual(float(gamma.logsf(x)), math.log1p(-cdf), places=12)
+
+        # and agrees with the series and continued fraction where it stops
+        for k in (20.5, 300):
+            z = np.array([0.7, 1.3]) * k
+            inside = gammaincc(k, z * np.array([1 + 1e-12, 1 - 1e-12]))
+            outside = gammaincc(k, z * np.array([1 - 1e-12, 1 + 1e-12]))
+            np.testing.assert_allclose(inside, outside, rtol=1e-9)
+
+    def test_array_pdf_cdf(self):
+        points = np.linspace(0, 15, 31)
+        pdf = self.gamma.calculate_pdf(points, 5)
+        cdf = self.gamma.calculate_cdf(points, round_to=5)
+        self.assertIsInstance(pdf, np.ndarray)
+        np.testing.assert_allclose(pdf, [self.gamma.calculate_pdf(x, 5) for x in points])
+        np.testing.assert_allclose(cdf, [self.gamma.calculate_cdf(x, round_to=5) for x in points])
+
+    def test_ppf(self):
+        # the median of the chi-squared with 2 degrees of freedom is 2 log 2
+        self.assertEqual(Gamma(1, 2).calculate_ppf(0.5, 10), round(2 * math.log(2), 10))
+        q = np.concatenate([np.logspace(-50, -1, 20), np.linspace(0.01, 0.99, 99)])
+        for gamma in (self.gamma, Gamma(0.3, 1), Gamma(2.5, 3), Gamma(10 ** 4, 1)):
+            np.testing.assert_allclose(gamma._cdf(gamma._ppf(q), False), q, rtol=1e-10)
+
+    def test_log_functions(self):
+        points = np.linspace(0, 15, 31)
+        with np.errstate(divide='ignore'):
+            np.testing.assert_allclose(self.gamma.logpdf(points), np.log(self.gamma._pdf(points)))
+            np.testing.assert_allclose(self.gamma.logcdf(points), np.log(self.gamma._cdf(points, False)))
+        np.testing.assert_allclose(self.gamma.sf(points), 1 - self.gamma._cdf(points, False), atol=1e-15)
+        np.testing.assert_allclose(np.exp(self.gamma.logsf(points)), self.gamma.sf(points))
+        self.assertAlmostEqual(self.gamma.loglikelihood(points), np.sum(self.gamma.logpdf(points)))
+
+        self.assertAlmostEqual(self.gamma.logsf(2000), -1000 + math.log(1001))
+
+    def test_sample(self):
+        gamma = Gamma(2.5, 2)
+        sample = gamma.sample(10 ** 5, seed=1)
+        self.assertTrue(np.array_equal(sample, gamma.sample(10 ** 5, seed=1)),
+                        'same seed should give the same sample')
+        self.assertAlmostEqual(sample.mean() / 5, 1, 1, 'sample mean is wrong')
+        self.assertAlmostEqual(sample.var() / 10, 1, 1, 'sample variance is wrong')
+
+    def test_parameter_change(self):
+        gamma = Gamma(2.5, 2)
+        self.assertEqual(gamma.calculate_pdf(3, round_to=4), 0.1542)
+        gamma.k = 0.5
+        gamma.theta = 1
+        self.assertEqual(gamma.calculate_pdf(3, round_to=4), 0.0162,
+                         'pdf should follow the new parameters')
+
+        for k in [0.5, 1, 2.5, 1e4]:
+            gamma.k = k
+            for x in [1e-3, 0.5, 2, k, k + 3 * math.sqrt(k)]:
+                np.testing.assert_allclose(gamma.calculate_pdf(x, round_to=20),
+                                           gamma.calculate_pdf([x], round_to=20), rtol=1e-13)
+                np.testing.assert_allclose(gamma.calculate_cdf(x, is_upper=False, round_to=20),
+                                           gamma.calculate_cdf([x], is_upper=False, round_to=20), rtol=1e-13)
+
+    def test_freeze(self):
+        frozen = Gamma(2.5, 2).freeze()
+        self.assertEqual(frozen.k, 2.5)
+        self.assertAlmostEqual(frozen.cdf(4) + frozen.sf(4), 1)
+        self.assertAlmostEqual(frozen.cdf(4), Gamma(2.5, 2).calculate_cdf(4, is_upper=False, round_to=10))
+        self.assertEqual(frozen.cdf(-1), 0, 'frozen cdf is the lower cdf, 0 below the support')
+
     def test_add(self):
         gamma_one = Gamma(2, 2)
         gamma_two = Gamma(2, 2)
@@ -314,6 +1073,10 @@ class TestBernoulliClass(unittest.TestCase):
         p = self.bernoulli.replace_stats_with_data()
         self.assertEqual(round(p, 2), 0.17, 'p value not correct after reading data')
 
+    def test_replace_stats_with_chunks(self):
+        p = self.bernoulli.replace_stats_with_chunks([[1, 0, 0], [0, 0, 0]])
+        self.assertEqual(round(p, 2), 0.17, 'p value not correct after reading chunks')
+
     def test_pdf(self):
         self.assertEqual(self.bernoulli.calculate_pdf(0, 1), 0.7)
         self.assertEqual(self.bernoulli.calculate_pdf(1, 1), 0.3)
@@ -329,6 +1092,38 @@ class TestBernoulliClass(unittest.TestCase):
 
         self.assertEqual(self.bernoulli.calculate_cdf(2, 1), 1.0)
 
+    def test_array_pdf_cdf(self):
+        points = np.array([0, 1])
+        pdf = self.bernoulli.calculate_pdf(points, 5)
+        cdf = self.bernoulli.calculate_cdf(points, round_to=5)
+        self.assertIsInstance(pdf, np.ndarray)
+        np.testing.assert_allclose(pdf, [self.bernoulli.calculate_pdf(x, 5) for x in points])
+        np.testing.assert_allclose(cdf, [self.bernoulli.calculate_cdf(x, round_to=5) for x in points])
+
+    def test_ppf(self):
+        np.testing.assert_array_equal(self.bernoulli.calculate_ppf([0, 0.5, 0.7, 0.71, 1]),
+                                      [0, 0, 0, 1, 1])
+
+    def test_log_functions(self):
+        points = np.array([0, 1])
+        with np.errstate(divide='ignore'):
+            np.testing.assert_allclose(self.bernoulli.logpdf(points), np.log(self.bernoulli._pdf(points)))
+            outside = np.array([-1, 0.5, 2])
+            np.testing.assert_array_equal(self.bernoulli.calculate_pdf(outside), [0, 0, 0])
+            np.testing.assert_array_equal(self.bernoulli.logpdf(outside), np.log(self.bernoulli._pdf(outside)))
+            np.testing.assert_allclose(self.bernoulli.logcdf(points), np.log(self.bernoulli._cdf(points)))
+        np.testing.assert_allclose(self.bernoulli.sf(points), 1 - self.bernoulli._cdf(points), atol=1e-15)
+        np.testing.assert_allclose(np.exp(self.bernoulli.logsf(points)), self.bernoulli.sf(points))
+        self.assertAlmostEqual(self.bernoulli.loglikelihood(points), np.sum(self.bernoulli.logpdf(points)))
+
+    def test_sample(self):
+        sample = self.bernoulli.sample(10 ** 5, seed=1)
+        self.assertEqual(sample.dtype, np.float64, 'sample should be float')
+        self.assertTrue(np.array_equal(sample, self.bernoulli.sample(10 ** 5, seed=1)),
+                        'same seed should give the same sample')
+        self.assertEqual(set(np.unique(sample)), {0.0, 1.0}, 'sample should be 0 or 1')
+        self.assertAlmostEqual(sample.mean(), 0.3, 2, 'sample mean is wrong')
+
     def test_add(self):
         bernoulli_one = Bernoulli(0.2)
         bernoulli_two = Bernoulli(0.2)
@@ -369,17 +1164,63 @@ class TestTriangularClass(unittest.TestCase):
         self.assertEqual(b, 12, 'b (max) value incorrect after reading data')
         self.assertEqual(mode, 7, 'mode value incorrect after reading data')
 
+    def test_replace_stats_with_chunks(self):
+        [a, b, mode] = self.triangle.replace_stats_with_chunks(
+            self.triangle.iter_data_file('probdists/numbers_triangular.txt', chunk_size=7))
+        self.assertEqual(a, 2, 'a (min) value incorrect after reading chunks')
+        self.assertEqual(b, 12, 'b (max) value incorrect after reading chunks')
+        self.assertEqual(mode, 7, 'mode value incorrect after reading chunks')
+
+    def test_from_summary(self):
+        data = np.loadtxt('probdists/numbers_triangular.txt')
+        summary = self.triangle.summarize(data[:5]).merge(self.triangle.summarize(data[5:]))
+        summary = type(summary).from_dict(json.loads(json.dumps(summary.to_dict())))
+        triangle = Triangular.from_summary(summary)
+        self.assertEqual((triangle.a, triangle.b, triangle.mode), (2, 12, 7),
+                         'fit from exported summary incorrect')
+
     def test_calculate_mode(self):
         self.triangle.data = [0, 1, 1, 2]
         self.assertEqual(self.triangle.calculate_mode(), 1)
 
+        # tied values are resolved by a histogram, unless its bins tie too
         self.triangle.data = [0, 1, 2, 2, 1]
+        self.assertEqual(self.triangle.calculate_mode(), 1.5)
+        self.triangle.data = [0, 0, 1, 1]
         with self.assertRaises(TriangularValueException):
             self.triangle.calculate_mode()
 
+        # small samples of continuous data, where each value occurs once
+        for size in (50, 256):
+            self.triangle.data = Triangular(2, 10, 4.5).sample(size, seed=size)
+            a, b, mode = self.triangle.replace_stats_with_data()
+            self.assertTrue(a < mode < b, 'mode of a small continuous sample not estimated')
+
         self.triangle.read_data_file('probdists/numbers_triangular.txt')
         self.assertEqual(self.triangle.calculate_mode(), 7)
 
+    def test_mode_of_continuous_data(self):
+        data = Triangular(2, 10, 4.5).sample(10 ** 6, seed=3)
+        a, b, mode = self.triangle.replace_stats_with_chunks(np.array_split(data, 7))
+        self.assertAlmostEqual(mode, 4.5, 1, 'mode of continuous data incorrect')
+        self.triangle.data = data[:1000]
+        self.assertAlmostEqual(self.triangle.calculate_mode(bins=16), 4.5, 0)
+
+        summary = self.triangle.summarize(data[:500000], bins=64)
+        summary.merge(self.triangle.summarize(data[500000:]))
+        self.assertLessEqual(len(summary.frequency), 64, 'histogram should stay bounded')
+        exported = ModeStats.from_dict(json.loads(json.dumps(summary.to_dict())))
+        self.assertEqual(exported.mode(), summary.mode(), 'histogram not exported properly')
+
+        # chunks of repeated discrete values stay counted exactly, while
+        # continuous chunks go straight into the histogram
+        discrete = ModeStats(np.arange(200.0), bins=256).update(np.arange(100.0, 250.0))
+        self.assertEqual((discrete.width, len(discrete.frequency)), (0.0, 250))
+        continuous = ModeStats(np.arange(200.0), bins=256).update(data[:10000])
+        self.assertGreater(continuous.width, 0.0)
+        self.assertLessEqual(len(continuous.frequency), 256, 'histogram should stay bounded')
+        self.assertEqual(sum(continuous.frequency.values()), 10200, 'values lost by the histogram')
+
     def test_pdf(self):
         self.assertEqual(self.triangle.calculate_pdf(0, 1), 0.0)
         self.assertEqual(self.triangle.calculate_pdf(0.5, 1), 2)
@@ -406,6 +1247,54 @@ class TestTriangularClass(unittest.TestCase):
         self.assertEqual(self.triangle.calculate_cdf(9), 0.82)
         self.assertEqual(self.triangle.calculate_cdf(12), 1)
 
+    def test_array_pdf_cdf(self):
+        points = np.linspace(-0.5, 1.5, 41)
+        pdf = self.triangle.calculate_pdf(points, 5)
+        cdf = self.triangle.calculate_cdf(points, round_to=5)
+        self.assertIsInstance(pdf, np.ndarray)
+        np.testing.assert_allclose(pdf, [self.triangle.calculate_pdf(x, 5) for x in points])
+        np.testing.assert_allclose(cdf, [self.triangle.calculate_cdf(x, round_to=5) for x in points])
+
+    def test_ppf(self):
+        self.assertEqual(self.triangle.calculate_ppf(0.5), 0.5)
+        q = np.linspace(0, 1, 101)
+        np.testing.assert_allclose(self.triangle._cdf(self.triangle._ppf(q)), q, atol=1e-15)
+
+    def test_log_functions(self):
+        points = np.linspace(-0.5, 1.5, 41)
+        with np.errstate(divide='ignore'):
+            np.testing.assert_allclose(self.triangle.logpdf(points), np.log(self.triangle._pdf(points)))
+            np.testing.assert_allclose(self.triangle.logcdf(points), np.log(self.triangle._cdf(points)))
+        np.testing.assert_allclose(self.triangle.sf(points), 1 - self.triangle._cdf(points), atol=1e-15)
+        np.testing.assert_allclose(np.exp(self.triangle.logsf(points)), self.triangle.sf(points))
+        self.assertAlmostEqual(self.triangle.loglikelihood(points), np.sum(self.triangle.logpdf(points)))
+
+    def test_sample(self):
+        sample = self.triangle.sample(10 ** 5, seed=1)
+        self.assertTrue(np.array_equal(sample, self.triangle.sample(10 ** 5, seed=1)),
+                        'same seed should give the same sample')
+        self.assertTrue(np.all((sample >= self.triangle.a) & (sample <= self.triangle.b)),
+                        'sample out of range')
+        self.assertAlmostEqual(sample.mean(), self.triangle.mean, 1, 'sample mean is wrong')
+
+    def test_parameter_change(self):
+        triangle = Triangular(1, 10, 4)
+        self.assertEqual(triangle.calculate_pdf(4, round_to=4), 0.2222)
+        triangle.b = 7
+        self.assertEqual(triangle.calculate_pdf(4, round_to=4), 0.3333,
+                         'pdf should follow the new parameters')
+        triangle.mode = 7
+        with self.assertRaises(TriangularValueException):
+            triangle.calculate_cdf(5)
+
+    def test_freeze(self):
+        frozen = Triangular(1, 10, 4).freeze()
+        self.assertEqual((frozen.a, frozen.b, frozen.mode), (1, 10, 4))
+        self.assertAlmostEqual(frozen.cdf(4), 1 / 3)
+        self.triangle.mode = self.triangle.a
+        with self.assertRaises(TriangularValueException):
+            self.triangle.freeze()
+
 
 if __name__ == '__main__':
     unittest.main()